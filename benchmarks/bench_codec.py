@@ -0,0 +1,100 @@
+"""
+Benchmark JSON codecs on Site.list and User.list shaped payloads
+  python benchmarks/bench_codec.py [--sites 2000] [--users 5000] [--rounds 20]
+"""
+import argparse
+import time
+from f5xc_tops_py_client.codec import available_codecs, JSONCodec
+
+
+def site_list(count: int) -> dict:
+    """Site.list(report_status_fields=...) shaped response"""
+    return {'items': [{
+        'tenant': 'acme-xyz',
+        'namespace': 'system',
+        'name': f'ce-site-{i:05d}',
+        'uid': f'9b3c1f2e-{i:04d}-4c1a-9a33-5a0d1e2f3a4b',
+        'description': 'Customer edge site',
+        'disabled': False,
+        'labels': {'ves.io/siteType': 'ves-io-ce', 'region': f'region-{i % 12}', 'fleet': 'retail'},
+        'annotations': {},
+        'owner_view': None,
+        'metadata': {'name': f'ce-site-{i:05d}', 'namespace': 'system', 'labels': {}, 'description': ''},
+        'get_spec': {
+            'site_type': 'CUSTOMER_EDGE',
+            'site_state': 'ONLINE' if i % 17 else 'UPGRADING',
+            'tunnel_type': 'SITE_TO_SITE_TUNNEL_IPSEC_OR_SSL',
+            'volterra_software_version': 'crt-20240329-2728',
+            'operating_system_version': '9.2024.6',
+            'coordinates': {'latitude': 37.77 + i / 1e4, 'longitude': -122.41 - i / 1e4},
+            'connected_re': [{'tenant': 'ves-io', 'namespace': 'system', 'name': f're-{j}'} for j in range(2)],
+            'main_nodes': [{'name': f'node-{j}', 'slo_address': f'10.{i % 250}.{j}.10'} for j in range(3)],
+        },
+        'status_set': [{
+            'conditions': [{
+                'type': kind,
+                'status': 'Success',
+                'reason': '',
+                'last_update_time': '2026-10-01T12:00:00.000000Z',
+                'hostname': f'node-{j}',
+            } for kind in ('Ready', 'Registration', 'Upgrade') for j in range(3)],
+            'object_status': {'status': 'ONLINE', 'software_version': 'crt-20240329-2728'},
+        }],
+    } for i in range(count)]}
+
+
+def user_list(count: int) -> dict:
+    """User.list shaped response"""
+    return {'items': [{
+        'email': f'user{i}@example.com',
+        'name': f'user{i}@example.com',
+        'first_name': f'First{i}',
+        'last_name': f'Last{i}',
+        'namespace': 'system',
+        'tenant': 'acme-xyz',
+        'idm_type': 'SSO',
+        'type': 'USER',
+        'domain_owner': False,
+        'last_login_timestamp': '2026-10-01T12:00:00.000000Z',
+        'group_names': [f'group-{i % 40}', 'all-users'],
+        'namespace_roles': [
+            {'namespace': f'app-{(i + k) % 300}', 'role': 'ves-io-monitor-role'} for k in range(6)
+        ] + [{'namespace': 'system', 'role': 'ves-io-power-developer-role'}],
+        'tenant_type': 'ENTERPRISE',
+        'sync_mode': 'SELF',
+        'disabled': False,
+    } for i in range(count)]}
+
+
+def measure(func, rounds: int) -> float:
+    """Best-of-rounds wall time in seconds"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print one row per codec and payload"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {'Site.list': site_list(args.sites), 'User.list': user_list(args.users)}
+    print(f"{'payload':<10} {'codec':<8} {'size MB':>8} {'loads ms':>9} {'dumps ms':>9} {'loads MB/s':>11}")
+    for label, payload in payloads.items():
+        body = JSONCodec().dumps(payload)
+        size = len(body) / 1e6
+        for name, codec_cls in available_codecs().items():
+            codec = codec_cls()
+            loads = measure(lambda: codec.loads(body), args.rounds) # pylint: disable=cell-var-from-loop
+            dumps = measure(lambda: codec.dumps(payload), args.rounds) # pylint: disable=cell-var-from-loop
+            print(f"{label:<10} {name:<8} {size:>8.2f} {loads * 1e3:>9.1f} {dumps * 1e3:>9.1f} {size / loads:>11.0f}")
+
+
+if __name__ == '__main__':
+    main()
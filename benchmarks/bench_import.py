@@ -0,0 +1,41 @@
+"""
+Benchmark package import time in fresh interpreters
+  python benchmarks/bench_import.py [--rounds 10]
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    'package': 'import f5xc_tops_py_client',
+    'session, ns': 'from f5xc_tops_py_client import session, ns',
+    'all aliases': 'import f5xc_tops_py_client as f; [getattr(f, name) for name in f.__all__]',
+    'uplink': 'import uplink',
+}
+
+
+def measure(statement: str, rounds: int) -> float:
+    """Best-of-rounds wall time in seconds of a fresh interpreter running statement"""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print one row per import statement"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure('pass', args.rounds)
+    print(f"{'import':<12} {'ms':>8}")
+    for label, statement in STATEMENTS.items():
+        print(f"{label:<12} {(measure(statement, args.rounds) - baseline) * 1e3:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Load-test the client against the offline mock XC server
+  python benchmarks/bench_load.py [--items 500] [--item-size 1024] [--latency 0.005] [--rate-429 0.02]
+Reports throughput, p50/p99 latency and peak memory for list, fan-out
+and bulk-write workloads. The server runs in a child process so it does
+not compete with the client for the GIL.
+"""
+import argparse
+import multiprocessing
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from f5xc_tops_py_client import session, user, http_loadbalancer, fan_out, bulk
+from f5xc_tops_py_client.mock_server import MockServer
+from f5xc_tops_py_client.ratelimit import TokenBucket
+from f5xc_tops_py_client.retry import RetryPolicy
+
+
+def serve(conn, options: dict):
+    """Child process running a MockServer until told to stop, answering 'stats'"""
+    with MockServer(**options) as server:
+        conn.send(server.url)
+        while conn.recv() == 'stats':
+            conn.send((sum(server.requests.values()), dict(server.statuses)))
+
+
+def percentile(samples: list, share: float) -> float:
+    """Sample below which share of samples fall"""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=100, method='inclusive')[min(98, int(share * 100) - 1)]
+
+
+def timed(call):
+    """call wrapped to append its duration to the returned list"""
+    durations = []
+    def run(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            durations.append(time.perf_counter() - start)
+    return run, durations
+
+
+def workloads(api, args) -> dict:
+    """Workloads by name, each a function running once and returning its op durations"""
+    def list_users():
+        call, durations = timed(user(api).list)
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(lambda _: call(), range(args.calls)))
+        return durations
+
+    def fan_out_lbs():
+        durations = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            list(fan_out(api, http_loadbalancer, max_workers=args.workers))
+            durations.append(time.perf_counter() - start)
+        return durations
+
+    def bulk_create():
+        created = user(api)
+        call, durations = timed(created.create)
+        payloads = [user.create_payload(f"bench{i}-{time.monotonic_ns()}@example.com", 'Bench', str(i)) for i in range(args.writes)] # pylint: disable=line-too-long
+        bulk(call, payloads, max_workers=args.workers)
+        return durations
+
+    return {'list': list_users, 'fan-out': fan_out_lbs, 'bulk-write': bulk_create}
+
+
+def main():
+    """Run every workload and print one row each"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=500, help='objects per collection')
+    parser.add_argument('--item-size', type=int, default=1024, help='bytes per object')
+    parser.add_argument('--namespaces', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.005, help='server seconds per response')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--rate-503', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=0)
+    parser.add_argument('--calls', type=int, default=200, help='list calls')
+    parser.add_argument('--rounds', type=int, default=10, help='fan-out rounds')
+    parser.add_argument('--writes', type=int, default=500, help='bulk-write creates')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--codec', default=None)
+    args = parser.parse_args()
+
+    conn, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=serve, args=(child, {
+        'items': args.items, 'item_size': args.item_size, 'namespaces': args.namespaces,
+        'latency': args.latency, 'jitter': args.jitter, 'rate_429': args.rate_429,
+        'rate_503': args.rate_503, 'retry_after': args.retry_after,
+    }), daemon=True)
+    server.start()
+    url = conn.recv()
+    api = session(
+        tenant_url=url, api_token=MockServer().token, pool_maxsize=args.workers, codec=args.codec,
+        limiter=TokenBucket(rate=1e6, burst=10**6, min_rate=100), retry=RetryPolicy(jitter=0.1)
+    )
+
+    print(f"{'workload':<12} {'ops':>6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'peak MiB':>9} {'errors':>7}")
+    for name, run in workloads(api, args).items():
+        conn.send('stats')
+        before, previous = conn.recv()
+        start = time.perf_counter()
+        durations = run()
+        elapsed = time.perf_counter() - start
+        conn.send('stats')
+        after, statuses = conn.recv()
+        errors = sum(count - previous.get(status, 0) for status, count in statuses.items() if status >= 400) # pylint: disable=line-too-long
+        tracemalloc.start()
+        run_once = workloads(api, argparse.Namespace(**dict(vars(args), calls=1, rounds=1, writes=args.workers)))[name]
+        run_once()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        durations = sorted(durations)
+        print(f"{name:<12} {len(durations):>6} {(after - before) / elapsed:>9.0f} {percentile(durations, 0.5) * 1e3:>9.2f} {percentile(durations, 0.99) * 1e3:>9.2f} {peak / 2**20:>9.2f} {errors:>7}") # pylint: disable=line-too-long
+    conn.send('stop')
+    server.join()
+
+
+if __name__ == '__main__':
+    main()
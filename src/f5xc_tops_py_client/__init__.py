@@ -1,16 +1,90 @@
-"""Package level imports""" # pylint: disable=invalid-name
-from .session import Session as session
-from .ns import NS as ns
-from .cred import APIcred as apicred
-from .cred import SVCcred as svccred
-from .user import User as user
-from .namespace_role import NSrole as nsrole
-from .group import Group as group
-from .role import Role as role
-from .tenant import Tenant as tenant
-from .registration import Registration as registration
-from .xcsite import Site as site
-from .cert import Cert as cert
-from .origin_pool import OriginPool as origin_pool
-from .load_balancer import HTTPLoadBalancer as http_loadbalancer
-from .load_balancer import TCPLoadBalancer as tcp_loadbalancer
+"""
+Package level imports, loaded on first access
+  from f5xc_tops_py_client import session, ns   # imports only session and ns
+""" # pylint: disable=invalid-name
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+_exports = {
+    'session': ('.session', 'Session'),
+    'async_session': ('.session', 'AsyncSession'),
+    'ns': ('.ns', 'NS'),
+    'apicred': ('.cred', 'APIcred'),
+    'svccred': ('.cred', 'SVCcred'),
+    'user': ('.user', 'User'),
+    'nsrole': ('.namespace_role', 'NSrole'),
+    'group': ('.group', 'Group'),
+    'role': ('.role', 'Role'),
+    'tenant': ('.tenant', 'Tenant'),
+    'registration': ('.registration', 'Registration'),
+    'site': ('.xcsite', 'Site'),
+    'cert': ('.cert', 'Cert'),
+    'origin_pool': ('.origin_pool', 'OriginPool'),
+    'http_loadbalancer': ('.load_balancer', 'HTTPLoadBalancer'),
+    'tcp_loadbalancer': ('.load_balancer', 'TCPLoadBalancer'),
+    'fan_out': ('.fanout', 'fan_out'),
+    'async_fan_out': ('.fanout', 'async_fan_out'),
+    'bulk': ('.fanout', 'bulk'),
+    'ResponseCache': ('.cache', 'ResponseCache'),
+    'ValidatorStore': ('.cache', 'ValidatorStore'),
+    'reconcile': ('.reconcile', 'reconcile'),
+    'TenantSnapshot': ('.snapshot', 'TenantSnapshot'),
+    'SessionPool': ('.pool', 'SessionPool'),
+    'Identity': ('.identity', 'Identity'),
+    'Metrics': ('.instrument', 'Metrics'),
+    'install_excepthook': ('.helper', 'install_excepthook'),
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _exports[name]
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+    Keeps aliases such as 'user' or 'session' pointing at their class when
+    the submodule of the same name is imported
+    """
+    def __setattr__(self, name, value):
+        if name in _exports and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .session import Session as session, AsyncSession as async_session
+    from .ns import NS as ns
+    from .cred import APIcred as apicred, SVCcred as svccred
+    from .user import User as user
+    from .namespace_role import NSrole as nsrole
+    from .group import Group as group
+    from .role import Role as role
+    from .tenant import Tenant as tenant
+    from .registration import Registration as registration
+    from .xcsite import Site as site
+    from .cert import Cert as cert
+    from .origin_pool import OriginPool as origin_pool
+    from .load_balancer import HTTPLoadBalancer as http_loadbalancer, TCPLoadBalancer as tcp_loadbalancer
+    from .fanout import fan_out, async_fan_out, bulk
+    from .cache import ResponseCache, ValidatorStore
+    from .reconcile import reconcile
+    from .snapshot import TenantSnapshot
+    from .pool import SessionPool
+    from .identity import Identity
+    from .instrument import Metrics
+    from .helper import install_excepthook
@@ -0,0 +1,193 @@
+"""
+Module providing the read-through GET cache and conditional GET
+validators used by a Session
+  api = Session(tenant_url, api_token, cache=ResponseCache(ttl={'roles': 600}))
+  api = Session(tenant_url, api_token, validators=ValidatorStore())
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# call sites whose collection segment differs from the one their list uses
+_ALIASES = {
+    'users': 'user_roles',
+    'registration': 'registrations',
+    'listregistrationsbystate': 'registrations',
+    'site': 'sites',
+}
+_ACTIONS = {'renew', 'revoke'}
+# writes which also change other collections, None for all of them
+_RELATED = {
+    'user_roles': ('user_groups',),
+    'user_groups': ('user_roles',),
+    'namespaces': None,
+}
+
+
+def collection(endpoint: str) -> str:
+    """
+    Resource collection of a call site, e.g. 'roles' for
+    'GET /api/web/custom/namespaces/{namespace}/roles'
+    """
+    parts = [part for part in endpoint.split(' ', 1)[-1].split('/') if part]
+    if 'namespaces' not in parts:
+        return parts[-1] if parts else ''
+    rest = parts[parts.index('namespaces') + 1:]
+    if len(rest) < 2 or rest[0] not in ('{namespace}', 'system'):
+        return 'namespaces'
+    name = rest[1]
+    if name in _ACTIONS and len(rest) > 2:
+        name = rest[2]
+    return _ALIASES.get(name, name)
+
+
+class ResponseCache:
+    """
+    LRU cache of GET response bodies shared by every Consumer on a Session
+    ttl: {collection: seconds} overriding default_ttl, 0 disables caching
+    max_bytes: cap on the cached body bytes, least recently used go first
+    Any other method on a collection (create, replace, delete, role_assign...)
+    invalidates every cached GET of that collection, and of the collections
+    it changes as a side effect (users and groups, or all on namespace deletes).
+    """
+    def __init__(self, ttl: dict = None, default_ttl: float = 60.0, max_bytes: int = 64 * 2 ** 20, clock=time.monotonic): # pylint: disable=line-too-long
+        self.ttl = ttl or {}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+        self._epoch = 0
+        self._generations = {}
+
+    @property
+    def size(self) -> int:
+        """Cached body bytes"""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, resource: str) -> float:
+        """Seconds a response of resource stays fresh"""
+        return self.ttl.get(resource, self.default_ttl)
+
+    def generation(self, resource: str) -> tuple:
+        """Invalidation counters of resource, taken before a GET is sent"""
+        with self._lock:
+            return self._epoch, self._generations.get(resource, 0)
+
+    def get(self, key):
+        """Cached CachedResponse for key, None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= self._clock():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, resource: str, response, generation: tuple) -> None:
+        """
+        Store a 2xx response to key
+        Dropped when resource was invalidated since generation was taken
+        """
+        ttl = self.ttl_for(resource)
+        content = response.content
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        entry = CachedResponse(resource, response, self._clock() + ttl)
+        with self._lock:
+            if (self._epoch, self._generations.get(resource, 0)) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, resource: str = None) -> None:
+        """Drop cached responses of resource and related ones, or everything when None"""
+        related = _RELATED.get(resource, ())
+        resources = None if resource is None or related is None else (resource,) + related
+        with self._lock:
+            if resources is None:
+                self._epoch += 1
+                self._entries.clear()
+                self._size = 0
+                return
+            for name in resources:
+                self._generations[name] = self._generations.get(name, 0) + 1
+            for key in [key for key, entry in self._entries.items() if entry.resource in resources]:
+                self._remove(key)
+
+    def _remove(self, key) -> None:
+        """Remove one entry, lock must be held"""
+        self._size -= len(self._entries.pop(key).content)
+
+
+class CachedResponse:
+    """Cached response body that quacks like a requests.Response"""
+    status_code = 200
+
+    def __init__(self, resource: str, response, expires: float):
+        self.resource = resource
+        self.content = response.content
+        self.headers = {'Content-Type': response.headers.get('Content-Type', 'application/json')}
+        self.xc_codec = getattr(response, 'xc_codec', None)
+        self.expires = expires
+
+    @property
+    def text(self) -> str:
+        """Body decoded as text"""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        """Body decoded as JSON"""
+        return json.loads(self.content)
+
+
+class ValidatorStore:
+    """
+    ETag / Last-Modified validators of GET responses with their decoded body
+    Shared by every Consumer on a Session to send conditional GETs: on a
+    304 Not Modified the stored object is returned as is, so treat results
+    of revalidated calls as read-only.
+    max_entries: URLs kept, least recently used go first
+    """
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        """(conditional request headers, decoded body) for key, None if unknown"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, headers, data) -> None:
+        """Store the validators of a 2xx response to key with its decoded body"""
+        conditional = {}
+        if headers.get('ETag') is not None:
+            conditional['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified') is not None:
+            conditional['If-Modified-Since'] = headers['Last-Modified']
+        with self._lock:
+            if not conditional:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (conditional, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,5 +1,5 @@
 """Module for Certificate"""
-from uplink import Consumer, Path, Body, json, get, post, put, delete #pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post, put, delete #pylint: disable=unused-import
 from . import helper
 
 
@@ -7,11 +7,15 @@ from . import helper
 class Cert(Consumer):
     """Class for Certificates"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/config/namespaces/{namespace}/certificates')
-    def list(self, namespace: Path):
-        """List all Certificates in an NS"""
+    def list(self, namespace: Path, stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Certificates in an NS
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/config/namespaces/{namespace}/certificates/{name}')
     def get(self, name: Path, namespace: Path):
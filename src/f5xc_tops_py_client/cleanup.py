@@ -0,0 +1,77 @@
+"""
+Module for removing inactive users
+  for r in delete_inactive(api, days=120, allow=['*@example.com'], dry_run=False):
+      print(r.item.email, r.error)
+"""
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatch
+from typing import NamedTuple
+from .tenant import Tenant
+from .user import User
+from .fanout import bulk_iter, ItemResult
+
+
+_UNREADABLE = object()
+
+
+class Inactive(NamedTuple):
+    """User without a login since the threshold, last_login is None when never seen"""
+    email: str
+    last_login: datetime
+    user: dict
+
+
+def inactive_users(session, days: int = 90, allow: list = (), include_never: bool = False, now: datetime = None): # pylint: disable=too-many-arguments,line-too-long
+    """
+    Generator of Inactive users, joining Tenant.last_login() with User.list() on email
+    allow: emails or fnmatch patterns never reported, e.g. '*@example.com'
+    include_never: also report users without any recorded login
+    Users without an email or name, or whose login time can't be read,
+    are skipped: they can't be judged inactive.
+    Both lists are streamed, only the email to login time map is held
+    Tenant.list_inactive_users() is not used, its threshold is fixed at
+    90 days and its users carry no login time.
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=days)
+    last_login = {}
+    for email, value in Tenant(session).last_login(stream=True):
+        try:
+            last_login[email.lower()] = _login_time(value)
+        except (ValueError, TypeError):
+            last_login[email.lower()] = _UNREADABLE
+    for user in User(session).list(stream=True):
+        email = user.get('email') or user.get('name')
+        if not isinstance(email, str):
+            continue
+        if any(fnmatch(email.lower(), pattern.lower()) for pattern in allow):
+            continue
+        login = last_login.get(email.lower())
+        if login is _UNREADABLE or (login is None and not include_never):
+            continue
+        if login is None or login < cutoff:
+            yield Inactive(email, login, user)
+
+
+def delete_inactive(session, days: int = 90, allow: list = (), include_never: bool = False, dry_run: bool = True, max_workers: int = 10): # pylint: disable=too-many-arguments,line-too-long
+    """
+    Delete inactive_users() with the User.delete cascade, at most
+    max_workers at a time, yielding an ItemResult per Inactive user as
+    each delete finishes
+    dry_run (default): yield the users that would be deleted, without deleting
+    """
+    candidates = inactive_users(session, days, allow, include_never)
+    if dry_run:
+        yield from (ItemResult(candidate) for candidate in candidates)
+        return
+    user = User(session)
+    yield from bulk_iter(lambda candidate: user.delete(User.delete_payload(candidate.email)), candidates, max_workers) # pylint: disable=line-too-long
+
+
+def _login_time(value) -> datetime:
+    """Login time of a last_login_map entry, a timestamp or an object holding one"""
+    if isinstance(value, dict):
+        value = next((value[key] for key in ('last_login', 'last_login_timestamp', 'timestamp') if key in value), None) # pylint: disable=line-too-long
+    if not value:
+        return None
+    when = datetime.fromisoformat(value)
+    return when if when.tzinfo is not None else when.replace(tzinfo=timezone.utc)
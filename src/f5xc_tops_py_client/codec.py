@@ -0,0 +1,91 @@
+"""
+Module providing the JSON codec used by a Session for request and
+response bodies. orjson or msgspec are used when installed.
+"""
+import dataclasses
+import json
+from . import helper
+from .models import to_dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class JSONCodec:
+    """Codec backed by the stdlib json module"""
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        """Encode obj to JSON bytes"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+    def loads(self, data):
+        """Decode JSON bytes or str"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson"""
+    name = 'orjson'
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by msgspec"""
+    name = 'msgspec'
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data):
+        return self._decoder.decode(data)
+
+
+def _default(obj):
+    """Encode dataclass payloads, which orjson and msgspec handle natively"""
+    if dataclasses.is_dataclass(obj):
+        return to_dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def available_codecs() -> dict:
+    """Installed codecs by name, fastest first"""
+    codecs = {}
+    if orjson is not None:
+        codecs['orjson'] = OrjsonCodec
+    if msgspec is not None:
+        codecs['msgspec'] = MsgspecCodec
+    codecs['json'] = JSONCodec
+    return codecs
+
+
+def get_codec(codec=None) -> JSONCodec:
+    """
+    Resolve a codec
+    codec: None for the fastest installed, a name from available_codecs(),
+    or any object with dumps() -> bytes and loads()
+    """
+    codecs = available_codecs()
+    if codec is None:
+        return next(iter(codecs.values()))()
+    if isinstance(codec, str):
+        if codec not in codecs:
+            raise helper.TopsXCException(f"JSON codec '{codec}' is not installed")
+        return codecs[codec]()
+    return codec
@@ -1,5 +1,5 @@
 """Module for API Credentials"""
-from uplink import Consumer, Path, Body, json, get, post
+from uplink import Consumer, Path, Context, Body, json, get, post
 from . import helper
 
 
@@ -7,11 +7,15 @@ from . import helper
 class APIcred(Consumer):
     """Class for API Credentials"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/namespaces/{namespace}/api_credentials')
-    def list(self, namespace: Path = 'system'):
-        """List all API Credentials"""
+    def list(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all API Credentials
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/web/namespaces/{namespace}/api_credentials/{name}')
     def get(self, name: Path, namespace: Path = 'system'):
@@ -75,11 +79,15 @@ class APIcred(Consumer):
 class SVCcred(Consumer):
     """Class for Service Credentials"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/namespaces/{namespace}/service_credentials')
-    def list(self, namespace: Path = 'system'):
-        """List all Service Credentials"""
+    def list(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Service Credentials
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @json
     @post('/api/web/namespaces/{namespace}/service_credentials')
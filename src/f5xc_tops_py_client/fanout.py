@@ -0,0 +1,137 @@
+"""
+Module for tenant-wide fan-out of per-namespace calls and bounded bulk calls
+  for r in fan_out(api, HTTPLoadBalancer):
+      print(r.namespace, len(r.items))
+  report = bulk(User(api).create, payloads)
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from typing import NamedTuple
+from .ns import NS
+from . import helper
+
+
+class NSResult(NamedTuple):
+    """Result of one per-namespace call, error is set when the call failed"""
+    namespace: str
+    items: list
+    error: Exception = None
+
+
+class ItemResult(NamedTuple):
+    """Result of one bulk call, error is set when the call failed"""
+    item: object
+    result: object = None
+    error: Exception = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the call succeeded"""
+        return self.error is None
+
+
+class BulkReport(list):
+    """ItemResults of a bulk call, in input order"""
+
+    @property
+    def succeeded(self) -> list:
+        """Results of the calls that succeeded"""
+        return [r for r in self if r.ok]
+
+    @property
+    def failed(self) -> list:
+        """Results of the calls that failed"""
+        return [r for r in self if not r.ok]
+
+
+def list_namespaces(session) -> list:
+    """Names of all namespaces in the tenant"""
+    return [item['name'] for item in NS(session).list()]
+
+
+def fan_out(session, consumer, namespaces: list = None, method: str = 'list', max_workers: int = 10, **kwargs): # pylint: disable=line-too-long
+    """
+    Call consumer(session).<method>(namespace=ns, **kwargs) for each namespace
+    on a bounded thread pool, yielding NSResult as each call finishes
+    namespaces=None fans out over all namespaces in the tenant
+    """
+    if namespaces is None:
+        namespaces = list_namespaces(session)
+    call = getattr(consumer(session), method)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {executor.submit(call, namespace=ns, **kwargs): ns for ns in namespaces}
+        for future in as_completed(futures):
+            yield _result(futures[future], future.result)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def async_fan_out(session, consumer, namespaces: list = None, method: str = 'list', max_workers: int = 10, **kwargs): # pylint: disable=line-too-long
+    """
+    fan_out() for an AsyncSession, yielding NSResult as each call finishes
+    max_workers caps the number of in-flight requests
+    """
+    if namespaces is None:
+        namespaces = [item['name'] for item in await NS(session).list()]
+    call = getattr(consumer(session), method)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def bounded(ns):
+        async with semaphore:
+            try:
+                return NSResult(ns, await call(namespace=ns, **kwargs))
+            except helper.TopsXCException as e:
+                return NSResult(ns, [], e)
+
+    tasks = [asyncio.ensure_future(bounded(ns)) for ns in namespaces]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def bulk(call, items, max_workers: int = 10) -> BulkReport:
+    """
+    call(item) for each item on a bounded thread pool of a Session,
+    all calls drawing from its rate limiter
+    A TopsXCException fails only its own item, see BulkReport
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(item, executor.submit(call, item)) for item in items]
+        return BulkReport(_item_result(item, future.result) for item, future in futures)
+
+
+def bulk_iter(call, items, max_workers: int = 10):
+    """
+    bulk() over a possibly lazy iterable, yielding ItemResult as each call
+    finishes; items are only pulled while fewer than max_workers are in flight
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        for item in items:
+            if len(pending) >= max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _item_result(pending.pop(future), future.result)
+            pending[executor.submit(call, item)] = item
+        for future in as_completed(pending):
+            yield _item_result(pending[future], future.result)
+
+
+def _item_result(item, get_result) -> ItemResult:
+    """Wrap one bulk call outcome as an ItemResult"""
+    try:
+        return ItemResult(item, get_result())
+    except helper.TopsXCException as e:
+        return ItemResult(item, error=e)
+
+
+def _result(namespace: str, get_result) -> NSResult:
+    """Wrap one call outcome as an NSResult"""
+    try:
+        return NSResult(namespace, get_result())
+    except helper.TopsXCException as e:
+        return NSResult(namespace, [], e)
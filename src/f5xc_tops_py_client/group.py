@@ -1,5 +1,5 @@
 """Module for Groups"""
-from uplink import Consumer, Path, Body, json, get, post, put # pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post, put # pylint: disable=unused-import
 from . import helper
 
 
@@ -7,11 +7,15 @@ from . import helper
 class Group(Consumer):
     """Class for Groups"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/custom/namespaces/{namespace}/user_groups')
-    def list(self, namespace: Path = 'system'):
-        """List all Groups"""
+    def list(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Groups
+        model=models.GroupRecord or lazy.LazyGroup returns records or lazy items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/web/namespaces/{namespace}/user_groups/{name}')
     def get(self, name: Path, namespace: Path = 'system'):
@@ -1,7 +1,26 @@
 """Package helpers"""
+import codecs
+import copy
+import json
 import sys
+import threading
+import time
 from datetime import datetime
-from uplink import retry, ratelimit, response_handler, error_handler
+from typing import Any
+from fnmatch import fnmatch
+from uplink import response_handler, error_handler
+from uplink.decorators import MethodAnnotation
+from uplink.clients.io import RequestTemplate, transitions
+from uplink.hooks import TransactionHook
+from .cache import collection
+from . import instrument as _instrument
+from . import models as _models
+from .lazy import LazyObject, plain
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
 
 possible_keys = ['items', 'last_login_map', 'login_events_map', 'users']
 
@@ -9,15 +28,10 @@ def common_decorators(cls):
     """Function to package all uplink decorators for reuse"""
     decorators = [
         #returns.json,
-        ratelimit(calls=50, period=50),
         xc_error_handler,
         xc_response_handler,
         xc_extract_items,
-        retry(
-            when=retry.when.status(503) | retry.when.status(429),
-            stop=retry.stop.after_attempt(5) | retry.stop.after_delay(20),
-            backoff=retry.backoff.jittered(multiplier=2)
-        )
+        xc_endpoint(),
     ]
     for decorator in decorators:
         cls = decorator(cls)
@@ -30,14 +44,228 @@ def tops_handler(exc_type, exc_value, tb, debug: bool = False):
     else:
         print(f"{exc_type.__name__}: {exc_value}")
 
-sys.excepthook = tops_handler
+def install_excepthook(debug: bool = False) -> None:
+    """Function to opt in to tops_handler as sys.excepthook"""
+    sys.excepthook = lambda exc_type, exc_value, tb: tops_handler(exc_type, exc_value, tb, debug)
 
 class TopsXCException(Exception):
     """Class to where all exceptions should rise"""
 
+class SessionHook(TransactionHook):
+    """Hook binding every request of a Consumer to its Session"""
+    def __init__(self, session):
+        self._session = session
+
+    def audit_request(self, consumer, request_builder):
+        request_builder.add_request_template(SessionTemplate(self._session, request_builder))
+
+class SessionTemplate(RequestTemplate):
+    """
+    Per-request template applying the Session rate limiter, concurrency
+    budget, retry policy, circuit breaker, response cache and validators,
+    and reporting each call to the Session instruments
+    """
+    def __init__(self, session, request_builder):
+        self._session = session
+        self._request_builder = request_builder
+        self._reserved = False
+        self._stream = False
+        self._attempt = 0
+        self._waited = 0.0
+        self._key = None
+        self._generation = None
+        self._not_modified = None
+        self._holding = False
+        self._started = None
+        self._limiter_wait = 0.0
+        self._throttled = 0
+        self._sent = 0
+        self._model = None
+        self._fields = None
+
+    @property
+    def endpoint(self) -> str:
+        """Call site of this request, e.g. 'GET /api/web/namespaces/{name}'"""
+        return self._request_builder.context.get('endpoint', '')
+
+    def before_request(self, request):
+        if self._reserved:
+            self._acquire()
+            return None
+        if self._attempt == 0:
+            if self._session.instruments:
+                self._started = time.perf_counter()
+                for hook in self._session.instruments:
+                    hook.before_request(self.endpoint, request[1])
+            self._model = self._request_builder.context.get('model')
+            self._fields = xc_fields(self._request_builder.context.get('fields'))
+            if self._fields is not None and request[0] == 'GET' and xc_report_fields(self.endpoint):
+                params = request[2].setdefault('params', {})
+                if any(path[0] == 'get_spec' for path in self._fields):
+                    params.setdefault('report_fields', '')
+                if any(path[0] == 'status_set' for path in self._fields):
+                    params.setdefault('report_status_fields', '')
+            self._stream = self._session._streaming and self._request_builder.context.get('stream', False) # pylint: disable=protected-access,line-too-long
+            if request[0] == 'GET' and not self._stream:
+                self._key = _request_key(request)
+            if self._key is not None and self._session.cache is not None:
+                self._generation = self._session.cache.generation(collection(self.endpoint))
+                cached = self._session.cache.get(self._key)
+                if cached is not None:
+                    if self._model is not None or self._fields is not None:
+                        cached = copy.copy(cached)
+                        cached.xc_model = self._model
+                        cached.xc_fields = self._fields
+                    if self._started is not None:
+                        self._emit(status=200, bytes_received=len(cached.content), cached=True)
+                    return transitions.finish(cached)
+        if self._attempt == 0:
+            if self._session.breaker is not None and not self._session.breaker.allow(self.endpoint):
+                self._fail(TopsXCException(f"Circuit open for {self.endpoint}"))
+            if self._session.retry.budget is not None:
+                self._session.retry.budget.deposit()
+            if self._stream:
+                request[2]['stream'] = True
+            if 'json' in request[2]:
+                request[2]['data'] = self._session.codec.dumps(request[2].pop('json'))
+                request[2]['headers']['Content-Type'] = 'application/json'
+                self._sent = len(request[2]['data'])
+            if self._key is not None and self._model is None and self._fields is None and self._session.validators is not None: # pylint: disable=line-too-long
+                validated = self._session.validators.get(self._key)
+                if validated is not None:
+                    request[2]['headers'].update(validated[0])
+                    self._not_modified = validated[1]
+        self._reserved = True
+        delay = self._session.limiter.reserve()
+        if delay > 0:
+            self._waited += delay
+            self._limiter_wait += delay
+            return transitions.sleep(delay)
+        self._acquire()
+        return None
+
+    def after_response(self, request, response):
+        self._reserved = False
+        self._release()
+        status = response.status_code
+        if self._session._pending_auth: # pylint: disable=protected-access
+            if status == 401:
+                self._fail(TopsXCException("Invalid Token"), status=401)
+            if status < 400:
+                self._session._pending_auth = False # pylint: disable=protected-access
+        if status == 429:
+            self._throttled += 1
+            self._session.limiter.throttled()
+        delay = self._session.retry.delay(status, self._attempt, response.headers, self._waited - self._limiter_wait) # pylint: disable=line-too-long
+        if delay is None:
+            if self._session.breaker is not None:
+                self._session.breaker.record(self.endpoint, status == 429 or status >= 500)
+            response.xc_stream = self._stream
+            response.xc_codec = self._session.codec
+            response.xc_model = self._model
+            response.xc_fields = self._fields
+            response.xc_store = self._store if self._key is not None else None
+            if status == 304:
+                response.xc_not_modified = self._not_modified
+            if self._started is not None:
+                response.xc_finish = self._finish
+            self._invalidate(request)
+            return None
+        if self._stream:
+            response.close()
+        self._attempt += 1
+        self._waited += delay
+        return transitions.sleep(delay)
+
+    def after_exception(self, request, exc_type, exc_val, exc_tb):
+        self._reserved = False
+        self._release()
+        if self._session.breaker is not None:
+            self._session.breaker.record(self.endpoint, True)
+        self._invalidate(request)
+        if self._started is not None:
+            self._emit(error=exc_type.__name__)
+
+    def _acquire(self) -> None:
+        """Take a slot of the Session concurrency budget"""
+        if self._session.budget is not None and not self._holding:
+            self._session.budget.acquire()
+            self._holding = True
+
+    def _release(self) -> None:
+        """Return the concurrency budget slot"""
+        if self._holding:
+            self._holding = False
+            self._session.budget.release()
+
+    def _store(self, response, data) -> None:
+        """Cache a decoded 2xx response to a GET and its validators"""
+        if self._session.cache is not None:
+            self._session.cache.put(self._key, collection(self.endpoint), response, self._generation) # pylint: disable=line-too-long
+        if self._model is None and self._fields is None and self._session.validators is not None:
+            self._session.validators.put(self._key, response.headers, data)
+
+    def _finish(self, response, decode: float) -> None:
+        """Report the call once its final response was handled"""
+        if self._stream:
+            received = int(response.headers.get('Content-Length') or 0)
+        else:
+            received = len(response.content)
+        self._emit(status=response.status_code, decode=decode, bytes_received=received)
+
+    def _fail(self, error: Exception, **fields) -> None:
+        """Report the call as failed with error and raise it"""
+        if self._started is not None:
+            self._emit(error=type(error).__name__, **fields)
+        raise error
+
+    def _emit(self, **fields) -> None:
+        """Send the RequestEvent of this call to every Session instrument, once"""
+        if self._started is None:
+            return
+        event = _instrument.RequestEvent(
+            endpoint=self.endpoint,
+            elapsed=time.perf_counter() - self._started,
+            bytes_sent=self._sent,
+            limiter_wait=self._limiter_wait,
+            retry_wait=self._waited - self._limiter_wait,
+            retries=self._attempt,
+            throttled=self._throttled,
+            **fields
+        )
+        self._started = None
+        for hook in self._session.instruments:
+            hook.after_request(event)
+
+    def _invalidate(self, request) -> None:
+        """Drop cached GETs of the collection a write went to"""
+        if self._session.cache is not None and request[0] != 'GET':
+            self._session.cache.invalidate(collection(self.endpoint))
+
+def _request_key(request) -> tuple:
+    """Cache key of a request: method, URL and sorted query"""
+    method, url, info = request
+    params = tuple(sorted((key, str(value)) for key, value in (info.get('params') or {}).items()))
+    return method, url, params
+
+class xc_endpoint(MethodAnnotation): # pylint: disable=invalid-name
+    """Records '<METHOD> <uri template>' of each method in the request context"""
+    def __init__(self, endpoint: str = None):
+        self._endpoint = endpoint
+
+    def _modify_request_definition(self, builder, kwargs):
+        endpoint = xc_endpoint(f"{builder.method} {builder.uri.template}")
+        builder.method_handler_builder.add_annotation(endpoint, **kwargs)
+
+    def modify_request(self, request_builder):
+        if self._endpoint is not None:
+            request_builder.context['endpoint'] = self._endpoint
+
 @response_handler
 def xc_extract_items(json_data: dict):
     """Function to extract possible keys from response"""
+    if not isinstance(json_data, dict):
+        return json_data
     for key in possible_keys:
         if key in json_data:
             return json_data[key]
@@ -46,33 +274,160 @@ def xc_extract_items(json_data: dict):
 @response_handler
 def xc_response_handler(response):
     """Function to handle HTTP responses"""
+    finish = getattr(response, 'xc_finish', None)
+    if finish is None:
+        return _handle_response(response)
+    start = time.perf_counter()
+    try:
+        return _handle_response(response)
+    finally:
+        finish(response, time.perf_counter() - start)
+
+def _handle_response(response):
+    """Decoded body of a 2xx response, raises TopsXCException otherwise"""
+    if response.status_code == 304 and getattr(response, 'xc_not_modified', None) is not None:
+        return response.xc_not_modified
     if 200 <= response.status_code < 300:
+        model = getattr(response, 'xc_model', None)
+        fields = getattr(response, 'xc_fields', None)
+        if getattr(response, 'xc_stream', False):
+            items = xc_stream_items(response)
+            if fields is not None:
+                items = (xc_project(item, fields) for item in items)
+            return items if model is None else (_models.record(model, item) for item in items)
         try:
-            return response.json()
+            if fields is not None:
+                data = _project_items(response.content, fields, response.xc_codec)
+                if model is not None:
+                    data = [_models.record(model, item) for item in data]
+            elif model is not None:
+                data = _models.decode_items(response.content, model, response.xc_codec)
+            else:
+                data = xc_decode(response)
         except Exception as e:
             raise TopsXCException(f"Response not JSON: {str(e)}") from e
+        store = getattr(response, 'xc_store', None)
+        if store is not None:
+            store(response, data)
+        return data
     try:
-        error_data = response.json()
+        error_data = xc_decode(response)
         error_message = error_data.get("message", "Unknown error occurred")
     except Exception:
         error_message = response.text
     raise TopsXCException(f"API ResponseCode {response.status_code}: {error_message}")
 
+def xc_decode(response):
+    """Function to decode a response body with its Session codec"""
+    codec = getattr(response, 'xc_codec', None)
+    if codec is None:
+        return response.json()
+    return codec.loads(response.content)
+
 @error_handler(requires_consumer=True)
-def xc_error_handler(consumer):
+def xc_error_handler(consumer, exc_type, exc_val, exc_tb): # pylint: disable=unused-argument
     """Function to handle HTTP client errors"""
-    if isinstance(consumer.exceptions.BaseClientException):
-        raise TopsXCException("BaseClientException")
-    if isinstance(consumer.exceptions.ConnectionError):
-        raise TopsXCException("ConnectionError")
-    if isinstance(consumer.exceptions.ConnectionTimeout):
-        raise TopsXCException("ConnectionTimeout")
-    if isinstance(consumer.exceptions.ServerTimeout):
-        raise TopsXCException("ServerTimeout")
-    if isinstance(consumer.exceptions.SSLError):
-        raise TopsXCException("SSLError")
-    if isinstance(consumer.exceptions.InvalidURL):
-        raise TopsXCException("InvalidURL")
+    for name in ['SSLError', 'ConnectionTimeout', 'ServerTimeout', 'InvalidURL',
+                 'ConnectionError', 'BaseClientException']:
+        client_exception = getattr(consumer.exceptions, name)
+        if isinstance(client_exception, type) and issubclass(exc_type, client_exception):
+            raise TopsXCException(name) from exc_val
+
+def xc_stream_items(response, chunk_size: int = 65536):
+    """
+    Generator decoding a streamed response incrementally
+    Yields each element of the first possible_keys list found,
+    or (key, value) pairs when it is a map, without loading the whole body
+    """
+    decoder = _StreamDecoder(response.iter_content(chunk_size=chunk_size))
+    try:
+        decoder.expect('{')
+        while not decoder.consume('}'):
+            key = decoder.value()
+            decoder.expect(':')
+            if key in possible_keys and decoder.peek() in '[{':
+                yield from decoder.members()
+                return
+            decoder.value()
+            decoder.consume(',')
+    except ValueError as e:
+        raise TopsXCException(f"Response not JSON: {str(e)}") from e
+    finally:
+        response.close()
+
+class _StreamDecoder:
+    """Pull parser over an iterable of JSON byte chunks"""
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, False at end of stream"""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._buf = self._buf[self._pos:] + self._text.decode(b'', final=True)
+        else:
+            self._buf = self._buf[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, '' at end of stream"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def consume(self, char: str) -> bool:
+        """Skip char if it is next"""
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        """Skip char, which must be next"""
+        if not self.consume(char):
+            raise ValueError(f"Expecting '{char}' at offset {self._pos}")
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number or literal ending the buffer may continue in the next chunk
+            if end < len(self._buf) or not self._fill():
+                self._pos = end
+                return obj
+
+    def members(self):
+        """Yield elements of the next array, or (key, value) pairs of the next object"""
+        if self.consume('['):
+            while not self.consume(']'):
+                yield self.value()
+                self.consume(',')
+        else:
+            self.expect('{')
+            while not self.consume('}'):
+                key = self.value()
+                self.expect(':')
+                yield key, self.value()
+                self.consume(',')
 
 def xc_filter_items(d: dict, keys: list) -> dict:
     """Fuction to filter XC reponse with 'items' dict"""
@@ -80,6 +435,101 @@ def xc_filter_items(d: dict, keys: list) -> dict:
     filtered_items = [{key: d[key] for key in keys if key in d} for d in items]
     return {'items': filtered_items}
 
+def xc_fields(fields) -> tuple:
+    """
+    Function to parse a fields= projection, e.g. ['name', 'get_spec.site_state'],
+    into key paths; None keeps every field
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    return tuple(tuple(field.split('.')) for field in fields)
+
+def xc_report_fields(endpoint: str) -> bool:
+    """
+    Function telling if a list call site takes report_fields, which adds
+    get_spec to each item; the generic object APIs do, /custom/ ones don't
+    """
+    method, _, template = endpoint.partition(' ')
+    return method == 'GET' and '/custom/' not in template and '/tenant/' not in template
+
+def xc_project(item, paths: tuple) -> dict:
+    """
+    Function to keep only the key paths of an item (a dict or lazy.LazyObject),
+    fields it doesn't have are left out and a null on the way is kept as null
+    """
+    projected = {}
+    for path in paths:
+        value = item
+        depth = 0
+        try:
+            while depth < len(path) and value is not None:
+                value = value[path[depth]]
+                depth += 1
+        except (KeyError, TypeError, IndexError):
+            continue
+        target = projected
+        for key in path[:depth - 1]:
+            target = target.setdefault(key, {})
+            if target is None:
+                break
+        else:
+            target[path[depth - 1]] = plain(value)
+    return projected
+
+_projections = {}
+_projections_lock = threading.Lock()
+
+def _projection_type(paths: tuple, name: str):
+    """msgspec Struct type declaring only the key paths, every field optional"""
+    children = {}
+    for path in paths:
+        children.setdefault(path[0], []).append(path[1:])
+    fields, rename = [], {}
+    for index, (key, rests) in enumerate(children.items()):
+        kind = Any if not all(rests) else _projection_type(tuple(rests), f"{name}_{index}") | None
+        fields.append((f"f{index}", kind | msgspec.UnsetType, msgspec.UNSET))
+        rename[f"f{index}"] = key
+    return msgspec.defstruct(name, fields, rename=rename)
+
+def _project_items(data: bytes, paths: tuple, codec) -> list:
+    """
+    Items of a list response body holding only the key paths
+    With msgspec the body is decoded straight into Structs declaring just
+    those fields, skipping the rest; otherwise (or when an item doesn't fit,
+    e.g. a list where an object is expected) through lazy.LazyObject
+    """
+    if msgspec is not None:
+        decoders = _projections.get(paths)
+        if decoders is None:
+            item = _projection_type(paths, 'Fields')
+            envelope = msgspec.defstruct('FieldsList', [(key, list[item] | msgspec.UnsetType, msgspec.UNSET) for key in possible_keys]) # pylint: disable=line-too-long
+            with _projections_lock:
+                decoders = _projections.setdefault(paths, (msgspec.json.Decoder(envelope), msgspec.json.Decoder(list[item]))) # pylint: disable=line-too-long
+        try:
+            if data[:1] == b'[':
+                return msgspec.to_builtins(decoders[1].decode(data))
+            body = decoders[0].decode(data)
+            return next((msgspec.to_builtins(getattr(body, key)) for key in possible_keys if getattr(body, key) is not msgspec.UNSET), []) # pylint: disable=line-too-long
+        except msgspec.ValidationError:
+            pass
+    return [xc_project(item, paths) for item in LazyObject.decode_list(data, codec, tuple(possible_keys))]
+
+def xc_name_filter(selector):
+    """
+    Function to build a name predicate from a selector:
+    None (any), a fnmatch pattern, a list of names or a callable
+    """
+    if selector is None:
+        return lambda name: True
+    if callable(selector):
+        return selector
+    if isinstance(selector, str):
+        return lambda name: fnmatch(name, selector)
+    names = set(selector)
+    return lambda name: name in names
+
 def xc_format_date(date_obj: datetime):
     """
     Function to format dates to what the console expects
@@ -0,0 +1,77 @@
+"""Module providing the whoami identity of a token and its process-wide cache"""
+import hashlib
+import threading
+import time
+from typing import NamedTuple
+
+
+class Identity(NamedTuple):
+    """
+    Parsed whoami response of an API token
+    namespace_access: {namespace: (role, ...)}
+    """
+    email: str
+    name: str
+    tenant: str
+    namespace_access: dict
+    raw: dict
+
+    @classmethod
+    def from_json(cls, data: dict):
+        """Identity from a whoami response body"""
+        role_map = (data.get('namespace_access') or {}).get('namespace_role_map') or {}
+        return cls(
+            email=data.get('email'),
+            name=data.get('name') or data.get('email'),
+            tenant=data.get('tenant'),
+            namespace_access={ns: tuple(access.get('roles') or []) for ns, access in role_map.items()},
+            raw=data
+        )
+
+    def roles(self, namespace: str) -> tuple:
+        """Roles of the token in namespace"""
+        return self.namespace_access.get(namespace, ())
+
+    def has_role(self, namespace: str, role: str) -> bool:
+        """True when the token holds role in namespace"""
+        return role in self.roles(namespace)
+
+
+class WhoamiCache:
+    """
+    Identities by tenant URL and a hash of the token, kept ttl seconds
+    Shared by every Session in the process so a token is checked once per ttl
+    """
+    def __init__(self, ttl: float = 300.0, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def key(tenant_url: str, api_token: str) -> str:
+        """Cache key, the token itself is never stored"""
+        return hashlib.sha256(f"{tenant_url}\0{api_token}".encode()).hexdigest()
+
+    def get(self, tenant_url: str, api_token: str) -> Identity:
+        """Cached Identity, None when unknown or expired"""
+        key = self.key(tenant_url, api_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._entries.pop(key, None)
+                return None
+            return entry[1]
+
+    def put(self, tenant_url: str, api_token: str, identity: Identity) -> None:
+        """Cache a validated Identity"""
+        with self._lock:
+            self._entries[self.key(tenant_url, api_token)] = (self._clock() + self.ttl, identity)
+
+    def clear(self) -> None:
+        """Forget every Identity"""
+        with self._lock:
+            self._entries.clear()
+
+
+whoami_cache = WhoamiCache()
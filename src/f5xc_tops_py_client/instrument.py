@@ -0,0 +1,265 @@
+"""
+Module providing per-request instrumentation for a Session
+  metrics = Metrics()
+  api = session(tenant_url, api_token, instruments=[metrics])
+  ...
+  print(metrics.report())
+Instruments are told about every call before it is sent and once it
+finished, after retries and decoding, with a RequestEvent.
+"""
+import bisect
+import threading
+from collections import Counter
+from typing import NamedTuple
+from . import helper
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover
+    otel_metrics = None
+
+
+class RequestEvent(NamedTuple):
+    """
+    One finished call of a Consumer method
+    endpoint: '<METHOD> <uri template>', e.g. 'GET /api/config/namespaces/{namespace}/sites'
+    status: final HTTP status, None when the call raised before a response
+    elapsed: seconds from the first attempt to the decoded result
+    decode: seconds spent decoding the final response (0 when streamed)
+    limiter_wait: seconds spent waiting on the rate limiter
+    retry_wait: seconds slept between retries
+    retries: attempts after the first, throttled: 429 responses seen
+    cached: answered by the Session ResponseCache without a request
+    error: exception type name when the call raised
+    """
+    endpoint: str
+    status: int = None
+    elapsed: float = 0.0
+    decode: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    limiter_wait: float = 0.0
+    retry_wait: float = 0.0
+    retries: int = 0
+    throttled: int = 0
+    cached: bool = False
+    error: str = None
+
+    @property
+    def method(self) -> str:
+        """HTTP method of the endpoint"""
+        return self.endpoint.partition(' ')[0]
+
+    @property
+    def template(self) -> str:
+        """URI template of the endpoint"""
+        return self.endpoint.partition(' ')[2]
+
+    @property
+    def network(self) -> float:
+        """Seconds not spent waiting or decoding, i.e. on the wire and at the tenant"""
+        return max(0.0, self.elapsed - self.decode - self.limiter_wait - self.retry_wait)
+
+
+class Instrument:
+    """
+    Base class of Session instruments, override either method
+    Both run on the calling thread (or event loop) and must be quick
+    """
+    def before_request(self, endpoint: str, url: str) -> None:
+        """Called once per call, before the first attempt"""
+
+    def after_request(self, event: RequestEvent) -> None:
+        """Called once per call when it finished or failed"""
+
+
+# upper bounds in seconds of histogram buckets, the last one catches everything above
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram, not thread safe"""
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one sample"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        """Average sample, 0 when empty"""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate of quantile q (0-1), interpolated within its bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+
+class EndpointStats: # pylint: disable=too-many-instance-attributes
+    """Aggregated RequestEvents of one endpoint"""
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.calls = 0
+        self.errors = 0
+        self.cached = 0
+        self.retries = 0
+        self.throttled = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.statuses = Counter()
+        self.latency = Histogram(buckets)
+        self.decode = Histogram(buckets)
+        self.limiter_wait = Histogram(buckets)
+        self.retry_wait = Histogram(buckets)
+
+    def add(self, event: RequestEvent) -> None:
+        """Aggregate one event"""
+        self.calls += 1
+        self.errors += event.error is not None or (event.status or 0) >= 400
+        self.cached += event.cached
+        self.retries += event.retries
+        self.throttled += event.throttled
+        self.bytes_sent += event.bytes_sent
+        self.bytes_received += event.bytes_received
+        self.statuses[event.status] += 1
+        self.latency.observe(event.elapsed)
+        self.decode.observe(event.decode)
+        self.limiter_wait.observe(event.limiter_wait)
+        self.retry_wait.observe(event.retry_wait)
+
+
+class Metrics(Instrument):
+    """
+    In-process aggregator of RequestEvents with histograms per endpoint
+    Safe to share between Sessions and threads
+    """
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def after_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            stats = self._endpoints.get(event.endpoint)
+            if stats is None:
+                stats = self._endpoints[event.endpoint] = EndpointStats(self.buckets)
+            stats.add(event)
+
+    def __getitem__(self, endpoint: str) -> EndpointStats:
+        return self._endpoints[endpoint]
+
+    def __iter__(self):
+        return iter(list(self._endpoints))
+
+    def reset(self) -> None:
+        """Forget everything aggregated so far"""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> dict:
+        """Summary per endpoint as plain values, e.g. for logging as JSON"""
+        with self._lock:
+            return {endpoint: {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'cached': stats.cached,
+                'retries': stats.retries,
+                'throttled': stats.throttled,
+                'bytes_sent': stats.bytes_sent,
+                'bytes_received': stats.bytes_received,
+                'statuses': dict(stats.statuses),
+                'p50': stats.latency.quantile(0.5),
+                'p99': stats.latency.quantile(0.99),
+                'latency': stats.latency.sum,
+                'decode': stats.decode.sum,
+                'limiter_wait': stats.limiter_wait.sum,
+                'retry_wait': stats.retry_wait.sum,
+            } for endpoint, stats in self._endpoints.items()}
+
+    def report(self) -> str:
+        """Table of endpoints, slowest total time first, with where the time went"""
+        rows = sorted(self.snapshot().items(), key=lambda row: row[1]['latency'], reverse=True)
+        lines = [f"{'calls':>6} {'err':>4} {'retry':>5} {'429':>4} {'p50 ms':>8} {'p99 ms':>8} {'total s':>8} {'wait s':>7} {'decode s':>8}  endpoint"] # pylint: disable=line-too-long
+        for endpoint, row in rows:
+            lines.append(f"{row['calls']:>6} {row['errors']:>4} {row['retries']:>5} {row['throttled']:>4} {row['p50'] * 1e3:>8.1f} {row['p99'] * 1e3:>8.1f} {row['latency']:>8.2f} {row['limiter_wait'] + row['retry_wait']:>7.2f} {row['decode']:>8.2f}  {endpoint}") # pylint: disable=line-too-long
+        return '\n'.join(lines)
+
+
+class PrometheusExporter(Instrument):
+    """
+    Instrument recording RequestEvents as prometheus_client metrics
+    registry: CollectorRegistry to register with, the default one when None
+    Requires the optional 'prometheus-client' dependency
+    """
+    def __init__(self, registry=None, prefix: str = 'xc', buckets: tuple = BUCKETS):
+        if prometheus_client is None:
+            raise helper.TopsXCException("PrometheusExporter requires prometheus-client")
+        kwargs = {'registry': registry} if registry is not None else {}
+        labels = ['method', 'template']
+        self._latency = prometheus_client.Histogram(f"{prefix}_request_seconds", 'Call duration including retries and decoding', labels + ['status'], buckets=buckets, **kwargs) # pylint: disable=line-too-long
+        self._decode = prometheus_client.Histogram(f"{prefix}_decode_seconds", 'Response decoding time', labels, buckets=buckets, **kwargs) # pylint: disable=line-too-long
+        self._wait = prometheus_client.Counter(f"{prefix}_wait_seconds", 'Time spent waiting on the rate limiter or between retries', labels + ['reason'], **kwargs) # pylint: disable=line-too-long
+        self._retries = prometheus_client.Counter(f"{prefix}_retries", 'Retried attempts', labels, **kwargs)
+        self._throttled = prometheus_client.Counter(f"{prefix}_throttled", '429 responses', labels, **kwargs)
+        self._bytes = prometheus_client.Counter(f"{prefix}_bytes", 'Body bytes', labels + ['direction'], **kwargs) # pylint: disable=line-too-long
+
+    def after_request(self, event: RequestEvent) -> None:
+        labels = (event.method, event.template)
+        self._latency.labels(*labels, str(event.status if event.error is None else event.error)).observe(event.elapsed) # pylint: disable=line-too-long
+        self._decode.labels(*labels).observe(event.decode)
+        self._wait.labels(*labels, 'limiter').inc(event.limiter_wait)
+        self._wait.labels(*labels, 'retry').inc(event.retry_wait)
+        self._retries.labels(*labels).inc(event.retries)
+        self._throttled.labels(*labels).inc(event.throttled)
+        self._bytes.labels(*labels, 'sent').inc(event.bytes_sent)
+        self._bytes.labels(*labels, 'received').inc(event.bytes_received)
+
+
+class OpenTelemetryExporter(Instrument):
+    """
+    Instrument recording RequestEvents as OpenTelemetry metrics
+    meter: Meter to create instruments on, one from the global MeterProvider when None
+    Requires the optional 'opentelemetry-api' dependency
+    """
+    def __init__(self, meter=None, prefix: str = 'xc'):
+        if otel_metrics is None:
+            raise helper.TopsXCException("OpenTelemetryExporter requires opentelemetry-api")
+        meter = meter if meter is not None else otel_metrics.get_meter(__name__)
+        self._latency = meter.create_histogram(f"{prefix}.request.duration", unit='s', description='Call duration including retries and decoding') # pylint: disable=line-too-long
+        self._decode = meter.create_histogram(f"{prefix}.decode.duration", unit='s', description='Response decoding time') # pylint: disable=line-too-long
+        self._wait = meter.create_counter(f"{prefix}.wait", unit='s', description='Time spent waiting on the rate limiter or between retries') # pylint: disable=line-too-long
+        self._retries = meter.create_counter(f"{prefix}.retries", description='Retried attempts')
+        self._throttled = meter.create_counter(f"{prefix}.throttled", description='429 responses')
+        self._bytes = meter.create_counter(f"{prefix}.bytes", unit='By', description='Body bytes')
+
+    def after_request(self, event: RequestEvent) -> None:
+        attributes = {'http.request.method': event.method, 'url.template': event.template}
+        status = event.status if event.error is None else event.error
+        self._latency.record(event.elapsed, dict(attributes, **{'http.response.status_code': str(status)}))
+        self._decode.record(event.decode, attributes)
+        self._wait.add(event.limiter_wait, dict(attributes, reason='limiter'))
+        self._wait.add(event.retry_wait, dict(attributes, reason='retry'))
+        self._retries.add(event.retries, attributes)
+        self._throttled.add(event.throttled, attributes)
+        self._bytes.add(event.bytes_sent, dict(attributes, direction='sent'))
+        self._bytes.add(event.bytes_received, dict(attributes, direction='received'))
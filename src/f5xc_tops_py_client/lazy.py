@@ -0,0 +1,210 @@
+"""
+Module providing lazy response wrappers which keep the raw JSON of an
+object and decode each field only when it is first read
+  for site in Site(api).list(model=LazySite):
+      print(site.name, site.state)
+Fields are read as attributes or keys, nested objects are lazy too and
+decoded values are cached. Without msgspec the body is decoded up front
+and the wrappers only add the typed accessors.
+"""
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+if msgspec is not None:
+    _split = msgspec.json.Decoder(dict[str, msgspec.Raw]).decode
+    _split_list = msgspec.json.Decoder(list[msgspec.Raw]).decode
+    _decode = msgspec.json.Decoder().decode
+
+
+class LazyObject:
+    """
+    JSON object decoded field by field on first access
+    raw: bytes (or msgspec.Raw) of the object, values: already decoded fields
+    """
+    __slots__ = ('_raw', '_fields', '_values')
+
+    def __init__(self, raw=None, values: dict = None):
+        self._raw = raw
+        self._fields = None
+        self._values = values
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Wrapper around an already decoded object"""
+        return cls(values=data)
+
+    @classmethod
+    def decode_list(cls, data: bytes, codec, keys: tuple = ('items',)) -> list:
+        """
+        Wrappers of the items of a list response body, the first array
+        found under keys; codec is used without msgspec
+        """
+        if msgspec is None:
+            body = codec.loads(data)
+            if isinstance(body, dict):
+                body = next((body[key] for key in keys if isinstance(body.get(key), list)), [])
+            return [cls.from_dict(item) for item in body]
+        if data[:1] == b'[':
+            return [cls(raw) for raw in _split_list(data)]
+        fields = _split(data)
+        items = next((fields[key] for key in keys if key in fields and bytes(memoryview(fields[key])[:1]) == b'['), None) # pylint: disable=line-too-long
+        return [cls(raw) for raw in _split_list(items)] if items is not None else []
+
+    def _field(self, key: str):
+        """Decoded value of key, raises KeyError when missing"""
+        values = self._values
+        if values is not None and key in values:
+            value = values[key]
+            return _wrap_plain(value) if self._raw is None else value
+        if self._raw is None:
+            raise KeyError(key)
+        if self._fields is None:
+            self._fields = _split(self._raw)
+        value = _wrap(self._fields[key])
+        if values is None:
+            values = self._values = {}
+        values[key] = value
+        return value
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._field(name)
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__} has no field {name!r}") from None
+
+    def __getitem__(self, key: str):
+        return self._field(key)
+
+    def get(self, key: str, default=None):
+        """Value of key, default when missing or null"""
+        try:
+            value = self._field(key)
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def keys(self) -> list:
+        """Field names"""
+        if self._raw is None:
+            return list(self._values)
+        if self._fields is None:
+            self._fields = _split(self._raw)
+        return list(self._fields)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def to_dict(self) -> dict:
+        """Whole object decoded to plain dicts and lists"""
+        if self._raw is None:
+            return {key: plain(value) for key, value in self._values.items()}
+        return _decode(self._raw)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyObject):
+            return self.to_dict() == other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        name = self.get('name')
+        return f"<{type(self).__name__} {name!r}>" if name is not None else f"<{type(self).__name__}>"
+
+
+def _wrap(raw):
+    """Decoded field, objects and arrays of objects stay lazy"""
+    first = bytes(memoryview(raw)[:1])
+    if first == b'{':
+        return LazyObject(raw)
+    if first == b'[':
+        return [_wrap(item) for item in _split_list(raw)]
+    return _decode(raw)
+
+
+def _wrap_plain(value):
+    """Decoded value with objects wrapped, for wrappers built from_dict()"""
+    if isinstance(value, dict):
+        return LazyObject.from_dict(value)
+    if isinstance(value, list):
+        return [_wrap_plain(item) for item in value]
+    return value
+
+
+def plain(value):
+    """value with every LazyObject decoded to plain dicts and lists"""
+    if isinstance(value, LazyObject):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    return value
+
+
+def _path(obj, *keys):
+    """Value at a path of keys, None when any of them is missing, null or not an object"""
+    for key in keys:
+        if not isinstance(obj, (LazyObject, dict)):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+class LazyUser(LazyObject):
+    """Lazy User.list() item"""
+    __slots__ = ()
+
+    @property
+    def email(self) -> str:
+        """Email, or name when the item has none"""
+        return self.get('email') or self.get('name')
+
+
+class LazyGroup(LazyObject):
+    """Lazy Group.list() item"""
+    __slots__ = ()
+
+
+class LazySite(LazyObject):
+    """Lazy Site.list() item"""
+    __slots__ = ()
+
+    @property
+    def state(self) -> str:
+        """site_state, e.g. 'ONLINE'"""
+        return _path(self, 'get_spec', 'site_state')
+
+    @property
+    def versions(self) -> tuple:
+        """(software, os) versions"""
+        spec = self.get('get_spec')
+        return _path(spec, 'volterra_software_version'), _path(spec, 'operating_system_version')
+
+
+class LazyRegistration(LazyObject):
+    """Lazy Registration.list() or list_by_state() item"""
+    __slots__ = ()
+
+    @property
+    def state(self) -> str:
+        """Current state, e.g. 'NEW'; status is a list on XC responses and only read when an object"""
+        return _path(self, 'get_spec', 'state') or _path(self, 'status', 'current_state')
+
+    @property
+    def cluster_name(self) -> str:
+        """Cluster name from the passport"""
+        return _path(self, 'get_spec', 'passport', 'cluster_name')
+
+    @property
+    def passport(self) -> dict:
+        """Passport as a plain dict, as approve_payload() takes it"""
+        passport = _path(self, 'get_spec', 'passport')
+        return plain(passport) if passport is not None else None
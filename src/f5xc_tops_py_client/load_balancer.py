@@ -3,7 +3,7 @@ Module for Load Balancers
 https://docs.cloud.f5.com/docs-v2/api/views-http-loadbalancer
 https://docs.cloud.f5.com/docs-v2/api/views-tcp-loadbalancer
 """
-from uplink import Consumer, Path, Body, get, post, put, delete, json
+from uplink import Consumer, Path, Context, Body, get, post, put, delete, json
 from . import helper
 
 
@@ -18,12 +18,14 @@ class HTTPLoadBalancer(Consumer):
         Initialize the HTTPLoadBalancer Consumer.
         :param session: Session object with tenant URL and auth.
         """
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/config/namespaces/{namespace}/http_loadbalancers')
-    def list(self, namespace: Path):
+    def list(self, namespace: Path, stream: Context = False, model: Context = None, fields: Context = None):
         """
         List all HTTP Load Balancers in a namespace.
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
         """
 
     @get('/api/config/namespaces/{namespace}/http_loadbalancers/{name}')
@@ -63,12 +65,14 @@ class TCPLoadBalancer(Consumer):
         Initialize the TCPLoadBalancer Consumer.
         :param session: Session object with tenant URL and auth.
         """
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/config/namespaces/{namespace}/tcp_loadbalancers')
-    def list(self, namespace: Path):
+    def list(self, namespace: Path, stream: Context = False, model: Context = None, fields: Context = None):
         """
         List all TCP Load Balancers in a namespace.
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
         """
 
     @get('/api/config/namespaces/{namespace}/tcp_loadbalancers/{name}')
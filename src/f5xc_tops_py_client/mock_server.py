@@ -0,0 +1,321 @@
+"""
+Module providing an offline stand-in for the XC API, for tests and benchmarks
+  with MockServer(items=500, latency=0.02, rate_429=0.05) as server:
+      api = session(tenant_url=server.url, api_token=server.token)
+      User(api).list()
+Every path of every Consumer is served from an in-memory store.
+"""
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from uplink.builder import ConsumerMethod
+from .cache import collection
+from .codec import get_codec
+from .helper import xc_report_fields
+from .session import WHOAMI_PATH
+from .ns import NS
+from .cred import APIcred, SVCcred
+from .user import User
+from .namespace_role import NSrole
+from .group import Group
+from .role import Role
+from .tenant import Tenant
+from .registration import Registration
+from .xcsite import Site
+from .cert import Cert
+from .origin_pool import OriginPool
+from .load_balancer import HTTPLoadBalancer, TCPLoadBalancer
+
+CONSUMERS = (NS, APIcred, SVCcred, User, NSrole, Group, Role, Tenant, Registration, Site, Cert, OriginPool, HTTPLoadBalancer, TCPLoadBalancer) # pylint: disable=line-too-long
+
+# Consumer method names by what the server does for them, anything else is an action answered with {}
+_KINDS = {
+    'list': 'list', 'listv1': 'list', 'list_by_state': 'list',
+    'last_login': 'last_login', 'login_events': 'last_login', 'login_events_in_tf': 'last_login',
+    'list_inactive_users': 'inactive',
+    'get': 'get', 'get_settings': 'get', 'get_idm_settings': 'get',
+    'create': 'create', 'replace': 'replace', 'update': 'replace', 'delete': 'delete',
+}
+
+# Response keys of list-like endpoints not answering with 'items'
+_LIST_KEYS = {'last_login': 'last_login_map', 'login_events': 'login_events_map', 'login_events_in_tf': 'login_events_map', 'list_inactive_users': 'users'} # pylint: disable=line-too-long
+
+
+class Route:
+    """One served endpoint, matched on method and path"""
+    def __init__(self, method: str, template: str, name: str):
+        self.method = method
+        self.template = '/' + template.lstrip('/')
+        self.endpoint = f"{method} {self.template}"
+        self.name = name
+        self.kind = _KINDS.get(name, 'action')
+        self.resource = collection(self.endpoint)
+        self.params = template.count('{')
+        self.pattern = re.compile(re.sub(r'\\{(\w+)\\}', r'(?P<\1>[^/]+)', re.escape(self.template)))
+
+
+def consumer_routes(consumers=CONSUMERS) -> list:
+    """Routes of every request method of consumers, literal paths first"""
+    routes = {}
+    for consumer in consumers:
+        for name, attr in vars(consumer).items():
+            if isinstance(attr, ConsumerMethod):
+                builder = getattr(consumer, name)
+                route = Route(builder.method, builder.uri.template, name)
+                routes.setdefault(route.endpoint, route)
+    return sorted(routes.values(), key=lambda route: route.params)
+
+
+class MockServer: # pylint: disable=too-many-instance-attributes
+    """
+    Threaded HTTP server answering like an XC tenant
+    items: objects generated per collection and namespace on first use
+    item_size: approximate encoded bytes of each generated object
+    latency: seconds added to every response, plus up to jitter more
+    rate_429, rate_503: share of requests answered 429 or 503
+    retry_after: Retry-After seconds sent with those, None to omit it
+    token: API token expected, any token is accepted when None
+    Login events honour first/max paging and the start/end of a time frame.
+    report_fields: like XC, leave get_spec and status_set out of list items
+    unless the report_fields or report_status_fields query asks for them
+    GET responses carry an ETag and honour If-None-Match.
+    requests counts the calls per endpoint, e.g. 'GET /api/web/namespaces',
+    statuses the responses per status code
+    """
+    def __init__(self, items: int = 100, item_size: int = 512, latency: float = 0.0, jitter: float = 0.0, rate_429: float = 0.0, rate_503: float = 0.0, retry_after=1, token: str = 'mock-token', namespaces: int = 10, port: int = 0, seed: int = None, report_fields: bool = False): # pylint: disable=too-many-arguments,too-many-locals,line-too-long
+        self.items = items
+        self.item_size = item_size
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rate_503 = rate_503
+        self.retry_after = retry_after
+        self.token = token
+        self.namespaces = namespaces
+        self.report_fields = report_fields
+        self.routes = consumer_routes()
+        self.requests = Counter()
+        self.statuses = Counter()
+        self.codec = get_codec()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._store = {}
+        self._port = port
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Tenant URL of the running server"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Serve on a background thread, returns the tenant URL"""
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', self._port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-xc', daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        """Stop serving"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.stop()
+
+    def reset(self) -> None:
+        """Forget stored objects and request counts"""
+        with self._lock:
+            self._store.clear()
+            self.requests.clear()
+            self.statuses.clear()
+
+    def put(self, resource: str, items: list, namespace: str = 'system') -> None:
+        """Replace the objects of a collection, e.g. put('user_roles', [...])"""
+        namespace = None if resource == 'namespaces' else namespace
+        with self._lock:
+            self._store[(resource, namespace)] = {_name(item): item for item in items}
+
+    def objects(self, resource: str, namespace: str = 'system') -> dict:
+        """Objects of a collection by name, generated on first use"""
+        namespace = None if resource == 'namespaces' else namespace
+        with self._lock:
+            store = self._store.get((resource, namespace))
+            if store is None:
+                count = self.namespaces if resource == 'namespaces' else self.items
+                store = self._store[(resource, namespace)] = {}
+                for i in range(count):
+                    item = self.generate(resource, namespace, i)
+                    store[_name(item)] = item
+            return store
+
+    def generate(self, resource: str, namespace: str, index: int) -> dict:
+        """Generated object number index of a collection"""
+        if resource == 'namespaces':
+            return {'name': 'system' if index == 0 else f"ns-{index:03d}", 'tenant': 'mock', 'labels': {}}
+        name = f"{resource}-{index:05d}"
+        item = {'name': name, 'namespace': namespace, 'tenant': 'mock', 'labels': {}, 'description': ''}
+        if resource == 'user_roles':
+            item['name'] = item['email'] = f"user{index:05d}@example.com"
+            item['last_login_timestamp'] = '2026-01-01T00:00:00Z'
+        padding = self.item_size - len(self.codec.dumps(item))
+        if padding > 0:
+            item['description'] = 'x' * padding
+        return item
+
+    def fault(self) -> int:
+        """Status of an injected failure, None for a normal response"""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_429:
+            return 429
+        if roll < self.rate_429 + self.rate_503:
+            return 503
+        return None
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple:
+        """(status, headers, body) answering one request"""
+        response = self._respond(method, path, headers, body)
+        with self._lock:
+            self.statuses[response[0]] += 1
+        return response
+
+    def _respond(self, method: str, path: str, headers, body: bytes) -> tuple:
+        """Response to one request, before it is counted"""
+        if self.latency or self.jitter:
+            time.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if self.token is not None and headers.get('Authorization') != f"APIToken {self.token}":
+            return self._json(401, {'message': 'Unauthorized'})
+        path, query = urlsplit(path)[2:4]
+        if method == 'GET' and path == WHOAMI_PATH:
+            with self._lock:
+                self.requests[f"GET {WHOAMI_PATH}"] += 1
+            return self._json(200, {
+                'email': 'mock@example.com', 'name': 'mock@example.com', 'tenant': 'mock',
+                'namespace_access': {'namespace_role_map': {'system': {'roles': ['ves-io-admin']}}},
+            })
+        if method == 'HEAD':
+            return 200, {}, b''
+        route, params = self._match(method, path)
+        if route is None:
+            return self._json(404, {'message': f"No route for {method} {path}"})
+        with self._lock:
+            self.requests[route.endpoint] += 1
+        status = self.fault()
+        if status is not None:
+            retry = {} if self.retry_after is None else {'Retry-After': str(self.retry_after)}
+            return self._json(status, {'message': 'Injected failure'}, retry)
+        payload = self.codec.loads(body) if body else {}
+        status, data = self._apply(route, params, payload, parse_qs(query, keep_blank_values=True))
+        response = self._json(status, data)
+        if method == 'GET' and status == 200:
+            etag = '"' + hashlib.blake2b(response[2], digest_size=16).hexdigest() + '"'
+            if headers.get('If-None-Match') == etag:
+                return 304, {'ETag': etag}, b''
+            response[1]['ETag'] = etag
+        return response
+
+    def _match(self, method: str, path: str) -> tuple:
+        """Route and path parameters of a request"""
+        for route in self.routes:
+            if route.method == method:
+                match = route.pattern.fullmatch(path)
+                if match:
+                    return route, match.groupdict()
+        return None, None
+
+    def _apply(self, route: Route, params: dict, payload: dict, query: dict) -> tuple: # pylint: disable=too-many-return-statements
+        """(status, data) of a matched request against the store"""
+        namespace = params.get('namespace', 'system')
+        objects = self.objects(route.resource, namespace)
+        name = params.get('name')
+        if route.kind == 'list':
+            with self._lock:
+                items = list(objects.values())
+            if self.report_fields and xc_report_fields(route.endpoint):
+                hidden = {key for key, asked in (('get_spec', 'report_fields'), ('status_set', 'report_status_fields')) if asked not in query} # pylint: disable=line-too-long
+                items = [{key: value for key, value in item.items() if key not in hidden} for item in items]
+            return 200, {'items': items}
+        if route.kind == 'last_login':
+            users = self.objects('user_roles', 'system')
+            with self._lock:
+                events = [(email, user.get('last_login_timestamp')) for email, user in users.items()]
+            if route.name == 'login_events_in_tf':
+                events = [(email, when) for email, when in events if when is not None and payload.get('start', '') <= when <= payload.get('end', '~')] # pylint: disable=line-too-long
+            if route.name != 'last_login':
+                first = int(payload.get('first') or query.get('first', [0])[0])
+                maximum = int(payload.get('max') or query.get('max', [0])[0])
+                events = events[first:first + maximum if maximum else None]
+            return 200, {_LIST_KEYS[route.name]: dict(events)}
+        if route.kind == 'inactive':
+            return 200, {'users': []}
+        if route.kind == 'get':
+            if name is None:
+                return 200, {'name': route.resource, 'tenant': 'mock'}
+            item = objects.get(name)
+            return (404, {'message': f"{name} not found"}) if item is None else (200, item)
+        if route.kind in ('create', 'replace'):
+            name = name or _name(payload)
+            if route.kind == 'create' and name in objects:
+                return 409, {'message': f"{name} already exists"}
+            with self._lock:
+                objects[name] = payload
+            return 200, payload
+        if route.kind == 'delete':
+            name = name or _name(payload)
+            with self._lock:
+                found = objects.pop(name, None)
+            return (404, {'message': f"{name} not found"}) if found is None else (200, {})
+        return 200, {}
+
+    def _json(self, status: int, data, headers: dict = None) -> tuple:
+        """(status, headers, body) of a JSON response"""
+        return status, dict(headers or {}, **{'Content-Type': 'application/json'}), self.codec.dumps(data)
+
+
+def _name(item: dict) -> str:
+    """Name of a stored or posted object"""
+    metadata = item.get('metadata') or {}
+    return item.get('name') or item.get('email') or metadata.get('name')
+
+
+def _handler(server: MockServer):
+    """BaseHTTPRequestHandler subclass answering through server.handle()"""
+    class Handler(BaseHTTPRequestHandler):
+        """Keep-alive request handler"""
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def _serve(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+            status, headers, data = server.handle(self.command, self.path, self.headers, body)
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = _serve
+
+        def log_message(self, format, *args): # pylint: disable=redefined-builtin
+            pass
+
+    return Handler
@@ -0,0 +1,263 @@
+"""
+Module providing compact record types for request payloads and common
+response objects
+  User(api).create(UserCreate('jane@example.com', 'Jane', 'Doe', group_names=['admins']))
+  for site in Site(api).list(model=SiteRecord):
+      print(site.name, site.state)
+Payloads are slotted dataclasses the orjson and msgspec codecs encode
+straight to JSON bytes. Response records keep only the fields they
+declare: with msgspec installed a list response is decoded directly
+into records, skipping every other field, otherwise they are built
+from the decoded items.
+"""
+import dataclasses
+import threading
+from dataclasses import dataclass, field
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+@dataclass(slots=True)
+class UserCreate:
+    """Payload for User.create, the same as User.create_payload()"""
+    email: str
+    first_name: str
+    last_name: str
+    group_names: list = field(default_factory=list)
+    namespace_roles: list = field(default_factory=list)
+    idm_type: str = 'SSO'
+    namespace: str = 'system'
+    name: str = None
+    type: str = 'USER'
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = self.email
+
+
+@dataclass(slots=True)
+class UserUpdate:
+    """Payload for User.update, the same as User.update_payload()"""
+    email: str
+    first_name: str
+    last_name: str
+    namespace_roles: list
+    group_names: list
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class UserDelete:
+    """Payload for User.delete, the same as User.delete_payload()"""
+    email: str
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class UserGroups:
+    """Payload for User.group, the same as User.group_payload()"""
+    username: str
+    group_names: list
+
+
+@dataclass(slots=True)
+class GroupCreate:
+    """Payload for Group.create, the same as Group.create_payload()"""
+    name: str
+    description: str
+    display_name: str
+    namespace_roles: list
+    usernames: list
+    sync_id: str = 'string'
+
+
+@dataclass(slots=True)
+class NamespaceRoles:
+    """Payload for Group.role_assign and role_remove, the same as Group.role_payload()"""
+    name: str
+    namespace_roles: list
+
+
+@dataclass(slots=True, frozen=True)
+class CredentialSpec:
+    """spec of an APIcred payload"""
+    type: str = 'API_TOKEN'
+
+
+@dataclass(slots=True)
+class APIcredCreate:
+    """Payload for APIcred.create, the same as APIcred.create_payload()"""
+    name: str
+    expiration_days: int
+    namespace: str = 'system'
+    spec: CredentialSpec = CredentialSpec()
+
+
+@dataclass(slots=True)
+class CredentialRenew:
+    """Payload for APIcred.renew and SVCcred.renew"""
+    name: str
+    expiration_days: int
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class CredentialRevoke:
+    """Payload for APIcred.revoke and SVCcred.revoke"""
+    name: str
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class SiteUpgrade:
+    """Payload for Site.upgrade_sw and upgrade_os, the same as Site.upgrade_payload()"""
+    name: str
+    version: str
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class SiteState:
+    """Payload for Site.state, the same as Site.state_payload()"""
+    name: str
+    namespace: str = 'system'
+    state: str = 'DECOMMISSIONING'
+
+
+@dataclass(slots=True)
+class RegistrationApprove:
+    """Payload for Registration.approve, the same as Registration.approve_payload()"""
+    name: str
+    passport: dict
+    state: str = 'APPROVED'
+    namespace: str = 'system'
+
+
+@dataclass(slots=True)
+class UserRecord:
+    """User.list() item"""
+    email: str = None
+    name: str = None
+    first_name: str = None
+    last_name: str = None
+    namespace: str = None
+    idm_type: str = None
+    type: str = None
+    group_names: list = field(default_factory=list)
+    namespace_roles: list = field(default_factory=list)
+    last_login_timestamp: str = None
+
+
+@dataclass(slots=True)
+class GroupRecord:
+    """Group.list() item"""
+    name: str = None
+    display_name: str = None
+    description: str = None
+    namespace_roles: list = field(default_factory=list)
+    usernames: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SiteSpec:
+    """get_spec of a Site.list() item"""
+    site_type: str = None
+    site_state: str = None
+    volterra_software_version: str = None
+    operating_system_version: str = None
+
+
+@dataclass(slots=True)
+class SiteRecord:
+    """Site.list() item"""
+    name: str = None
+    namespace: str = None
+    labels: dict = field(default_factory=dict)
+    get_spec: SiteSpec = field(default_factory=SiteSpec)
+
+    @property
+    def state(self) -> str:
+        """site_state, e.g. 'ONLINE'"""
+        return self.get_spec.site_state
+
+    @property
+    def versions(self) -> tuple:
+        """(software, os) versions"""
+        return self.get_spec.volterra_software_version, self.get_spec.operating_system_version
+
+
+@dataclass(slots=True)
+class RegistrationSpec:
+    """get_spec of a Registration item"""
+    token: str = None
+    state: str = None
+    passport: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RegistrationRecord:
+    """Registration.list() or list_by_state() item"""
+    name: str = None
+    namespace: str = None
+    get_spec: RegistrationSpec = field(default_factory=RegistrationSpec)
+
+    @property
+    def state(self) -> str:
+        """Current state, e.g. 'NEW'"""
+        return self.get_spec.state
+
+    @property
+    def cluster_name(self) -> str:
+        """Cluster name from the passport"""
+        return self.get_spec.passport.get('cluster_name')
+
+
+def record(model, data: dict):
+    """
+    Record of type model from a decoded object, ignoring undeclared fields
+    model may also be a lazy.LazyObject type
+    """
+    if hasattr(model, 'from_dict'):
+        return model.from_dict(data)
+    values = {}
+    for item in dataclasses.fields(model):
+        if item.name in data and data[item.name] is not None:
+            value = data[item.name]
+            values[item.name] = record(item.type, value) if dataclasses.is_dataclass(item.type) else value
+    return model(**values)
+
+
+def to_dict(payload) -> dict:
+    """Payload as a dict, for codecs without native dataclass support"""
+    return {item.name: getattr(payload, item.name) for item in dataclasses.fields(payload)}
+
+
+_decoders = {}
+_decoders_lock = threading.Lock()
+
+
+def decode_items(data: bytes, model, codec) -> list:
+    """
+    Records of type model from the body of a list response
+    codec: decodes the body when msgspec is missing or the items don't
+    fit model's field types (e.g. a null where a str is declared)
+    model may also be a lazy.LazyObject type
+    """
+    if hasattr(model, 'decode_list'):
+        return model.decode_list(data, codec)
+    if msgspec is not None:
+        decoder = _decoders.get(model)
+        if decoder is None:
+            envelope = dataclasses.make_dataclass(f"{model.__name__}List", [('items', list[model], field(default_factory=list))]) # pylint: disable=line-too-long
+            with _decoders_lock:
+                decoder = _decoders.setdefault(model, msgspec.json.Decoder(envelope))
+        try:
+            return decoder.decode(data).items
+        except msgspec.ValidationError:
+            pass
+    body = codec.loads(data)
+    items = (body.get('items') or []) if isinstance(body, dict) else body
+    return [record(model, item) for item in items]
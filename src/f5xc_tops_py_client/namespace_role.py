@@ -3,7 +3,7 @@ Module for Namespace Roles
 https://docs.cloud.f5.com/docs/api/namespace-role
 Need to unwind this class -- not useful
 """
-from uplink import Consumer, Path, Body, json, get, post, put # pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post, put # pylint: disable=unused-import
 from . import helper
 
 
@@ -11,11 +11,15 @@ from . import helper
 class NSrole(Consumer):
     """Class for Namespace Roles"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/namespaces/{namespace}/namespace_roles')
-    def list(self, namespace: Path = 'system'):
-        """List all Namespace Roles"""
+    def list(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Namespace Roles
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/web/namespaces/{namespace}/namespace_roles/{name}')
     def get(self, namespace: Path, name: Path,):
@@ -1,5 +1,5 @@
 """Module for Namespaces"""
-from uplink import Consumer, Path, Body, json, get, post # pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post # pylint: disable=unused-import
 from . import helper
 
 
@@ -7,11 +7,15 @@ from . import helper
 class NS(Consumer):
     """Class for Namespaces"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/namespaces')
-    def list(self):
-        """List all Namespaces"""
+    def list(self, stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Namespaces
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/web/namespaces/{name}')
     def get(self, name: Path):
@@ -2,7 +2,7 @@
 Module for Origin Pool
 https://docs.cloud.f5.com/docs-v2/api/views-origin-pool
 """
-from uplink import Consumer, Path, Body, get, post, put, delete, json  # pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, get, post, put, delete, json  # pylint: disable=unused-import
 from . import helper
 
 
@@ -17,12 +17,14 @@ class OriginPool(Consumer):
         Initialize the OriginPool Consumer.
         :param session: Session object with tenant URL and authentication.
         """
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/config/namespaces/{namespace}/origin_pools')
-    def list(self, namespace: Path):
+    def list(self, namespace: Path, stream: Context = False, model: Context = None, fields: Context = None):
         """
         List all Origin Pools in a namespace.
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
         """
 
     @get('/api/config/namespaces/{namespace}/origin_pools/{name}')
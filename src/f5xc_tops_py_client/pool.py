@@ -0,0 +1,110 @@
+"""
+Module providing a pool of Sessions across many tenants
+  pool = SessionPool({'https://a.console.ves.volterra.io': token_a, ...})
+  for r in pool.map(lambda api: len(User(api).list())):
+      print(r.item, r.result, r.error)
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .session import Session, _HTTPAdapter
+from .fanout import BulkReport, ItemResult
+from . import helper
+
+
+class SessionPool:
+    """
+    Sessions keyed by tenant URL, created and validated on first use
+    tokens: {tenant_url: api_token}, more can be added with add()
+    max_concurrency: requests in flight across all tenants
+    pool_maxsize: connections kept per tenant, pool_connections: tenants kept
+    keepalive, timeout and policies: see Session; without a limiter
+    every Session gets its own, since rate limits are per tenant
+    """
+    def __init__(self, tokens: dict = None, max_concurrency: int = 32, pool_maxsize: int = 10, pool_connections: int = 100, keepalive=60, timeout=(10, 60), **policies): # pylint: disable=too-many-arguments,line-too-long
+        self._tokens = {}
+        self._sessions = {}
+        self._validated = {}
+        self._lock = threading.Lock()
+        self.budget = threading.BoundedSemaphore(max_concurrency)
+        self._adapter = _HTTPAdapter(
+            timeout=timeout,
+            keepalive=keepalive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize
+        )
+        self._policies = policies
+        for tenant_url, api_token in (tokens or {}).items():
+            self.add(tenant_url, api_token)
+
+    def add(self, tenant_url: str, api_token: str) -> str:
+        """Add a tenant, returns its normalized URL"""
+        tenant_url = Session.validate_url(tenant_url)
+        with self._lock:
+            self._tokens[tenant_url] = api_token
+            self._sessions.pop(tenant_url, None)
+            self._validated.pop(tenant_url, None)
+        return tenant_url
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self):
+        return iter(list(self._tokens))
+
+    def __getitem__(self, tenant_url: str) -> Session:
+        return self.session(tenant_url)
+
+    def session(self, tenant_url: str, validate: bool = True) -> Session:
+        """Session of a tenant, checking its token on first use when validate"""
+        tenant_url = Session.validate_url(tenant_url)
+        with self._lock:
+            if tenant_url not in self._tokens:
+                raise helper.TopsXCException(f"Unknown tenant {tenant_url}")
+            session = self._sessions.get(tenant_url)
+            if session is None:
+                session = Session(tenant_url, self._tokens[tenant_url], validate=False, budget=self.budget, **self._policies) # pylint: disable=line-too-long
+                session._session.mount('https://', self._adapter) # pylint: disable=protected-access
+                session._session.mount('http://', self._adapter) # pylint: disable=protected-access
+                self._sessions[tenant_url] = session
+                self._validated[tenant_url] = threading.Lock()
+            validated = self._validated[tenant_url]
+        if validate and validated is not None:
+            with validated:
+                if self._validated.get(tenant_url) is validated:
+                    session.whoami()
+                    self._validated[tenant_url] = None
+        return session
+
+    def validate(self, tenants: list = None, max_workers: int = 16) -> BulkReport:
+        """Check the tokens of tenants (default all) in parallel"""
+        return self.map(lambda session: None, tenants, max_workers)
+
+    def map(self, fn, tenants: list = None, max_workers: int = 16, validate: bool = True) -> BulkReport: # pylint: disable=line-too-long
+        """
+        Call fn(session) for each tenant (default all) concurrently,
+        returns a fanout.BulkReport of ItemResult(tenant_url, result, error)
+        in tenant order; any exception fails only its own tenant
+        validate: check each token on first use, in the tenant's worker
+        """
+        def run(tenant_url):
+            try:
+                return ItemResult(tenant_url, fn(self.session(tenant_url, validate)))
+            except Exception as e: # pylint: disable=broad-exception-caught
+                return ItemResult(tenant_url, error=e)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return BulkReport(executor.map(run, list(self) if tenants is None else tenants))
+
+    def close(self) -> None:
+        """Close every Session and the shared connections"""
+        with self._lock:
+            for session in self._sessions.values():
+                session._session.close() # pylint: disable=protected-access
+            self._sessions.clear()
+            self._validated.clear()
+        self._adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
@@ -0,0 +1,64 @@
+"""Module providing the tenant-wide rate limiter shared by a Session"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket drawn from by every Consumer on a Session
+    rate: tokens refilled per second
+    burst: bucket capacity
+    On a 429 the refill rate is halved (at most once per second, never
+    below min_rate) and then ramps back to rate over recovery seconds.
+    Safe to share between threads and asyncio tasks: callers are told how
+    long to wait rather than being blocked while the lock is held.
+    """
+    def __init__(self, rate: float = 1.0, burst: int = 50, min_rate: float = 0.1, recovery: float = 30.0, clock=time.monotonic): # pylint: disable=too-many-arguments,line-too-long
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._current_rate = rate
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._last_throttle = None
+
+    @property
+    def current_rate(self) -> float:
+        """Refill rate in effect, lower than rate after 429s"""
+        with self._lock:
+            self._refill()
+            return self._current_rate
+
+    def reserve(self) -> float:
+        """Take a token, returns seconds to wait before using it"""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._current_rate
+
+    def throttled(self) -> None:
+        """Record a 429 from the tenant"""
+        with self._lock:
+            self._refill()
+            now = self._clock()
+            if self._last_throttle is not None and now - self._last_throttle < 1.0:
+                return
+            self._last_throttle = now
+            self._current_rate = max(self.min_rate, self._current_rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        """Add tokens and recover rate for the time elapsed, lock must be held"""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self._current_rate < self.rate:
+            self._current_rate = min(self.rate, self._current_rate + elapsed * self.rate / self.recovery) # pylint: disable=line-too-long
+        elif self._current_rate > self.rate:
+            self._current_rate = self.rate
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._current_rate)
@@ -0,0 +1,98 @@
+"""
+Module reconciling groups, their namespace roles and members with a desired state
+  desired = {'devops': {'namespace_roles': [{'namespace': 'app', 'role': 'ves-io-admin'}],
+                        'usernames': ['jane@example.com']}}
+  report = reconcile(api, desired)
+Groups missing from desired are left untouched, as are the roles or members
+of a group whose namespace_roles or usernames key is left out.
+"""
+from typing import NamedTuple
+from .group import Group
+from .user import User
+from .fanout import bulk, BulkReport, ItemResult
+from .snapshot import TenantSnapshot
+
+
+class Change(NamedTuple):
+    """
+    One write needed to reach the desired state
+    action: 'create', 'role_assign', 'role_remove' or 'group' (a user's groups)
+    """
+    action: str
+    name: str
+    payload: dict
+
+
+def plan(desired: dict, groups: list, users: list) -> list:
+    """
+    Minimal list of Changes turning groups and users into desired
+    desired: {group name: {'namespace_roles': [...], 'usernames': [...]}}
+    a group's roles or members are only managed when their key is given
+    """
+    current = {group['name']: group for group in groups}
+    changes = []
+    for name, spec in desired.items():
+        group = current.get(name)
+        wanted = _roles(spec.get('namespace_roles', []))
+        if group is None:
+            changes.append(Change('create', name, Group.create_payload(
+                name, spec.get('description', ''), spec.get('display_name', name), _role_list(wanted), []
+            )))
+            continue
+        if 'namespace_roles' not in spec:
+            continue
+        have = _roles(group.get('namespace_roles', []))
+        if wanted - have:
+            payload = Group.role_payload(name, _role_list(wanted - have))
+            changes.append(Change('role_assign', name, payload))
+        if have - wanted:
+            payload = Group.role_payload(name, _role_list(have - wanted))
+            changes.append(Change('role_remove', name, payload))
+    members = {name: set(spec['usernames']) for name, spec in desired.items() if 'usernames' in spec}
+    for user in users:
+        email = user.get('email') or user.get('name')
+        have = set(user.get('group_names') or [])
+        wanted = {name for name in have if name not in members}
+        wanted.update(name for name, usernames in members.items() if email in usernames)
+        if wanted != have:
+            changes.append(Change('group', email, User.group_payload(email, sorted(wanted))))
+    return changes
+
+
+def reconcile(session, desired: dict, snapshot: TenantSnapshot = None, dry_run: bool = False, max_workers: int = 10) -> BulkReport: # pylint: disable=line-too-long
+    """
+    Bring groups in desired to their namespace_roles and usernames
+    from one snapshot of the tenant, sending only the needed writes in
+    parallel: new groups first, then role and membership changes
+    Returns a fanout.BulkReport of the Changes, empty when nothing changed
+    snapshot: TenantSnapshot to diff against, fetched when None
+    dry_run: report the planned Changes without sending them
+    """
+    if snapshot is None:
+        snapshot = TenantSnapshot(session, collections=('users', 'groups'))
+    changes = plan(desired, list(snapshot.groups.values()), list(snapshot.users.values()))
+    if dry_run:
+        return BulkReport(ItemResult(change) for change in changes)
+    group, user = Group(session), User(session)
+    calls = {
+        'create': lambda change: group.create(change.payload),
+        'role_assign': lambda change: group.role_assign(change.payload, name=change.name),
+        'role_remove': lambda change: group.role_remove(change.payload, name=change.name),
+        'group': lambda change: user.group(change.payload),
+    }
+
+    def apply(change):
+        return calls[change.action](change)
+    report = bulk(apply, [change for change in changes if change.action == 'create'], max_workers)
+    report.extend(bulk(apply, [change for change in changes if change.action != 'create'], max_workers))
+    return report
+
+
+def _roles(namespace_roles: list) -> set:
+    """namespace_roles as a set of (namespace, role)"""
+    return {(item['namespace'], item['role']) for item in namespace_roles}
+
+
+def _role_list(roles: set) -> list:
+    """(namespace, role) pairs back to namespace_roles"""
+    return [{'namespace': namespace, 'role': role} for namespace, role in sorted(roles)]
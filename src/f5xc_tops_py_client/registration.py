@@ -2,8 +2,9 @@
 Module for Registration Methods
 https://docs.cloud.f5.com/docs/api/registration
 """
-from uplink import Consumer, Path, Body, json, get, post #pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post #pylint: disable=unused-import
 from . import helper
+from .fanout import bulk_iter
 
 @helper.common_decorators
 class Registration(Consumer):
@@ -11,18 +12,24 @@ class Registration(Consumer):
     Class for Tenant Methods
     """
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/register/namespaces/{namespace}/registrations')
-    def list(self, namespace: Path ='system'):
-        """List Registrations"""
+    def list(self, namespace: Path ='system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List Registrations
+        model=models.RegistrationRecord or lazy.LazyRegistration returns records or lazy items instead of dicts
+        fields=['name', 'get_spec.state'] keeps only those (dotted) fields of each item
+        """
 
     @json
     @post('/api/register/namespaces/{namespace}/listregistrationsbystate')
-    def list_by_state(self, payload: Body, namespace: Path ='system'):
+    def list_by_state(self, payload: Body, namespace: Path ='system', model: Context = None, fields: Context = None):
         """
         List Registrations by state
         Use list_by_state_payload() to build Body
+        model=models.RegistrationRecord or lazy.LazyRegistration returns records or lazy items instead of dicts
+        fields=['name', 'get_spec.state'] keeps only those (dotted) fields of each item
         """
 
     @get('/api/register/namespaces/{namespace}/registrations/{name}')
@@ -37,6 +44,42 @@ class Registration(Consumer):
         Use approve_payload() to build Body
         """
 
+    def approve_all(self, filter=None, namespace: str = 'system', max_workers: int = 10): # pylint: disable=redefined-builtin
+        """
+        Approve NEW registrations, each get and approve running on a pool of
+        max_workers, yielding a fanout.ItemResult per registration as it finishes
+        ItemResult.result is 'approved', or 'skipped' when no longer NEW;
+        a registration without a name or passport fails only its own item
+        filter: cluster names to approve, a fnmatch pattern, a list of names
+          or a callable taking the cluster name; None approves all
+        """
+        match = helper.xc_name_filter(filter)
+        pending = self.list_by_state(self.list_by_state_payload('NEW', namespace), namespace=namespace)
+
+        def listed(item) -> bool:
+            cluster_name = self._listed_cluster_name(item)
+            return cluster_name is None or match(cluster_name)
+
+        def approve(item):
+            try:
+                name = self._get_reg_name(item)
+                obj = self.get(name, namespace=namespace)
+                cluster_name, passport = self._get_cluster_name(obj), self._get_passport(obj)
+            except (KeyError, TypeError) as e:
+                raise helper.TopsXCException(f"Registration without name or passport: {e!r}") from e
+            if not match(cluster_name):
+                return None
+            if self._get_state(obj) not in (None, 'NEW'):
+                return 'skipped'
+            self.approve(self.approve_payload(name, passport, namespace=namespace), name=name, namespace=namespace) # pylint: disable=line-too-long
+            return 'approved'
+
+        pending = [item for item in pending if listed(item)]
+
+        for result in bulk_iter(approve, pending, max_workers):
+            if result.result is not None or result.error is not None:
+                yield result
+
     @staticmethod
     def list_by_state_payload(state: str = 'NEW', namespace: str = 'system') -> dict:
         """
@@ -87,3 +130,25 @@ class Registration(Consumer):
         Takes a registration object, returns the passport
         """
         return obj['get_spec']['passport']['cluster_name']
+
+    @staticmethod
+    def _listed_cluster_name(obj: dict) -> str:
+        """
+        Takes a list_by_state item, returns the cluster name or None when not listed
+        """
+        passport = (obj.get('get_spec') or {}).get('passport')
+        return passport.get('cluster_name') if isinstance(passport, dict) else None
+
+    @staticmethod
+    def _get_state(obj: dict) -> str:
+        """
+        Takes a registration object, returns its state
+        get_spec.state first, status is a list on get responses and only
+        read when it is an object carrying current_state
+        """
+        state = (obj.get('get_spec') or {}).get('state')
+        status = obj.get('status')
+        if state is None and isinstance(status, dict):
+            state = status.get('current_state')
+        return state
+
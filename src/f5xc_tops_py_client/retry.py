@@ -0,0 +1,142 @@
+"""Module providing the retry policy and circuit breaker used by a Session"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+
+
+class RetryRule(NamedTuple):
+    """
+    Retry rule for one status code
+    attempts: max retries, backoff: base delay in seconds, cap: max single delay
+    """
+    attempts: int = 5
+    backoff: float = 2.0
+    cap: float = 20.0
+
+
+class RetryBudget:
+    """
+    Caps retries to a share of requests so retries can't multiply load
+    Every request deposits ratio tokens (up to ceiling), every retry withdraws one
+    """
+    def __init__(self, ratio: float = 0.2, minimum: float = 10.0, ceiling: float = 100.0):
+        self.ratio = ratio
+        self.ceiling = ceiling
+        self._balance = minimum
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a request"""
+        with self._lock:
+            self._balance = min(self.ceiling, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take budget for a retry, False when exhausted"""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Retry policy shared by every Consumer on a Session
+    rules: {status: RetryRule}, defaults to 429 and 503
+    max_delay: total seconds a request may spend waiting on retries
+    budget: RetryBudget shared by all requests, None for no budget
+    Retry-After from the server is honored (plus up to jitter seconds)
+    in place of the exponential backoff.
+    """
+    def __init__(self, rules: dict = None, max_delay: float = 20.0, budget: RetryBudget = None, jitter: float = 1.0): # pylint: disable=line-too-long
+        if rules is None:
+            rules = {429: RetryRule(), 503: RetryRule()}
+        self.rules = rules
+        self.max_delay = max_delay
+        self.budget = budget
+        self.jitter = jitter
+
+    def delay(self, status: int, attempt: int, headers, waited: float):
+        """
+        Seconds to wait before retry number attempt+1, None to stop retrying
+        waited: seconds already spent sleeping between retries of this request
+        """
+        rule = self.rules.get(status)
+        if rule is None or attempt >= rule.attempts:
+            return None
+        server_delay = retry_after(headers)
+        if server_delay is not None:
+            delay = server_delay + random.uniform(0, self.jitter)
+        else:
+            delay = random.uniform(0, min(rule.cap, rule.backoff * 2 ** attempt))
+        if waited + delay > self.max_delay:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Per call site circuit breaker
+    Opens after threshold consecutive failures (429, 5xx or client errors)
+    and fails fast for reset_timeout seconds, then lets one trial through
+    """
+    def __init__(self, threshold: int = 10, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = {}
+        self._opened = {}
+
+    def allow(self, site: str) -> bool:
+        """True when a request to site may be sent"""
+        with self._lock:
+            opened = self._opened.get(site)
+            if opened is None:
+                return True
+            if self._clock() - opened < self.reset_timeout:
+                return False
+            # half-open: one trial, the next failure re-opens
+            self._opened[site] = self._clock()
+            self._failures[site] = self.threshold - 1
+            return True
+
+    def record(self, site: str, failed: bool) -> None:
+        """Record the outcome of a request to site"""
+        with self._lock:
+            if not failed:
+                self._failures.pop(site, None)
+                self._opened.pop(site, None)
+                return
+            self._failures[site] = self._failures.get(site, 0) + 1
+            if self._failures[site] >= self.threshold:
+                self._opened[site] = self._clock()
+
+    def is_open(self, site: str) -> bool:
+        """True while site is failing fast"""
+        with self._lock:
+            opened = self._opened.get(site)
+            return opened is not None and self._clock() - opened < self.reset_timeout
+
+
+def retry_after(headers):
+    """Seconds from a Retry-After header (delta-seconds or HTTP-date), None if absent"""
+    value = headers.get('Retry-After') if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -2,7 +2,7 @@
 Module for Roles
 https://docs.cloud.f5.com/docs/api/role
 """
-from uplink import Consumer, Path, Body, json, get, post, put, delete # pylint: disable=unused-import
+from uplink import Consumer, Path, Context, Body, json, get, post, put, delete # pylint: disable=unused-import
 from . import helper
 
 
@@ -13,15 +13,23 @@ class Role(Consumer):
     "custom" endpoints in use for list(), get(), create()
     """
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/custom/namespaces/{namespace}/roles')
-    def list(self, namespace: Path ='system'):
-        """List all Roles"""
+    def list(self, namespace: Path ='system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Roles
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @get('/api/web/namespaces/{namespace}/roles')
-    def listv1(self, namespace: Path = 'system'):
-        """List all Roles"""
+    def listv1(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Roles
+        model=lazy.LazyObject returns lazily decoded items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @json
     @post('/api/web/custom/namespaces/{namespace}/roles')
@@ -1,25 +1,56 @@
 """Module providing XC session"""
+import asyncio
+import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from uplink import AiohttpClient
 from . import helper
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .codec import get_codec
+from .identity import Identity, whoami_cache
 
-class Session:
-    """Class providing request session with auth"""
-    def __init__(self, tenant_url=None, api_token=None, validate=True):
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+WHOAMI_PATH = '/api/web/custom/namespaces/system/whoami'
+
+class _BaseSession:
+    """
+    Tenant URL, token and request policies shared by every Consumer on a session
+    limiter: TokenBucket rate limiter
+    retry: RetryPolicy for retryable status codes
+    breaker: per call site CircuitBreaker, None (default) to disable
+    codec: JSON codec for bodies, see codec.get_codec()
+    cache: ResponseCache for GETs, None (default) to disable
+    validators: ValidatorStore for conditional GETs, None (default) to disable
+    budget: threading semaphore capping in-flight requests, can be shared
+      between sessions, None (default) for no cap; AsyncSession rejects it
+    instruments: instrument.Instrument objects told about every call,
+      e.g. [instrument.Metrics()]
+    """
+    _streaming = False
+
+    def __init__(self, tenant_url=None, api_token=None, limiter=None, retry=None, breaker=None, codec=None, cache=None, validators=None, budget=None, instruments=None): # pylint: disable=too-many-arguments,line-too-long
         self._tenant_url = self.validate_url(tenant_url)
         self._api_token = api_token
-        self._session = requests.Session()
-        self._session.headers.update({'Authorization': f'APIToken {self._api_token}'})
-        if validate:
-            self.whoami()
-
-    def whoami(self) -> None:
-        """Method to check if we have a valid session"""
-        try:
-            r = self._session.get(self._tenant_url + '/api/web/custom/namespaces/system/whoami')
-            r.raise_for_status()
-        except Exception as e:
-            raise helper.TopsXCException("Invalid Token") from e
+        self.limiter = limiter if limiter is not None else TokenBucket()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.breaker = breaker
+        self.codec = get_codec(codec)
+        self.cache = cache
+        self.validators = validators
+        self.budget = budget
+        self.instruments = list(instruments or [])
+        self.identity = None
+        self._pending_auth = False
+        self._hook = helper.SessionHook(self)
 
     @staticmethod
     def validate_url(url) -> str:
@@ -30,4 +61,217 @@ class Session:
         else:
             raise helper.TopsXCException("Invalid Tenant URL")
         return stripped_url
-        
\ No newline at end of file
+
+
+class Session(_BaseSession):
+    """
+    Class providing request session with auth
+    validate: True checks the token with whoami() now, 'lazy' lets the
+      first request double as the check (a 401 raises 'Invalid Token')
+    pool_connections: number of host pools kept
+    pool_maxsize: max connections kept per host, size it to your thread count
+    pool_block: wait for a free connection instead of opening a throwaway one
+    keepalive: idle seconds before TCP keep-alive probes, None to disable
+    timeout: (connect, read) seconds applied to every request
+    limiter, retry, breaker, codec, cache, validators, budget and instruments: see _BaseSession
+    list methods called with stream=True return a generator of items
+    """
+    _streaming = True
+
+    def __init__(self, tenant_url=None, api_token=None, validate=True, pool_connections=10, pool_maxsize=10, pool_block=False, keepalive=60, timeout=(10, 60), **policies): # pylint: disable=too-many-arguments,line-too-long
+        super().__init__(tenant_url, api_token, **policies)
+        self._session = requests.Session()
+        self._session.headers.update({'Authorization': f'APIToken {self._api_token}'})
+        adapter = _HTTPAdapter(
+            timeout=timeout,
+            keepalive=keepalive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._pending_auth = validate == 'lazy'
+        if validate and not self._pending_auth:
+            self.whoami()
+
+    def whoami(self) -> Identity:
+        """
+        Method to check if we have a valid session, returns the token Identity
+        Identities are cached process-wide for identity.whoami_cache.ttl seconds
+        """
+        identity = whoami_cache.get(self._tenant_url, self._api_token)
+        if identity is None:
+            try:
+                r = self._session.get(self._tenant_url + WHOAMI_PATH)
+                r.raise_for_status()
+                identity = Identity.from_json(self.codec.loads(r.content))
+            except Exception as e:
+                raise helper.TopsXCException("Invalid Token") from e
+            whoami_cache.put(self._tenant_url, self._api_token, identity)
+        self.identity = identity
+        self._pending_auth = False
+        return identity
+
+    def prewarm(self, connections: int) -> int:
+        """
+        Method to open connections to the tenant ahead of a batch job
+        Returns the number of connections opened
+        """
+        def warm(_):
+            try:
+                self._session.head(self._tenant_url).close()
+                return True
+            except requests.RequestException:
+                return False
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(warm, range(connections)))
+
+
+class _HTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keep-alive and a default timeout"""
+    def __init__(self, timeout=None, keepalive=None, **kwargs):
+        self._timeout = timeout
+        self._socket_options = list(HTTPConnection.default_socket_options)
+        if keepalive is not None:
+            self._socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            for option, value in [('TCP_KEEPIDLE', keepalive), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3)]:
+                if hasattr(socket, option):
+                    self._socket_options.append((socket.IPPROTO_TCP, getattr(socket, option), value))
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs): # pylint: disable=arguments-differ
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self._timeout
+        return super().send(request, **kwargs)
+
+
+class AsyncSession(_BaseSession):
+    """
+    Class providing asyncio request session with auth
+    Any Consumer built on an AsyncSession returns awaitables:
+      async with AsyncSession(tenant_url, api_token) as api:
+          r = await NS(api).list()
+    Token is validated on 'async with' entry when validate=True,
+    or by the first request when validate='lazy'
+    pool_maxsize: max connections per host
+    keepalive: seconds an idle connection is kept open
+    timeout: (connect, read) seconds applied to every request
+    limiter, retry, breaker, codec, cache, validators and instruments: see _BaseSession
+    Requires the optional 'aiohttp' dependency
+    """
+    def __init__(self, tenant_url=None, api_token=None, validate=True, pool_maxsize=100, keepalive=60, timeout=(10, 60), **policies): # pylint: disable=too-many-arguments,line-too-long
+        if aiohttp is None:
+            raise helper.TopsXCException("AsyncSession requires aiohttp")
+        if policies.get('budget') is not None:
+            raise helper.TopsXCException("AsyncSession does not take a budget, its blocking acquire would stall the event loop; cap in-flight requests with pool_maxsize") # pylint: disable=line-too-long
+        super().__init__(tenant_url, api_token, **policies)
+        self._validate = validate
+        self._pending_auth = validate == 'lazy'
+        self._session = _AiohttpClient(
+            connector={'limit_per_host': pool_maxsize, 'keepalive_timeout': keepalive},
+            headers={'Authorization': f'APIToken {self._api_token}'},
+            timeout=aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        )
+
+    async def __aenter__(self):
+        if self._validate and not self._pending_auth:
+            await self.whoami()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, tb):
+        await self.close()
+
+    async def whoami(self) -> Identity:
+        """Method to check if we have a valid session, returns the token Identity"""
+        identity = whoami_cache.get(self._tenant_url, self._api_token)
+        if identity is None:
+            try:
+                client = await self._session.session()
+                async with client.get(self._tenant_url + WHOAMI_PATH) as r:
+                    r.raise_for_status()
+                    identity = Identity.from_json(self.codec.loads(await r.read()))
+            except Exception as e:
+                raise helper.TopsXCException("Invalid Token") from e
+            whoami_cache.put(self._tenant_url, self._api_token, identity)
+        self.identity = identity
+        self._pending_auth = False
+        return identity
+
+    async def close(self) -> None:
+        """Method to close the underlying aiohttp session"""
+        await self._session.close()
+
+    async def prewarm(self, connections: int) -> int:
+        """
+        Method to open connections to the tenant ahead of a batch job
+        Returns the number of connections opened
+        """
+        client = await self._session.session()
+
+        async def warm():
+            try:
+                async with client.head(self._tenant_url):
+                    return True
+            except aiohttp.ClientError:
+                return False
+        return sum(await asyncio.gather(*[warm() for _ in range(connections)]))
+
+
+class _AiohttpClient(AiohttpClient):
+    """
+    uplink aiohttp adapter which reads the body once on the event loop,
+    so the sync helper.* response handlers run without a shadow thread
+    """
+    def __init__(self, connector=None, **kwargs):
+        super().__init__(**kwargs)
+        self._connector = connector or {}
+        self._sync_callback_adapter = _buffered_callback
+
+    def __del__(self):
+        """Sessions are closed by AsyncSession.close()"""
+
+    async def session(self):
+        """Returns the aiohttp session, created on the running loop"""
+        if not isinstance(self._session, aiohttp.ClientSession):
+            args, kwargs = self._session
+            connector = aiohttp.TCPConnector(**self._connector)
+            self._session = aiohttp.ClientSession(*args, connector=connector, **kwargs)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the aiohttp session if one was created"""
+        if isinstance(self._session, aiohttp.ClientSession):
+            await self._session.close()
+
+
+def _buffered_callback(callback):
+    """Wrap a sync response handler for use on the event loop"""
+    async def new_callback(response):
+        if isinstance(response, aiohttp.ClientResponse):
+            response = _BufferedResponse(response, await response.read())
+        return callback(response)
+    return new_callback
+
+
+class _BufferedResponse:
+    """Read aiohttp response that quacks like a requests.Response"""
+    def __init__(self, response, content: bytes):
+        self.status_code = response.status
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.content = content
+        self.__dict__.update({key: value for key, value in vars(response).items() if key.startswith('xc_')}) # pylint: disable=line-too-long
+
+    @property
+    def text(self) -> str:
+        """Body decoded as text"""
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        """Body decoded as JSON"""
+        return json.loads(self.content)
@@ -0,0 +1,149 @@
+"""
+Module providing an indexed in-memory snapshot of tenant users, groups and roles
+  snap = TenantSnapshot(api)
+  snap.users_with_role('ves-io-admin', 'app')
+  snap.groups_with_role('ves-io-admin')   # in any namespace
+"""
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from .user import User
+from .group import Group
+from .role import Role
+
+COLLECTIONS = ('users', 'groups', 'roles')
+
+
+class TenantSnapshot:
+    """
+    Users, groups and roles of a tenant fetched in parallel and indexed by
+    user email, group name, role name and namespace, with reverse indexes
+    from (namespace, role) to the users and groups holding it.
+    A user holds the roles bound to it directly and those of its groups.
+    collections: which of COLLECTIONS to fetch
+    """
+    def __init__(self, session, collections: tuple = COLLECTIONS):
+        self._session = session
+        self.users = {}
+        self.groups = {}
+        self.roles = {}
+        self._index()
+        if collections:
+            self.refresh(*collections)
+
+    @classmethod
+    def from_items(cls, users: list = (), groups: list = (), roles: list = ()):
+        """Snapshot of already fetched list() items"""
+        snap = cls(None, collections=())
+        snap._load({'users': users, 'groups': groups, 'roles': roles}) # pylint: disable=protected-access
+        return snap
+
+    def refresh(self, *collections) -> None:
+        """Re-fetch collections (all by default) in parallel and rebuild the indexes depending on them"""
+        fetch = {
+            'users': lambda: User(self._session).list(),
+            'groups': lambda: Group(self._session).list(),
+            'roles': lambda: Role(self._session).list(),
+        }
+        collections = collections or COLLECTIONS
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            futures = {name: executor.submit(fetch[name]) for name in collections}
+            self._load({name: future.result() for name, future in futures.items()})
+
+    def _load(self, results: dict) -> None:
+        """Replace the fetched collections and rebuild the indexes depending on them"""
+        if 'users' in results:
+            self.users = {_email(user): user for user in results['users']}
+        if 'groups' in results:
+            self.groups = {group['name']: group for group in results['groups']}
+        if 'roles' in results:
+            self.roles = {role['name']: role for role in results['roles']}
+        self._index(tuple(results))
+
+    def user(self, email: str) -> dict:
+        """User by email, None if unknown"""
+        return self.users.get(email)
+
+    def group(self, name: str) -> dict:
+        """Group by name, None if unknown"""
+        return self.groups.get(name)
+
+    def role(self, name: str) -> dict:
+        """Role by name, None if unknown"""
+        return self.roles.get(name)
+
+    def users_with_role(self, role: str, namespace: str = None) -> frozenset:
+        """Emails of users holding role in namespace, or in any namespace when None"""
+        return self._user_bindings.get((namespace, role), frozenset())
+
+    def groups_with_role(self, role: str, namespace: str = None) -> frozenset:
+        """Names of groups binding role in namespace, or in any namespace when None"""
+        return self._group_bindings.get((namespace, role), frozenset())
+
+    def roles_of(self, email: str) -> frozenset:
+        """(namespace, role) pairs held by a user"""
+        return self._user_roles.get(email, frozenset())
+
+    def members(self, group: str) -> frozenset:
+        """Emails of the users in a group"""
+        return self._members.get(group, frozenset())
+
+    def namespace_roles(self, namespace: str) -> frozenset:
+        """Roles bound to any user or group in namespace"""
+        return self._namespaces.get(namespace, frozenset())
+
+    def _index(self, collections: tuple = COLLECTIONS) -> None:
+        """
+        Rebuild the reverse indexes depending on collections: group bindings
+        on groups, the rest on users and groups, none on roles
+        Bindings are also indexed under (None, role) for 'any namespace'
+        """
+        if 'groups' in collections:
+            group_bindings = defaultdict(set)
+            for name, group in self.groups.items():
+                for namespace, role in _bindings(group):
+                    group_bindings[(namespace, role)].add(name)
+                    group_bindings[(None, role)].add(name)
+            self._group_bindings = _frozen(group_bindings)
+        if 'users' not in collections and 'groups' not in collections:
+            return
+        members = defaultdict(set)
+        for name, group in self.groups.items():
+            members[name].update(group.get('usernames') or [])
+        for email, user in self.users.items():
+            for name in user.get('group_names') or []:
+                members[name].add(email)
+        user_roles = defaultdict(set)
+        for email, user in self.users.items():
+            user_roles[email].update(_bindings(user))
+        for name, emails in members.items():
+            for email in emails:
+                user_roles[email].update(_bindings(self.groups.get(name, {})))
+        user_bindings = defaultdict(set)
+        namespaces = defaultdict(set)
+        for email, bindings in user_roles.items():
+            for namespace, role in bindings:
+                user_bindings[(namespace, role)].add(email)
+                user_bindings[(None, role)].add(email)
+                namespaces[namespace].add(role)
+        for namespace, role in self._group_bindings:
+            if namespace is not None:
+                namespaces[namespace].add(role)
+        self._members = _frozen(members)
+        self._user_roles = _frozen(user_roles)
+        self._user_bindings = _frozen(user_bindings)
+        self._namespaces = _frozen(namespaces)
+
+
+def _frozen(index: dict) -> dict:
+    """Index with its sets frozen, so lookups can hand them out"""
+    return {key: frozenset(values) for key, values in index.items()}
+
+
+def _email(user: dict) -> str:
+    """Email of a user item"""
+    return user.get('email') or user.get('name')
+
+
+def _bindings(item: dict) -> set:
+    """(namespace, role) pairs of a user or group item"""
+    return {(binding['namespace'], binding['role']) for binding in item.get('namespace_roles') or []}
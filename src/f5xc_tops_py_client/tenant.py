@@ -2,8 +2,9 @@
 Module for Tenant Methods
 https://docs.cloud.f5.com/docs/api/tenant
 """
-from datetime import datetime
-from uplink import Consumer, QueryMap, Path, Body, json, get, post, put, delete # pylint: disable=unused-import
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from uplink import Consumer, QueryMap, Path, Context, Body, json, get, post, put, delete # pylint: disable=unused-import
 from . import helper
 
 @helper.common_decorators
@@ -12,24 +13,28 @@ class Tenant(Consumer):
     Class for Tenant Methods
     """
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/namespaces/system/tenant/idm/events/last_login')
-    def last_login(self):
+    def last_login(self, stream: Context = False):
         """Lists last login for each user"""
 
     @get('/api/web/namespaces/system/tenant/idm/events/login')
-    def login_events(self, **params: QueryMap):
+    def login_events(self, stream: Context = False, **params: QueryMap):
         """
         Lists login events
         params:
           first: (int) offset
           max: (int) records in response
+        stream=True yields events as they are decoded
         """
 
     @get('api/web/namespaces/system/tenant/idm/users/inactive')
-    def list_inactive_users(self):
-        """Lists inactive users (90 days without login)"""
+    def list_inactive_users(self, stream: Context = False, fields: Context = None):
+        """
+        Lists inactive users (90 days without login)
+        fields=['email'] keeps only those (dotted) fields of each user
+        """
 
     @get('/api/web/namespaces/system/tenant/settings')
     def get_settings(self):
@@ -47,6 +52,30 @@ class Tenant(Consumer):
         Use login_events_in_tf_payload() to build Body
         """
 
+    def iter_login_events(self, since: datetime, until: datetime = None, page_size: int = 100):
+        """
+        Generator over login events between since and until (default now)
+        Pages through login_events_in_tf() and prefetches the next page
+        while the current one is consumed
+        """
+        if until is None:
+            until = datetime.now(timezone.utc)
+
+        def page(first: int) -> list:
+            events = self.login_events_in_tf(self.login_events_in_tf_payload(since, until, first, page_size)) # pylint: disable=line-too-long
+            return list(events.items()) if isinstance(events, dict) else events
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = 0
+            future = executor.submit(page, first)
+            while future is not None:
+                events = future.result()
+                future = None
+                if len(events) >= page_size:
+                    first += page_size
+                    future = executor.submit(page, first)
+                yield from events
+
     @staticmethod
     def login_events_in_tf_payload(start: datetime, end: datetime, first: int = 0, maximum: int = 0): # pylint: disable=line-too-long
         """Payload for login_events_in_tf"""
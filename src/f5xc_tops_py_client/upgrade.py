@@ -0,0 +1,179 @@
+"""
+Module orchestrating software and OS upgrades across a fleet of sites
+  fleet = FleetUpgrade(api, selector='ce-prod-*', sw_version='crt-20240329-2728', max_concurrent=20)
+  for event in fleet.run():
+      print(event.site, event.status, event.detail)
+"""
+import math
+import time
+from typing import NamedTuple
+from .xcsite import Site
+from . import helper
+
+
+class UpgradeEvent(NamedTuple):
+    """
+    Progress of one site, or of the fleet when site is None
+    status: 'skipped', 'started', 'done', 'failed', 'wave' or 'halted'
+    """
+    site: str
+    status: str
+    detail: str = ''
+
+
+def site_versions(item: dict) -> tuple:
+    """(software, os) versions of a Site.list() item"""
+    spec = item.get('get_spec') or item.get('spec') or {}
+    return spec.get('volterra_software_version'), spec.get('operating_system_version')
+
+
+def upgrade_failed(item: dict) -> bool:
+    """
+    True when a Site.list() item reports a failed upgrade: site_state FAILED,
+    or a software or OS status in a *FAILED state (needs report_status_fields)
+    """
+    spec = item.get('get_spec') or item.get('spec') or {}
+    if spec.get('site_state') == 'FAILED':
+        return True
+    for status in item.get('status_set') or []:
+        for name in ('volterra_software_status', 'operating_system_status'):
+            values = (status.get(name) or {}).values()
+            if any(isinstance(value, str) and value.endswith('FAILED') for value in values):
+                return True
+    return False
+
+
+class FleetUpgrade: # pylint: disable=too-many-instance-attributes
+    """
+    Upgrade selected sites to sw_version and/or os_version in waves
+    selector: site names to upgrade, see helper.xc_name_filter()
+    canary: sites upgraded alone first
+    waves: cumulative percentages of the remaining sites upgraded per wave
+    max_concurrent: cap on sites upgrading at once
+    max_failures: failed sites (int) or share of the fleet (float) halting the run,
+      at least one; 0 halts on the first failure
+    interval: seconds between status polls, each one Site.list() call for all sites
+    site_timeout: seconds a site may take before it is counted as failed
+    versions: callable returning (software, os) versions of a Site.list() item
+    failed: callable returning True when a Site.list() item reports a failed upgrade,
+      upgrade_failed() by default, None to rely on site_timeout alone
+    Software is upgraded before the OS on sites needing both.
+    On a session with a ResponseCache, give 'sites' a 0 ttl so polls are not cached.
+    """
+    def __init__(self, session, selector=None, sw_version: str = None, os_version: str = None, canary: int = 1, waves: tuple = (25, 100), max_concurrent: int = 10, max_failures=0.1, interval: float = 30.0, site_timeout: float = 3600.0, namespace: str = 'system', versions=site_versions, failed=upgrade_failed, clock=time.monotonic, sleep=time.sleep): # pylint: disable=too-many-arguments,too-many-locals,line-too-long
+        self._site = Site(session)
+        self.match = helper.xc_name_filter(selector)
+        self.sw_version = sw_version
+        self.os_version = os_version
+        self.canary = canary
+        self.waves = waves
+        self.max_concurrent = max_concurrent
+        self.max_failures = max_failures
+        self.interval = interval
+        self.site_timeout = site_timeout
+        self.namespace = namespace
+        self.versions = versions
+        self.failed = failed
+        self._clock = clock
+        self._sleep = sleep
+
+    def poll(self) -> dict:
+        """Site.list() items with status of the selected sites by name, in one call"""
+        items = self._site.list(namespace=self.namespace, report_fields='', report_status_fields='')
+        return {item['name']: item for item in items if self.match(item['name'])}
+
+    def steps(self, item: dict) -> list:
+        """Upgrades a site still needs, as ('sw' or 'os', version)"""
+        software, operating_system = self.versions(item)
+        steps = []
+        if self.sw_version is not None and software != self.sw_version:
+            steps.append(('sw', self.sw_version))
+        if self.os_version is not None and operating_system != self.os_version:
+            steps.append(('os', self.os_version))
+        return steps
+
+    def plan(self, names: list) -> list:
+        """Split site names into the canary wave and percentage waves"""
+        waves = [names[:self.canary]] if self.canary else []
+        rest = names[self.canary:]
+        done = 0
+        for percent in self.waves:
+            end = min(len(rest), math.ceil(len(rest) * percent / 100))
+            if end > done:
+                waves.append(rest[done:end])
+                done = end
+        if done < len(rest):
+            waves.append(rest[done:])
+        return [wave for wave in waves if wave]
+
+    def run(self):
+        """Generator of UpgradeEvents, ending when every wave finished or the run halted"""
+        sites = self.poll()
+        names = []
+        for name in sorted(sites):
+            if self.steps(sites[name]):
+                names.append(name)
+            else:
+                yield UpgradeEvent(name, 'skipped', 'already at target version')
+        limit = self.max_failures
+        if isinstance(limit, float):
+            limit = math.floor(limit * len(names))
+        limit = max(1, limit)
+        failures = 0
+        for number, wave in enumerate(self.plan(names)):
+            yield UpgradeEvent(None, 'wave', f"wave {number} of {len(wave)} sites")
+            queue = list(wave)
+            running = {}
+            while queue or running:
+                while queue and len(running) < self.max_concurrent:
+                    name = queue.pop(0)
+                    if not self.steps(sites[name]):
+                        yield UpgradeEvent(name, 'skipped', 'already at target version')
+                        continue
+                    event = self._start(name, sites[name], running)
+                    yield event
+                    failures += event.status == 'failed'
+                if failures >= limit:
+                    yield UpgradeEvent(None, 'halted', f"{failures} failed sites")
+                    return
+                if not running:
+                    continue
+                self._sleep(self.interval)
+                sites.update(self.poll())
+                for name in list(running):
+                    event = self._check(name, sites.get(name), running)
+                    if event is not None:
+                        yield event
+                        failures += event.status == 'failed'
+                if failures >= limit:
+                    yield UpgradeEvent(None, 'halted', f"{failures} failed sites")
+                    return
+
+    def _start(self, name: str, item: dict, running: dict) -> UpgradeEvent:
+        """Send the next upgrade of a site, tracking it in running"""
+        kind, version = self.steps(item)[0]
+        call = self._site.upgrade_sw if kind == 'sw' else self._site.upgrade_os
+        try:
+            call(Site.upgrade_payload(name, version, self.namespace), name=name, namespace=self.namespace) # pylint: disable=line-too-long
+        except helper.TopsXCException as e:
+            running.pop(name, None)
+            return UpgradeEvent(name, 'failed', str(e))
+        running[name] = (kind, self._clock())
+        return UpgradeEvent(name, 'started', f"{kind} {version}")
+
+    def _check(self, name: str, item: dict, running: dict) -> UpgradeEvent:
+        """Event for a running site from its polled item, None while upgrading"""
+        kind, started = running[name]
+        if item is not None and self.failed is not None and self.failed(item):
+            del running[name]
+            return UpgradeEvent(name, 'failed', f"{kind} upgrade failed")
+        steps = self.steps(item) if item is not None else [(kind, None)]
+        if not steps:
+            del running[name]
+            return UpgradeEvent(name, 'done')
+        if steps[0][0] != kind:
+            return self._start(name, item, running)
+        if self._clock() - started > self.site_timeout:
+            del running[name]
+            return UpgradeEvent(name, 'failed', f"{kind} upgrade timed out")
+        return None
@@ -2,19 +2,24 @@
 Module for Users
 https://docs.cloud.f5.com/docs/api/user
 """
-from uplink import Consumer, Path, Body, json, get, post, put
+from uplink import Consumer, Path, Context, Body, json, get, post, put
 from . import helper
+from .fanout import bulk
 
 
 @helper.common_decorators
 class User(Consumer):
     """Class for Users"""
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/web/custom/namespaces/{namespace}/user_roles')
-    def list(self, namespace: Path = 'system'):
-        """List all Users"""
+    def list(self, namespace: Path = 'system', stream: Context = False, model: Context = None, fields: Context = None):
+        """
+        List all Users
+        model=models.UserRecord or lazy.LazyUser returns records or lazy items instead of dicts
+        fields=['name', 'labels'] keeps only those (dotted) fields of each item
+        """
 
     @json
     @post('/api/web/custom/namespaces/{namespace}/user_roles')
@@ -48,6 +53,28 @@ class User(Consumer):
         Use update_payload() to build Body
         """
 
+    def bulk_create(self, payloads, namespace: str = 'system', max_workers: int = 10):
+        """
+        Create Users concurrently, returns a fanout.BulkReport
+        Groups set in create_payload(group_names=...) are applied by the
+        create itself, no group() call is needed
+        """
+        return bulk(lambda payload: self.create(payload, namespace=namespace), payloads, max_workers)
+
+    def bulk_update(self, payloads, namespace: str = 'system', max_workers: int = 10):
+        """
+        Update Users concurrently, returns a fanout.BulkReport
+        Use update_payload() to build each payload
+        """
+        return bulk(lambda payload: self.update(payload, namespace=namespace), payloads, max_workers)
+
+    def bulk_delete(self, payloads, namespace: str = 'system', max_workers: int = 10):
+        """
+        Delete Users concurrently, returns a fanout.BulkReport
+        Use delete_payload() to build each payload
+        """
+        return bulk(lambda payload: self.delete(payload, namespace=namespace), payloads, max_workers)
+
     @staticmethod
     def create_payload(
             email: str,
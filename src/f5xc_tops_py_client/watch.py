@@ -0,0 +1,191 @@
+"""
+Module for watching list endpoints for changes
+  for event in watch(Site(api).list, interval=30, report_status_fields=''):
+      print(event.type, event.key)
+"""
+import dataclasses
+import hashlib
+import json
+import queue
+import random
+import threading
+from typing import NamedTuple
+
+
+class WatchEvent(NamedTuple):
+    """
+    Change of one object between two polls
+    type: 'added', 'removed', 'modified', or 'error' with the exception as item;
+    polling goes on after an error
+    """
+    type: str
+    key: str
+    item: object
+
+
+def watch(call, interval: float = 30.0, key='name', jitter: float = 0.1, initial: bool = True, **kwargs): # pylint: disable=too-many-arguments,line-too-long
+    """
+    Subscription iterating WatchEvents for the items returned by call(**kwargs), e.g. Site(api).list
+    interval: seconds between polls, randomized by +/- jitter (a fraction)
+    key: item field (or callable on an item) identifying objects
+    initial: start with an 'added' event per object already present
+    Subscribers of the same call and kwargs share one poller thread,
+    polling at the shortest interval asked for.
+    Objects are compared by a hash of their content.
+    Close the Subscription (or use it as a context manager) to stop watching.
+    """
+    events = None
+    while events is None:
+        poller = _Poller.get(call, key, kwargs)
+        events = poller.subscribe(interval, jitter, initial)
+    return Subscription(poller, events)
+
+
+class Subscription:
+    """Iterator over the WatchEvents of one watch() subscriber"""
+    def __init__(self, poller, events: queue.Queue):
+        self._poller = poller
+        self._events = events
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> WatchEvent:
+        if self._closed:
+            raise StopIteration
+        return self._events.get()
+
+    def get(self, timeout: float = None) -> WatchEvent:
+        """Next event, None when none arrived within timeout seconds"""
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        """Stop receiving events"""
+        if not self._closed:
+            self._closed = True
+            self._poller.unsubscribe(self._events)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+def digest(item) -> bytes:
+    """Hash of an object's content, independent of key order"""
+    return hashlib.blake2b(json.dumps(item, sort_keys=True, separators=(',', ':'), default=_content).encode(), digest_size=16).digest() # pylint: disable=line-too-long
+
+
+def _content(value):
+    """JSON-able content of lazy objects and model records, for digest()"""
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+class _Poller:
+    """Background poll of one call, broadcasting diffs to subscriber queues"""
+    _pollers = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, call, key, kwargs: dict):
+        """Poller shared by every subscriber of call with kwargs"""
+        owner = getattr(call, '__self__', None)
+        base_url = getattr(getattr(owner, 'session', None), 'base_url', None)
+        name = (type(owner).__name__, base_url, getattr(call, '__name__', repr(call)), key, repr(sorted(kwargs.items()))) # pylint: disable=line-too-long
+        with cls._registry_lock:
+            poller = cls._pollers.get(name)
+            if poller is None:
+                poller = cls._pollers[name] = cls(name, call, key, kwargs)
+            return poller
+
+    def __init__(self, name, call, key, kwargs: dict):
+        self._name = name
+        self._call = call
+        self._key = key if callable(key) else lambda item: item[key]
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._state = None
+        self._interval = None
+        self._jitter = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, interval: float, jitter: float, initial: bool) -> queue.Queue:
+        """
+        Add a subscriber, returns the queue its events are put on,
+        None when the poller was stopped in the meantime
+        """
+        events = queue.Queue()
+        with self._lock:
+            if self._stop.is_set():
+                return None
+            self._interval = interval if self._interval is None else min(self._interval, interval)
+            self._jitter = max(self._jitter, jitter)
+            if initial and self._state is not None:
+                for key, (_, item) in self._state.items():
+                    events.put(WatchEvent('added', key, item))
+            self._subscribers.append((events, initial))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"watch-{self._name[2]}", daemon=True) # pylint: disable=line-too-long
+                self._thread.start()
+        return events
+
+    def unsubscribe(self, events: queue.Queue) -> None:
+        """Remove a subscriber, stopping the poller after the last one"""
+        with self._registry_lock, self._lock:
+            self._subscribers = [sub for sub in self._subscribers if sub[0] is not events]
+            if self._subscribers:
+                return
+            if self._pollers.get(self._name) is self:
+                del self._pollers[self._name]
+            self._stop.set()
+
+    def _run(self) -> None:
+        """Poll until the last subscriber leaves"""
+        while not self._stop.is_set():
+            try:
+                items = self._call(**self._kwargs)
+                state = {self._key(item): (digest(item), item) for item in items}
+            except Exception as e: # pylint: disable=broad-except
+                with self._lock:
+                    self._publish([WatchEvent('error', None, e)], False)
+            else:
+                with self._lock:
+                    first = self._state is None
+                    self._publish(self._diff(state), first)
+            delay = self._interval * (1 + random.uniform(-self._jitter, self._jitter))
+            self._stop.wait(max(0.0, delay))
+
+    def _diff(self, state: dict) -> list:
+        """Events turning the last state into state, lock must be held"""
+        previous, self._state = self._state, state
+        if previous is None:
+            return [WatchEvent('added', key, item) for key, (_, item) in state.items()]
+        events = [WatchEvent('removed', key, item) for key, (_, item) in previous.items() if key not in state] # pylint: disable=line-too-long
+        for key, (hashed, item) in state.items():
+            old = previous.get(key)
+            if old is None:
+                events.append(WatchEvent('added', key, item))
+            elif old[0] != hashed:
+                events.append(WatchEvent('modified', key, item))
+        return events
+
+    def _publish(self, events: list, first: bool) -> None:
+        """
+        Put events on every subscriber queue, the first poll only on
+        initial ones, lock must be held
+        """
+        for subscriber, initial in self._subscribers:
+            if initial or not first:
+                for event in events:
+                    subscriber.put(event)
@@ -2,7 +2,7 @@
 Module for XC Site Methods
 https://docs.cloud.f5.com/docs/api/site
 """
-from uplink import Consumer, Path, Body, Query, json, get, post #pylint: disable=unused-import
+from uplink import Consumer, Path, Body, Query, Context, json, get, post #pylint: disable=unused-import
 from . import helper
 
 @helper.common_decorators
@@ -11,11 +11,16 @@ class Site(Consumer):
     Class for Site Methods
     """
     def __init__(self, session):
-        super().__init__(base_url=session._tenant_url, client=session._session)
+        super().__init__(base_url=session._tenant_url, client=session._session, hooks=session._hook)
 
     @get('/api/config/namespaces/{namespace}/sites')
-    def list(self, namespace: Path ='system', report_fields: Query = None, report_status_fields: Query = None ): #pylint: disable=line-too-long
-        """List Sites"""
+    def list(self, namespace: Path ='system', report_fields: Query = None, report_status_fields: Query = None, stream: Context = False, model: Context = None, fields: Context = None): #pylint: disable=line-too-long
+        """
+        List Sites
+        model=models.SiteRecord or lazy.LazySite returns records or lazy items instead of dicts
+        fields=['name', 'get_spec.site_state'] keeps only those (dotted) fields of each item,
+        report_fields is sent for you when one starts with get_spec
+        """
 
     @get('/api/config/namespaces/{namespace}/sites/{name}')
     def get(self, name: Path, namespace: Path ='system'):
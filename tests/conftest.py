@@ -1,7 +1,9 @@
 """Common fixture(s) for test"""
 import os
 import pytest
-from orijenpy import session
+from f5xc_tops_py_client import session
+from f5xc_tops_py_client.mock_server import MockServer
+from f5xc_tops_py_client.ratelimit import TokenBucket
 
 @pytest.fixture(scope='session')
 def test_session():
@@ -13,4 +15,42 @@ def test_session():
     if None in [tenant_url, token]:
         raise EnvironmentError("Missing env variable(s) needed for testing.")
     api = session(tenant_url=tenant_url, api_token=token)
-    yield api
\ No newline at end of file
+    yield api
+
+
+@pytest.fixture
+def mock_server():
+    """
+    Offline stand-in XC tenant, see f5xc_tops_py_client.mock_server
+    """
+    with MockServer(items=20, item_size=256, seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def mock_session(mock_server):
+    """
+    Factory of sessions on the mock server, taking session() policies;
+    the limiter defaults to one too fast to slow tests down
+    """
+    def build(**policies):
+        policies.setdefault('limiter', TokenBucket(rate=1000, min_rate=1000))
+        return session(tenant_url=mock_server.url, api_token=mock_server.token, **policies)
+    return build
+
+
+class FakeClock:
+    """Manually advanced clock"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """
+    Manually advanced clock starting at 0, set fake_clock.now to move it
+    """
+    return FakeClock()
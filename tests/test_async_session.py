@@ -0,0 +1,68 @@
+"""AsyncSession tests, run offline against the mock server"""
+import asyncio
+import threading
+import pytest
+from f5xc_tops_py_client import ns, user
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.ratelimit import TokenBucket
+from f5xc_tops_py_client.retry import RetryPolicy, RetryRule
+from f5xc_tops_py_client.session import AsyncSession, WHOAMI_PATH
+
+pytest.importorskip('aiohttp')
+
+def run(coroutine):
+    """Function to run a coroutine to completion"""
+    return asyncio.run(coroutine)
+
+class TestAsyncSession:
+    """Class used to test AsyncSession"""
+
+    def test_list_get(self, mock_server):
+        """Method to test awaited list and get calls"""
+        async def calls():
+            async with AsyncSession(mock_server.url, mock_server.token, limiter=TokenBucket(rate=1000, min_rate=1000)) as api: # pylint: disable=line-too-long
+                listed = await ns(api).list()
+                return listed, await ns(api).get(listed[1]['name']), await user(api).list()
+        listed, item, users = run(calls())
+        assert len(listed) == 10 and item == listed[1] and len(users) == 20
+
+    def test_errors(self, mock_server):
+        """Method to test 4xx responses raise TopsXCException"""
+        async def calls():
+            async with AsyncSession(mock_server.url, mock_server.token, limiter=TokenBucket(rate=1000, min_rate=1000)) as api: # pylint: disable=line-too-long
+                await ns(api).get('nowhere')
+        with pytest.raises(TopsXCException):
+            run(calls())
+        assert mock_server.statuses[404] == 1
+
+    def test_retry(self, mock_server):
+        """Method to test 429 responses are retried"""
+        mock_server.retry_after = 0
+        mock_server.rate_429 = 1.0
+        async def calls():
+            api = AsyncSession(
+                mock_server.url, mock_server.token, validate=False, limiter=TokenBucket(rate=1000, min_rate=1000),
+                retry=RetryPolicy(rules={429: RetryRule(attempts=2)}, jitter=0)
+            )
+            try:
+                await ns(api).list()
+            finally:
+                await api.close()
+        with pytest.raises(TopsXCException):
+            run(calls())
+        assert mock_server.statuses[429] == 3
+
+    def test_lazy_validation(self, mock_server):
+        """Method to test validate='lazy' checks the token on the first request"""
+        async def calls(token):
+            async with AsyncSession(mock_server.url, token, validate='lazy', limiter=TokenBucket(rate=1000, min_rate=1000)) as api: # pylint: disable=line-too-long
+                return await ns(api).list()
+        assert len(run(calls(mock_server.token))) == 10
+        assert mock_server.requests[f"GET {WHOAMI_PATH}"] == 0
+        with pytest.raises(TopsXCException, match='Invalid Token'):
+            run(calls('bad-token'))
+
+    def test_budget(self):
+        """Method to test a blocking threading budget is rejected"""
+        with pytest.raises(TopsXCException, match='budget'):
+            AsyncSession('https://tenant.example.com', 'token', validate=False, budget=threading.BoundedSemaphore(2))
@@ -0,0 +1,74 @@
+"""ResponseCache tests"""
+from f5xc_tops_py_client.cache import ResponseCache, ValidatorStore, collection
+
+class FakeResponse:
+    """Response with a body and headers"""
+    def __init__(self, content: bytes):
+        self.content = content
+        self.headers = {}
+
+class TestCollection:
+    """Class used to test collection()"""
+
+    def test_collection(self):
+        """Method to test call sites map to the collection of their list"""
+        assert collection('GET /api/web/custom/namespaces/{namespace}/roles') == 'roles'
+        assert collection('DELETE /api/web/namespaces/{namespace}/roles/{name}') == 'roles'
+        assert collection('POST /api/web/custom/namespaces/{namespace}/users/cascade_delete') == 'user_roles'
+        assert collection('POST api/web/namespaces/{namespace}/renew/api_credentials') == 'api_credentials'
+        assert collection('POST /api/web/namespaces/{name}/cascade_delete') == 'namespaces'
+        assert collection('GET /api/web/namespaces') == 'namespaces'
+
+class TestResponseCache:
+    """Class used to test ResponseCache"""
+
+    def test_ttl(self, fake_clock):
+        """Method to test entries expire per collection ttl"""
+        cache = ResponseCache(ttl={'roles': 10, 'user_roles': 0}, default_ttl=1, clock=fake_clock)
+        cache.put('a', 'roles', FakeResponse(b'[]'), cache.generation('roles'))
+        cache.put('b', 'user_roles', FakeResponse(b'[]'), cache.generation('user_roles'))
+        cache.put('c', 'sites', FakeResponse(b'[]'), cache.generation('sites'))
+        assert cache.get('a').content == b'[]'
+        assert cache.get('b') is None
+        fake_clock.now = 5
+        assert cache.get('a') is not None
+        assert cache.get('c') is None
+        fake_clock.now = 10
+        assert cache.get('a') is None
+
+    def test_lru(self):
+        """Method to test least recently used entries are evicted over max_bytes"""
+        cache = ResponseCache(max_bytes=10)
+        for key in 'abc':
+            if key == 'c':
+                cache.get('a')
+            cache.put(key, 'roles', FakeResponse(b'1234'), cache.generation('roles'))
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+        assert cache.size == 8
+
+    def test_invalidate(self):
+        """Method to test writes drop their collection and racing GETs"""
+        cache = ResponseCache()
+        cache.put('a', 'user_groups', FakeResponse(b'[]'), cache.generation('user_groups'))
+        cache.put('b', 'roles', FakeResponse(b'[]'), cache.generation('roles'))
+        generation = cache.generation('user_groups')
+        cache.invalidate('user_roles')
+        assert cache.get('a') is None and cache.get('b') is not None
+        cache.put('a', 'user_groups', FakeResponse(b'[]'), generation)
+        assert cache.get('a') is None
+        cache.invalidate('namespaces')
+        assert len(cache) == 0
+
+class TestValidatorStore:
+    """Class used to test ValidatorStore"""
+
+    def test_validators(self):
+        """Method to test conditional headers are kept with the decoded body"""
+        store = ValidatorStore(max_entries=1)
+        store.put('a', {'ETag': '"1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}, {'items': []})
+        assert store.get('a') == ({'If-None-Match': '"1"', 'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT'}, {'items': []})
+        store.put('b', {'ETag': '"2"'}, {})
+        assert store.get('a') is None and len(store) == 1
+        store.put('b', {}, {})
+        assert store.get('b') is None
@@ -0,0 +1,51 @@
+"""Inactive user cleanup tests, run offline against the mock server"""
+from datetime import datetime, timedelta, timezone
+from f5xc_tops_py_client.cleanup import inactive_users, delete_inactive
+
+NOW = datetime.now(timezone.utc)
+
+def _user(email: str, days: int = None) -> dict:
+    """User last seen days ago, never when days is None"""
+    seen = None if days is None else (NOW - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return {'name': email, 'email': email, 'namespace': 'system', 'last_login_timestamp': seen}
+
+USERS = [
+    _user('recent@example.com', 10), _user('old@example.com', 200), _user('older@example.com', 400),
+    _user('svc@robots.example.com', 300), _user('never@example.com'),
+]
+
+def api_for(mock_server, mock_session):
+    """Function to build a session on the mock server holding USERS"""
+    mock_server.put('user_roles', USERS)
+    return mock_session()
+
+class TestCleanup:
+    """Class used to test inactive_users() and delete_inactive()"""
+
+    def test_inactive_users(self, mock_server, mock_session):
+        """Method to test the threshold, allow-list and include_never"""
+        api = api_for(mock_server, mock_session)
+        found = {user.email: user.last_login for user in inactive_users(api, days=90, allow=['*@robots.example.com'])}
+        assert sorted(found) == ['old@example.com', 'older@example.com']
+        assert found['old@example.com'] < NOW - timedelta(days=90)
+        assert [user.email for user in inactive_users(api, days=300, allow=['*@ROBOTS.example.com'])] == ['older@example.com'] # pylint: disable=line-too-long
+        never = {user.email: user.last_login for user in inactive_users(api, days=90, include_never=True)}
+        assert never['never@example.com'] is None and 'svc@robots.example.com' in never and len(never) == 4
+
+    def test_unreadable(self, mock_server, mock_session):
+        """Method to test users without an email or a readable login time are skipped"""
+        nameless = {'metadata': {'name': 'ghost'}, 'namespace': 'system', 'last_login_timestamp': '2020-01-01T00:00:00Z'}
+        unreadable = dict(_user('bad@example.com'), last_login_timestamp='last tuesday')
+        api = api_for(mock_server, mock_session)
+        mock_server.put('user_roles', USERS + [nameless, unreadable])
+        found = [user.email for user in inactive_users(api, days=90, include_never=True)]
+        assert sorted(found) == ['never@example.com', 'old@example.com', 'older@example.com', 'svc@robots.example.com']
+
+    def test_delete_inactive(self, mock_server, mock_session):
+        """Method to test dry_run only reports and a real run deletes"""
+        api = api_for(mock_server, mock_session)
+        planned = sorted(r.item.email for r in delete_inactive(api, days=90, allow=['svc@*']))
+        assert planned == ['old@example.com', 'older@example.com'] and len(mock_server.objects('user_roles')) == 5
+        results = list(delete_inactive(api, days=90, allow=['svc@*'], dry_run=False, max_workers=2))
+        assert sorted(r.item.email for r in results) == planned and all(r.ok for r in results)
+        assert sorted(mock_server.objects('user_roles')) == ['never@example.com', 'recent@example.com', 'svc@robots.example.com'] # pylint: disable=line-too-long
@@ -0,0 +1,22 @@
+"""Codec tests"""
+import pytest
+from f5xc_tops_py_client import codec, helper
+
+class TestCodec:
+    """Class used to test JSON codecs"""
+
+    @pytest.mark.parametrize('name', list(codec.available_codecs()))
+    def test_round_trip(self, name):
+        """Method to test every installed codec round trips a payload"""
+        c = codec.get_codec(name)
+        payload = {'items': [{'name': 'é中', 'n': 1, 'ok': True, 'none': None}]}
+        assert isinstance(c.dumps(payload), bytes)
+        assert c.loads(c.dumps(payload)) == payload
+
+    def test_get_codec(self):
+        """Method to test codec resolution"""
+        assert codec.get_codec().name == next(iter(codec.available_codecs()))
+        custom = codec.JSONCodec()
+        assert codec.get_codec(custom) is custom
+        with pytest.raises(helper.TopsXCException):
+            codec.get_codec('yaml')
@@ -1,6 +1,6 @@
 """Cred classes tests"""
 import pytest
-from orijenpy import apicred, svccred
+from f5xc_tops_py_client import apicred, svccred
 
 @pytest.mark.usefixtures("test_session")
 class TestAPIcred:
@@ -0,0 +1,96 @@
+"""Fan-out and bulk tests"""
+import asyncio
+import threading
+import pytest
+from f5xc_tops_py_client import http_loadbalancer
+from f5xc_tops_py_client.fanout import bulk, bulk_iter, fan_out, async_fan_out
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.ratelimit import TokenBucket
+from f5xc_tops_py_client.session import AsyncSession
+
+def tracked(max_workers: int, failing: str):
+    """
+    Consumer wrapping http_loadbalancer, failing for one namespace; calls
+    block until max_workers of them overlap, the peak is kept in state
+    """
+    lock = threading.Lock()
+    release = threading.Event()
+    state = {'running': 0, 'peak': 0}
+
+    class Tracked:
+        """http_loadbalancer with tracked list() calls"""
+        def __init__(self, api):
+            self._lb = http_loadbalancer(api)
+
+        def list(self, namespace: str):
+            """list() of one namespace"""
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+                if state['running'] >= max_workers:
+                    release.set()
+            try:
+                release.wait(2)
+                if namespace == failing:
+                    raise TopsXCException(f"failed {namespace}")
+                return self._lb.list(namespace=namespace)
+            finally:
+                with lock:
+                    state['running'] -= 1
+
+    return Tracked, state
+
+class TestFanOut:
+    """Class used to test fan_out() and async_fan_out()"""
+
+    def test_fan_out(self, mock_server, mock_session):
+        """Method to test all namespaces are listed, errors tagged per namespace, max_workers bounds calls"""
+        api = mock_session()
+        consumer, state = tracked(3, 'ns-003')
+        results = {r.namespace: r for r in fan_out(api, consumer, max_workers=3)}
+        assert sorted(results) == sorted(['system'] + [f"ns-{i:03d}" for i in range(1, 10)])
+        assert str(results['ns-003'].error) == 'failed ns-003' and results['ns-003'].items == []
+        assert all(len(r.items) == 20 for name, r in results.items() if name != 'ns-003')
+        assert state['peak'] == 3
+
+    def test_async_fan_out(self, mock_server):
+        """Method to test async_fan_out() over all namespaces with max_workers in flight"""
+        pytest.importorskip('aiohttp')
+        async def calls():
+            async with AsyncSession(mock_server.url, mock_server.token, limiter=TokenBucket(rate=1000, min_rate=1000)) as api: # pylint: disable=line-too-long
+                return [r async for r in async_fan_out(api, http_loadbalancer, max_workers=3)]
+        results = asyncio.run(calls())
+        assert len(results) == 10 and all(r.error is None and len(r.items) == 20 for r in results)
+
+class TestBulk:
+    """Class used to test bulk()"""
+
+    def test_report(self):
+        """Method to test failures are reported per item in input order"""
+        def call(item):
+            if item % 3 == 0:
+                raise TopsXCException(f"failed {item}")
+            return item * 2
+        report = bulk(call, range(10), max_workers=4)
+        assert [r.item for r in report] == list(range(10))
+        assert [r.result for r in report.succeeded] == [2, 4, 8, 10, 14, 16]
+        assert [str(r.error) for r in report.failed] == ['failed 0', 'failed 3', 'failed 6', 'failed 9']
+
+    def test_iter(self):
+        """Method to test lazy items are pulled with max_workers calls overlapping, and no more"""
+        lock = threading.Lock()
+        release = threading.Event()
+        state = {'running': 0, 'peak': 0}
+        def call(item):
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+                if state['running'] >= 3:
+                    release.set()
+            release.wait(2)
+            with lock:
+                state['running'] -= 1
+            return item
+        results = list(bulk_iter(call, iter(range(50)), max_workers=3))
+        assert sorted(r.result for r in results) == list(range(50))
+        assert state['peak'] == 3
@@ -1,6 +1,6 @@
 """Group Class Tests"""
 import pytest
-from orijenpy import group
+from f5xc_tops_py_client import group
 
 @pytest.mark.usefixtures("test_session")
 class TestGroup:
@@ -0,0 +1,52 @@
+"""Helper function tests"""
+import json
+import pytest
+from f5xc_tops_py_client import helper
+
+class FakeResponse:
+    """Streamed response serving a body in fixed size chunks"""
+    def __init__(self, body: bytes, size: int):
+        self._body = body
+        self._size = size
+        self.closed = False
+
+    def iter_content(self, chunk_size):  # pylint: disable=unused-argument
+        """Method to yield the body in chunks"""
+        for i in range(0, len(self._body), self._size):
+            yield self._body[i:i + self._size]
+
+    def close(self):
+        """Method to close the response"""
+        self.closed = True
+
+class TestStreamItems:
+    """Class used to test xc_stream_items()"""
+
+    @pytest.mark.parametrize('size', [1, 7, 4096])
+    def test_items(self, size):
+        """Method to test list elements are yielded across chunk boundaries"""
+        items = [{'name': f'site-{i}', 'n': 10 ** i, 's': 'é中'} for i in range(12)]
+        body = json.dumps({'meta': {'items': [0]}, 'items': items, 'tail': None}).encode()
+        response = FakeResponse(body, size)
+        assert list(helper.xc_stream_items(response)) == items
+        assert response.closed
+
+    def test_map(self):
+        """Method to test map entries are yielded as pairs"""
+        body = b'{"login_events_map": {"a": [1], "b": {"c": true}}}'
+        assert list(helper.xc_stream_items(FakeResponse(body, 3))) == [('a', [1]), ('b', {'c': True})]
+
+    def test_not_json(self):
+        """Method to test invalid bodies raise TopsXCException"""
+        with pytest.raises(helper.TopsXCException):
+            list(helper.xc_stream_items(FakeResponse(b'{"items": [1, }', 2)))
+
+class TestNameFilter:
+    """Class used to test xc_name_filter()"""
+
+    def test_filter(self):
+        """Method to test each selector form"""
+        assert helper.xc_name_filter(None)('any')
+        assert helper.xc_name_filter('ce-*')('ce-1') and not helper.xc_name_filter('ce-*')('lab-1')
+        assert helper.xc_name_filter(['ce-1'])('ce-1') and not helper.xc_name_filter(['ce-1'])('ce-2')
+        assert helper.xc_name_filter(lambda name: name.endswith('1'))('ce-1')
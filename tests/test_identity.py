@@ -0,0 +1,29 @@
+"""Identity and WhoamiCache tests"""
+from f5xc_tops_py_client.identity import Identity, WhoamiCache
+
+WHOAMI = {
+    'email': 'jane@example.com',
+    'tenant': 'acme',
+    'namespace_access': {'namespace_role_map': {'system': {'roles': ['ves-io-admin']}, 'app': {}}},
+}
+
+class TestIdentity:
+    """Class used to test Identity parsing and WhoamiCache"""
+
+    def test_parse(self):
+        """Method to test whoami responses are parsed"""
+        identity = Identity.from_json(WHOAMI)
+        assert identity.email == 'jane@example.com' and identity.tenant == 'acme'
+        assert identity.has_role('system', 'ves-io-admin')
+        assert identity.roles('app') == () and identity.roles('other') == ()
+
+    def test_cache(self, fake_clock):
+        """Method to test identities expire and are keyed on URL and token"""
+        cache = WhoamiCache(ttl=10, clock=fake_clock)
+        identity = Identity.from_json(WHOAMI)
+        cache.put('https://a', 'token', identity)
+        assert cache.get('https://a', 'token') is identity
+        assert cache.get('https://a', 'other') is None
+        assert 'token' not in WhoamiCache.key('https://a', 'token')
+        fake_clock.now = 10
+        assert cache.get('https://a', 'token') is None
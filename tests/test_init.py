@@ -0,0 +1,27 @@
+"""Package level lazy import tests"""
+import subprocess
+import sys
+
+def run(statement: str) -> str:
+    """Output of statement run in a fresh interpreter"""
+    return subprocess.run([sys.executable, '-c', statement], check=True, capture_output=True, text=True).stdout.strip()
+
+class TestInit:
+    """Class used to test the package loads submodules lazily"""
+
+    def test_lazy(self):
+        """Method to test importing the package loads no submodule or excepthook"""
+        out = run("import sys, f5xc_tops_py_client; "
+                  "print(sorted(m for m in sys.modules if m.startswith('f5xc_tops_py_client.')), sys.excepthook is sys.__excepthook__)")
+        assert out == '[] True'
+
+    def test_aliases(self):
+        """Method to test aliases keep pointing at classes once their submodule is imported"""
+        out = run("import f5xc_tops_py_client as f; from f5xc_tops_py_client import fanout, user, session; "
+                  "import f5xc_tops_py_client.ns; print(f.ns.__name__, user.__name__, session.__name__)")
+        assert out == 'NS User Session'
+
+    def test_unknown(self):
+        """Method to test unknown names raise AttributeError"""
+        out = run("import f5xc_tops_py_client as f\ntry:\n    f.nope\nexcept AttributeError:\n    print('ok')")
+        assert out == 'ok'
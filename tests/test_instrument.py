@@ -0,0 +1,96 @@
+"""Instrumentation tests, run offline against the mock server"""
+import pytest
+from f5xc_tops_py_client import session, ns, user, ResponseCache
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.instrument import Histogram, Instrument, Metrics, PrometheusExporter, RequestEvent, prometheus_client # pylint: disable=line-too-long
+from f5xc_tops_py_client.retry import RetryPolicy, CircuitBreaker
+
+class Recorder(Instrument):
+    """Instrument keeping every hook call"""
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, endpoint, url):
+        self.calls.append(('before', endpoint))
+
+    def after_request(self, event):
+        self.calls.append(('after', event))
+
+class TestInstrument:
+    """Class used to test RequestEvents and the Metrics aggregator"""
+
+    def test_histogram(self):
+        """Method to test quantiles are estimated within their bucket"""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1] and histogram.mean == pytest.approx(0.65)
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert 0.1 < histogram.quantile(0.75) <= 1.0
+
+    def test_event(self):
+        """Method to test an event splits its endpoint and network time"""
+        event = RequestEvent('GET /api/web/namespaces', 200, elapsed=1.0, decode=0.1, limiter_wait=0.2, retry_wait=0.3) # pylint: disable=line-too-long
+        assert event.method == 'GET' and event.template == '/api/web/namespaces'
+        assert event.network == pytest.approx(0.4)
+
+    def test_hooks(self, mock_server, mock_session):
+        """Method to test hooks see each call once, including retries and cache hits"""
+        mock_server.rate_429 = 0.5
+        mock_server.retry_after = 0
+        recorder = Recorder()
+        api = mock_session(instruments=[recorder], cache=ResponseCache(), retry=RetryPolicy(jitter=0))
+        ns(api).list()
+        ns(api).list()
+        assert [call[0] for call in recorder.calls] == ['before', 'after', 'before', 'after']
+        sent, cached = recorder.calls[1][1], recorder.calls[3][1]
+        assert sent.status == 200 and not sent.cached and sent.bytes_received > 0
+        assert sent.retries == sent.throttled == mock_server.requests['GET /api/web/namespaces'] - 1
+        assert cached.cached and cached.retries == 0
+
+    def test_metrics(self, mock_server, mock_session):
+        """Method to test calls, errors and bytes are aggregated per endpoint"""
+        metrics = Metrics()
+        api = mock_session(instruments=[metrics])
+        payload = user.create_payload('new@example.com', 'New', 'User')
+        user(api).create(payload)
+        with pytest.raises(TopsXCException):
+            user(api).create(payload)
+        for _ in range(3):
+            user(api).list()
+        create = metrics.snapshot()['POST /api/web/custom/namespaces/{namespace}/user_roles']
+        assert create['calls'] == 2 and create['errors'] == 1 and create['statuses'] == {200: 1, 409: 1}
+        assert create['bytes_sent'] > 0
+        assert metrics['GET /api/web/custom/namespaces/{namespace}/user_roles'].latency.count == 3
+        assert 'user_roles' in metrics.report()
+
+    def test_connection_error(self):
+        """Method to test failed calls are reported with their error"""
+        metrics = Metrics()
+        api = session(tenant_url='http://127.0.0.1:9', api_token='token', validate=False, instruments=[metrics])
+        with pytest.raises(TopsXCException):
+            ns(api).list()
+        stats = metrics['GET /api/web/namespaces']
+        assert stats.errors == 1 and stats.statuses == {None: 1}
+
+    def test_raised_in_hooks(self, mock_server, mock_session):
+        """Method to test calls failing with 'Circuit open' or 'Invalid Token' are reported"""
+        metrics = Metrics()
+        mock_server.rate_429 = 1.0
+        api = mock_session(instruments=[metrics], retry=RetryPolicy(rules={}), breaker=CircuitBreaker(threshold=1))
+        for message in ('429', 'Circuit open', 'Circuit open'):
+            with pytest.raises(TopsXCException, match=message):
+                ns(api).list()
+        stats = metrics['GET /api/web/namespaces']
+        assert stats.calls == 3 and stats.errors == 3 and stats.statuses == {429: 1, None: 2}
+        mock_server.rate_429 = 0.0
+        bad = session(tenant_url=mock_server.url, api_token='bad-token', validate='lazy', instruments=[metrics])
+        with pytest.raises(TopsXCException, match='Invalid Token'):
+            ns(bad).list()
+        assert metrics['GET /api/web/namespaces'].statuses[401] == 1
+
+    @pytest.mark.skipif(prometheus_client is not None, reason='prometheus-client installed')
+    def test_exporter_missing(self):
+        """Method to test exporters need their optional dependency"""
+        with pytest.raises(TopsXCException):
+            PrometheusExporter()
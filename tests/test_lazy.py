@@ -0,0 +1,54 @@
+"""Lazy response wrapper tests, run offline"""
+import pytest
+from f5xc_tops_py_client import site, registration, ns
+from f5xc_tops_py_client.codec import get_codec
+from f5xc_tops_py_client.lazy import LazyObject, LazySite, LazyRegistration
+
+SITE = {
+    'name': 'ce1',
+    'labels': {'region': 'eu'},
+    'get_spec': {'site_state': 'ONLINE', 'volterra_software_version': 'crt-1', 'main_nodes': [{'name': 'node-0'}]},
+    'status_set': None,
+}
+
+class TestLazy:
+    """Class used to test lazily decoded response items"""
+
+    def test_fields(self):
+        """Method to test fields read as attributes and keys, nested objects stay lazy"""
+        codec = get_codec()
+        item = LazySite.decode_list(codec.dumps({'items': [SITE]}), codec)[0]
+        assert item.name == 'ce1' and item['labels']['region'] == 'eu'
+        assert item.state == 'ONLINE' and item.versions == ('crt-1', None)
+        assert isinstance(item.get_spec, LazyObject) and item.get_spec is item.get_spec
+        assert item.get_spec.main_nodes[0].name == 'node-0'
+        assert item.get('status_set', []) == [] and 'status_set' in item and 'nope' not in item
+        assert item.to_dict() == SITE and item == SITE
+        with pytest.raises(AttributeError):
+            item.nope
+        with pytest.raises(KeyError):
+            item['nope'] # pylint: disable=pointless-statement
+
+    def test_from_dict(self):
+        """Method to test wrappers of decoded items behave the same"""
+        item = LazySite.from_dict(SITE)
+        assert item.state == 'ONLINE' and item.get_spec.main_nodes[0].name == 'node-0'
+        assert item.to_dict() == SITE
+
+    def test_registration_status(self):
+        """Method to test the registration state with status as XC returns it, a list"""
+        codec = get_codec()
+        item = {'name': 'r1', 'get_spec': {'state': 'NEW'}, 'status': []}
+        assert LazyRegistration.from_dict(item).state == 'NEW'
+        assert LazyRegistration.decode_list(codec.dumps({'items': [item]}), codec)[0].state == 'NEW'
+        assert LazyRegistration.from_dict({'status': [], 'get_spec': None}).cluster_name is None
+
+    def test_list(self, mock_server, mock_session):
+        """Method to test list(model=...) returns lazy items"""
+        mock_server.put('registrations', [{'name': 'r1', 'get_spec': {'state': 'NEW', 'passport': {'cluster_name': 'ce1'}}}]) # pylint: disable=line-too-long
+        api = mock_session()
+        pending = registration(api).list(model=LazyRegistration)
+        assert pending[0].cluster_name == 'ce1' and pending[0].state == 'NEW'
+        assert pending[0].passport == {'cluster_name': 'ce1'}
+        assert [item.name for item in ns(api).list(model=LazyObject)][0] == 'system'
+        assert all(isinstance(item, LazySite) for item in site(api).list(stream=True, model=LazySite))
@@ -0,0 +1,63 @@
+"""MockServer tests, run offline"""
+from datetime import datetime
+import pytest
+from f5xc_tops_py_client import session, user, ns, http_loadbalancer, tenant, ValidatorStore
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.retry import RetryPolicy, RetryRule
+from f5xc_tops_py_client.mock_server import consumer_routes
+
+class TestMockServer:
+    """Class used to test the offline XC stand-in"""
+
+    def test_routes(self):
+        """Method to test every Consumer endpoint is routed"""
+        routes = consumer_routes()
+        endpoints = {route.endpoint for route in routes}
+        assert 'GET /api/web/custom/namespaces/{namespace}/user_roles' in endpoints
+        assert 'POST /api/web/namespaces/{namespace}/renew/api_credentials' in endpoints
+        literal = next(route for route in routes if route.template.endswith('/tenant/settings'))
+        assert routes.index(literal) < len([route for route in routes if route.params == 0])
+
+    def test_crud(self, mock_server, mock_session):
+        """Method to test objects are listed, created, fetched and deleted"""
+        api = mock_session()
+        assert api.identity.tenant == 'mock'
+        assert len(ns(api).list()) == 10 and len(user(api).list()) == 20
+        user(api).create(user.create_payload('new@example.com', 'New', 'User'))
+        assert len(list(user(api).list(stream=True))) == 21
+        assert len(tenant(api).last_login()) == 21
+        user(api).delete(user.delete_payload('new@example.com'))
+        assert 'new@example.com' not in mock_server.objects('user_roles')
+        assert http_loadbalancer(api).get(name='http_loadbalancers-00001', namespace='ns-002')['namespace'] == 'ns-002'
+        with pytest.raises(TopsXCException, match='404'):
+            http_loadbalancer(api).get(name='missing', namespace='ns-002')
+
+    def test_auth(self, mock_server):
+        """Method to test a wrong token is refused"""
+        with pytest.raises(TopsXCException, match='Invalid Token'):
+            session(tenant_url=mock_server.url, api_token='wrong')
+
+    def test_faults(self, mock_server, mock_session):
+        """Method to test injected 429s carry Retry-After and are retried"""
+        mock_server.rate_429 = 1.0
+        mock_server.retry_after = 0
+        api = mock_session(retry=RetryPolicy({429: RetryRule(attempts=2)}, jitter=0))
+        with pytest.raises(TopsXCException, match='429'):
+            user(api).list()
+        assert mock_server.requests['GET /api/web/custom/namespaces/{namespace}/user_roles'] == 3
+
+    def test_etag(self, mock_server, mock_session):
+        """Method to test unchanged lists are answered 304 to a Session with validators"""
+        api = mock_session(validators=ValidatorStore())
+        first = ns(api).list()
+        assert ns(api).list() == first
+        assert mock_server.statuses[304] == 1
+
+    def test_login_paging(self, mock_server, mock_session):
+        """Method to test login events honour first/max and the time frame"""
+        api = mock_session()
+        assert len(tenant(api).login_events(first=0, max=5)) == 5
+        assert len(tenant(api).login_events(first=18, max=5)) == 2
+        payload = tenant.login_events_in_tf_payload(datetime(2025, 12, 1), datetime(2026, 2, 1), 10, 4)
+        assert list(tenant(api).login_events_in_tf(payload)) == [f"user{i:05d}@example.com" for i in range(10, 14)]
+        assert len(tenant(api).login_events_in_tf(tenant.login_events_in_tf_payload(datetime(2026, 2, 1), datetime(2026, 3, 1)))) == 0 # pylint: disable=line-too-long
@@ -0,0 +1,75 @@
+"""Payload and response record tests, run offline"""
+import pytest
+from f5xc_tops_py_client import models
+from f5xc_tops_py_client import user, group, apicred, site, registration, ResponseCache
+from f5xc_tops_py_client.codec import available_codecs, get_codec
+from f5xc_tops_py_client.models import (
+    UserCreate, UserUpdate, UserDelete, UserGroups, GroupCreate, NamespaceRoles, APIcredCreate,
+    SiteUpgrade, SiteState, RegistrationApprove, SiteRecord, RegistrationRecord, UserRecord,
+    decode_items, record
+)
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+PAYLOADS = [
+    (UserCreate('jane@example.com', 'Jane', 'Doe', ['admins']), user.create_payload('jane@example.com', 'Jane', 'Doe', ['admins'])), # pylint: disable=line-too-long
+    (UserUpdate('jane@example.com', 'Jane', 'Doe', [], ['admins']), user.update_payload('jane@example.com', 'Jane', 'Doe', [], ['admins'])), # pylint: disable=line-too-long
+    (UserDelete('jane@example.com'), user.delete_payload('jane@example.com')),
+    (UserGroups('jane@example.com', ['admins']), user.group_payload('jane@example.com', ['admins'])),
+    (GroupCreate('admins', 'd', 'Admins', [], []), group.create_payload('admins', 'd', 'Admins', [], [])),
+    (NamespaceRoles('admins', []), group.role_payload('admins', [])),
+    (APIcredCreate('ci', 30), apicred.create_payload('ci', 30)),
+    (SiteUpgrade('ce1', 'crt-1'), site.upgrade_payload('ce1', 'crt-1')),
+    (SiteState('ce1'), site.state_payload('ce1')),
+    (RegistrationApprove('r1', {'cluster_name': 'ce1'}), registration.approve_payload('r1', {'cluster_name': 'ce1'})), # pylint: disable=line-too-long
+]
+
+class TestModels:
+    """Class used to test payload and response record types"""
+
+    @pytest.mark.parametrize('name', list(available_codecs()))
+    def test_payloads(self, name):
+        """Method to test payloads encode like the dicts of the matching builders"""
+        codec = get_codec(name)
+        for payload, expected in PAYLOADS:
+            assert codec.loads(codec.dumps(payload)) == expected
+
+    @pytest.mark.parametrize('name', list(available_codecs()))
+    def test_decode(self, name):
+        """Method to test list bodies decode into records, nulls falling back to defaults"""
+        codec = get_codec(name)
+        body = codec.dumps({'items': [
+            {'name': 'ce1', 'get_spec': {'site_state': 'ONLINE', 'main_nodes': [{}]}, 'status_set': []},
+            {'name': 'ce2', 'labels': None, 'get_spec': None},
+        ]})
+        sites = decode_items(body, SiteRecord, codec)
+        assert [s.name for s in sites] == ['ce1', 'ce2']
+        assert sites[0].state == 'ONLINE' and sites[1].state is None and sites[1].labels == {}
+
+    def test_record(self):
+        """Method to test records are built from nested dicts"""
+        item = record(RegistrationRecord, {'name': 'r1', 'get_spec': {'state': 'NEW', 'passport': {'cluster_name': 'ce1'}}}) # pylint: disable=line-too-long
+        assert item.state == 'NEW' and item.cluster_name == 'ce1'
+        assert not hasattr(item, '__dict__')
+
+    def test_registration(self):
+        """Method to test registrations with status as XC returns it, a list, decode without the fallback"""
+        codec = get_codec()
+        body = codec.dumps({'items': [{'name': 'r1', 'get_spec': {'state': 'NEW', 'passport': {'cluster_name': 'ce1'}}, 'status': [{'current_state': 'x'}]}]}) # pylint: disable=line-too-long
+        items = decode_items(body, RegistrationRecord, codec)
+        assert items[0].state == 'NEW' and items[0].cluster_name == 'ce1'
+        if msgspec is not None:
+            assert models._decoders[RegistrationRecord].decode(body).items == items # pylint: disable=protected-access
+
+    def test_list(self, mock_server, mock_session):
+        """Method to test list(model=...) returns records, from the network and the cache"""
+        api = mock_session(cache=ResponseCache())
+        user(api).create(UserCreate('jane@example.com', 'Jane', 'Doe'))
+        users = user(api).list(model=UserRecord)
+        assert isinstance(users[0], UserRecord) and users[-1].email == 'jane@example.com'
+        assert user(api).list(model=UserRecord) == users
+        assert isinstance(user(api).list()[0], dict)
+        assert all(isinstance(item, UserRecord) for item in user(api).list(stream=True, model=UserRecord))
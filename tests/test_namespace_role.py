@@ -1,6 +1,6 @@
 """Namespace_role Class Test"""
 import pytest
-from orijenpy import nsrole
+from f5xc_tops_py_client import nsrole
 
 @pytest.mark.usefixtures("test_session")
 class TestNSrole:
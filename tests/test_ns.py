@@ -1,6 +1,6 @@
 """NS class tests"""
 import pytest
-from orijenpy import ns
+from f5xc_tops_py_client import ns
 
 @pytest.mark.usefixtures("test_session")
 class TestNS:
@@ -0,0 +1,29 @@
+"""SessionPool tests"""
+import pytest
+from f5xc_tops_py_client.pool import SessionPool
+from f5xc_tops_py_client.helper import TopsXCException
+
+class TestSessionPool:
+    """Class used to test SessionPool"""
+
+    def test_sessions(self):
+        """Method to test sessions are created once per tenant and share the budget"""
+        pool = SessionPool({'https://a.example.com/': 'ta', 'https://b.example.com': 'tb'}, max_concurrency=4)
+        assert list(pool) == ['https://a.example.com', 'https://b.example.com']
+        a = pool.session('https://a.example.com', validate=False)
+        assert pool.session('https://a.example.com/', validate=False) is a
+        assert a.budget is pool.session('https://b.example.com', validate=False).budget
+        assert a.limiter is not pool.session('https://b.example.com', validate=False).limiter
+        with pytest.raises(TopsXCException):
+            pool.session('https://c.example.com')
+
+    def test_map(self):
+        """Method to test map collects results and errors per tenant"""
+        pool = SessionPool({'https://a.example.com': 'ta', 'https://b.example.com': 'tb'})
+        def fn(session):
+            if 'b.' in session._tenant_url:  # pylint: disable=protected-access
+                raise ValueError('boom')
+            return session._api_token  # pylint: disable=protected-access
+        report = pool.map(fn, validate=False)
+        assert [(r.item, r.result) for r in report.succeeded] == [('https://a.example.com', 'ta')]
+        assert isinstance(report.failed[0].error, ValueError)
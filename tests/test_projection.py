@@ -0,0 +1,69 @@
+"""fields= projection tests, run offline"""
+from f5xc_tops_py_client import session, site, user, group, tenant, ResponseCache
+from f5xc_tops_py_client.codec import get_codec
+from f5xc_tops_py_client.helper import xc_fields, xc_project, xc_report_fields, _project_items
+from f5xc_tops_py_client.lazy import LazyObject, LazySite
+from f5xc_tops_py_client.mock_server import MockServer
+from f5xc_tops_py_client.models import SiteRecord
+from f5xc_tops_py_client.ratelimit import TokenBucket
+
+SITES = [
+    {'name': f"ce{i}", 'labels': {'region': 'eu'}, 'description': 'x' * 100,
+     'get_spec': {'site_state': 'ONLINE', 'volterra_software_version': 'crt-1', 'main_nodes': [{'name': 'node-0'}]},
+     'status_set': [{'state': 'UP'}]}
+    for i in range(3)
+]
+
+class TestProjection:
+    """Class used to test list(fields=...)"""
+
+    def test_project(self):
+        """Method to test dotted paths are kept from dicts and lazy items alike"""
+        paths = xc_fields(['name', 'get_spec.site_state', 'get_spec.main_nodes', 'nope.deeper'])
+        expected = {'name': 'ce0', 'get_spec': {'site_state': 'ONLINE', 'main_nodes': [{'name': 'node-0'}]}}
+        assert xc_project(SITES[0], paths) == expected
+        assert xc_project(LazyObject.from_dict(SITES[0]), paths) == expected
+        assert xc_project({'name': 'ce0', 'get_spec': None}, xc_fields('get_spec.site_state')) == {'get_spec': None}
+        assert xc_fields(None) is None and xc_fields('name') == (('name',),)
+
+    def test_decode(self):
+        """Method to test list bodies are projected the same with and without msgspec"""
+        codec = get_codec()
+        items = SITES + [{'name': 'ce9', 'get_spec': None}, {'name': 'ce8', 'get_spec': []}]
+        paths = xc_fields(['name', 'get_spec', 'get_spec.site_state', 'nope.deeper'])
+        expected = [xc_project(item, paths) for item in items]
+        assert _project_items(codec.dumps({'items': items}), paths, codec) == expected
+        assert _project_items(codec.dumps({'users': items[:3]}), paths, codec) == expected[:3]
+        assert _project_items(codec.dumps(items[:3]), xc_fields('name'), codec) == [{'name': f"ce{i}"} for i in range(3)]
+
+    def test_report_fields(self):
+        """Method to test which list endpoints take report_fields"""
+        assert xc_report_fields('GET /api/config/namespaces/{namespace}/sites')
+        assert not xc_report_fields('GET /api/web/custom/namespaces/{namespace}/user_groups')
+        assert not xc_report_fields('GET /api/web/namespaces/system/tenant/idm/users/inactive')
+        assert not xc_report_fields('POST /api/register/namespaces/{namespace}/listregistrationsbystate')
+
+    def test_list(self):
+        """Method to test report_fields is sent when needed and items are pruned"""
+        with MockServer(items=5, seed=0, report_fields=True) as server:
+            server.put('sites', SITES)
+            api = session(tenant_url=server.url, api_token=server.token, limiter=TokenBucket(rate=1000, min_rate=1000))
+            assert 'get_spec' not in site(api).list()[0]
+            states = site(api).list(fields=['name', 'get_spec.site_state'])
+            assert states == [{'name': f"ce{i}", 'get_spec': {'site_state': 'ONLINE'}} for i in range(3)]
+            assert site(api).list(fields=['status_set'])[0] == {'status_set': [{'state': 'UP'}]}
+            assert list(site(api).list(stream=True, fields='name')) == [{'name': f"ce{i}"} for i in range(3)]
+            records = site(api).list(fields=['name', 'get_spec.site_state'], model=SiteRecord)
+            assert records[0].state == 'ONLINE' and records[0].labels == {}
+            lazy = site(api).list(fields=['get_spec.site_state'], model=LazySite)
+            assert lazy[0].state == 'ONLINE' and 'name' not in lazy[0]
+            assert [set(item) for item in user(api).list(fields=['email'])] == [{'email'}] * 5
+            assert all(set(item) == {'name'} for item in group(api).list(fields=['name', 'nope']))
+            assert tenant(api).list_inactive_users(fields=['email']) == []
+
+    def test_cache(self, mock_server, mock_session):
+        """Method to test cached list responses are projected per call"""
+        api = mock_session(cache=ResponseCache())
+        full = user(api).list()
+        assert user(api).list(fields='email') == [{'email': item['email']} for item in full]
+        assert user(api).list() == full
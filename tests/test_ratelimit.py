@@ -0,0 +1,34 @@
+"""TokenBucket tests"""
+from f5xc_tops_py_client.ratelimit import TokenBucket
+
+class TestTokenBucket:
+    """Class used to test TokenBucket"""
+
+    def test_burst(self, fake_clock):
+        """Method to test burst is served without waiting"""
+        bucket = TokenBucket(rate=1.0, burst=5, clock=fake_clock)
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+        assert bucket.reserve() == 1.0
+        assert bucket.reserve() == 2.0
+
+    def test_refill(self, fake_clock):
+        """Method to test tokens refill at rate"""
+        bucket = TokenBucket(rate=2.0, burst=2, clock=fake_clock)
+        bucket.reserve()
+        bucket.reserve()
+        fake_clock.now = 0.5
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.5
+
+    def test_throttled(self, fake_clock):
+        """Method to test 429s slow the bucket down and it recovers"""
+        bucket = TokenBucket(rate=4.0, burst=10, recovery=10.0, clock=fake_clock)
+        bucket.throttled()
+        bucket.throttled()
+        assert bucket.current_rate == 2.0
+        assert bucket.reserve() == 0.5
+        fake_clock.now = 1.0
+        bucket.throttled()
+        assert round(bucket.current_rate, 6) == 1.2
+        fake_clock.now = 10.0
+        assert bucket.current_rate == 4.0
@@ -0,0 +1,39 @@
+"""Reconciler tests"""
+from f5xc_tops_py_client.reconcile import plan
+
+ADMIN = {'namespace': 'app', 'role': 'ves-io-admin'}
+MONITOR = {'namespace': 'app', 'role': 'ves-io-monitor-role'}
+
+class TestPlan:
+    """Class used to test plan()"""
+
+    def test_no_changes(self):
+        """Method to test a tenant in the desired state needs no writes"""
+        groups = [{'name': 'devops', 'namespace_roles': [dict(ADMIN, extra=1)], 'usernames': ['a@x']}]
+        users = [{'email': 'a@x', 'group_names': ['devops', 'other']}, {'email': 'b@x', 'group_names': []}]
+        desired = {'devops': {'namespace_roles': [ADMIN], 'usernames': ['a@x']}}
+        assert plan(desired, groups, users) == []
+
+    def test_changes(self):
+        """Method to test role and membership differences become minimal writes"""
+        groups = [{'name': 'devops', 'namespace_roles': [ADMIN], 'usernames': ['a@x']}]
+        users = [{'email': 'a@x', 'group_names': ['devops', 'other']}, {'email': 'b@x', 'group_names': []}]
+        desired = {
+            'devops': {'namespace_roles': [MONITOR], 'usernames': ['b@x']},
+            'new': {'namespace_roles': [ADMIN], 'usernames': ['b@x']},
+        }
+        changes = {(c.action, c.name): c.payload for c in plan(desired, groups, users)}
+        assert changes[('role_assign', 'devops')]['namespace_roles'] == [MONITOR]
+        assert changes[('role_remove', 'devops')]['namespace_roles'] == [ADMIN]
+        assert changes[('create', 'new')]['namespace_roles'] == [ADMIN]
+        assert changes[('group', 'a@x')]['group_names'] == ['other']
+        assert changes[('group', 'b@x')]['group_names'] == ['devops', 'new']
+        assert len(changes) == 5
+
+    def test_partial(self):
+        """Method to test roles or members missing from desired are left alone"""
+        groups = [{'name': 'devops', 'namespace_roles': [ADMIN], 'usernames': ['a@x', 'b@x']}]
+        users = [{'email': 'a@x', 'group_names': ['devops']}, {'email': 'b@x', 'group_names': ['devops']}]
+        assert plan({'devops': {'namespace_roles': [ADMIN]}}, groups, users) == []
+        changes = plan({'devops': {'usernames': ['a@x']}}, groups, users)
+        assert [(c.action, c.name, c.payload['group_names']) for c in changes] == [('group', 'b@x', [])]
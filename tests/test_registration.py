@@ -0,0 +1,31 @@
+"""Registration Class Tests"""
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.registration import Registration
+
+def _registration(name: str, cluster: str, state: str = 'NEW') -> dict:
+    """Registration object as XC returns it, status is a list"""
+    return {'name': name, 'get_spec': {'state': state, 'passport': {'cluster_name': cluster}}, 'status': []}
+
+class TestApproveAll:
+    """Class used to test approve_all() helpers"""
+
+    def test_state(self):
+        """Method to test the registration state is read from spec, whatever the status shape"""
+        assert Registration._get_state({'get_spec': {'state': 'NEW'}}) == 'NEW'  # pylint: disable=protected-access
+        assert Registration._get_state({'get_spec': {'state': 'NEW'}, 'status': []}) == 'NEW'  # pylint: disable=protected-access
+        assert Registration._get_state({'status': {'current_state': 'APPROVED'}, 'get_spec': {}}) == 'APPROVED'  # pylint: disable=protected-access
+        assert Registration._get_state({'status': [], 'get_spec': None}) is None  # pylint: disable=protected-access
+
+    def test_approve_all(self, mock_server, mock_session):
+        """Method to test approve_all() against the mock server"""
+        mock_server.put('registrations', [
+            _registration('r1', 'ce1'), _registration('r2', 'ce2'), _registration('r3', 'ce1', 'APPROVED'),
+            {'name': 'r4', 'get_spec': {'state': 'NEW'}, 'status': []},
+        ])
+        api = mock_session()
+        results = {result.item['name']: result for result in Registration(api).approve_all('ce1')}
+        assert {name: result.result for name, result in results.items()} == {'r1': 'approved', 'r3': 'skipped', 'r4': None} # pylint: disable=line-too-long
+        assert isinstance(results['r4'].error, TopsXCException)
+        assert results['r1'].error is None and results['r3'].error is None
+        assert mock_server.requests['GET /api/register/namespaces/{namespace}/registrations/{name}'] == 3
+        assert mock_server.requests['POST /api/register/namespaces/{namespace}/registration/{name}/approve'] == 1
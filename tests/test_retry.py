@@ -0,0 +1,82 @@
+"""RetryPolicy and CircuitBreaker tests"""
+import pytest
+from f5xc_tops_py_client import ns
+from f5xc_tops_py_client.helper import TopsXCException
+from f5xc_tops_py_client.ratelimit import TokenBucket
+from f5xc_tops_py_client.retry import RetryPolicy, RetryRule, RetryBudget, CircuitBreaker, retry_after
+
+class TestRetryPolicy:
+    """Class used to test RetryPolicy"""
+
+    def test_retry_after(self):
+        """Method to test Retry-After replaces backoff"""
+        policy = RetryPolicy(jitter=0)
+        assert policy.delay(429, 0, {'Retry-After': '3'}, 0.0) == 3.0
+        assert retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}) == 0.0
+        assert retry_after({}) is None
+
+    def test_rules(self):
+        """Method to test per-status rules and the delay cap"""
+        policy = RetryPolicy(rules={503: RetryRule(attempts=2, backoff=1.0, cap=1.0)}, max_delay=5)
+        assert policy.delay(429, 0, {}, 0.0) is None
+        assert 0 <= policy.delay(503, 1, {}, 0.0) <= 1.0
+        assert policy.delay(503, 2, {}, 0.0) is None
+        assert policy.delay(503, 0, {'Retry-After': '10'}, 0.0) is None
+
+    def test_budget(self):
+        """Method to test the retry budget is shared and refilled by requests"""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.5, minimum=1))
+        assert policy.delay(429, 0, {}, 0.0) is not None
+        assert policy.delay(429, 0, {}, 0.0) is None
+        policy.budget.deposit()
+        policy.budget.deposit()
+        assert policy.delay(429, 0, {}, 0.0) is not None
+
+    def test_no_budget(self):
+        """Method to test retries are not capped by default"""
+        policy = RetryPolicy(jitter=0)
+        assert policy.budget is None
+        assert all(policy.delay(429, 0, {'Retry-After': '0'}, 0.0) == 0.0 for _ in range(100))
+
+    def test_limiter_wait(self, mock_server, mock_session):
+        """Method to test time queued on the rate limiter does not use up max_delay"""
+        mock_server.retry_after = 0
+        api = mock_session(
+            limiter=TokenBucket(rate=4, burst=1, min_rate=4),
+            retry=RetryPolicy(rules={429: RetryRule(attempts=1)}, max_delay=0.2, jitter=0)
+        )
+        ns(api).list()
+        mock_server.rate_429 = 1.0
+        with pytest.raises(TopsXCException):
+            ns(api).list()
+        assert mock_server.statuses[429] == 2
+
+    def test_breaker_final_outcome(self, mock_server, mock_session):
+        """Method to test the breaker counts calls, not retried attempts, and is off by default"""
+        assert mock_session().breaker is None
+        mock_server.retry_after = 0
+        api = mock_session(breaker=CircuitBreaker(threshold=3), retry=RetryPolicy(rules={429: RetryRule(attempts=2)}, jitter=0))
+        mock_server.rate_429 = 1.0
+        for _ in range(3):
+            with pytest.raises(TopsXCException, match='429'):
+                ns(api).list()
+        assert mock_server.statuses[429] == 9
+        with pytest.raises(TopsXCException, match='Circuit open'):
+            ns(api).list()
+        assert mock_server.statuses[429] == 9
+
+class TestCircuitBreaker:
+    """Class used to test CircuitBreaker"""
+
+    def test_open_and_reset(self, fake_clock):
+        """Method to test the breaker opens per call site and half-opens"""
+        breaker = CircuitBreaker(threshold=2, reset_timeout=10, clock=fake_clock)
+        breaker.record('GET /a', True)
+        breaker.record('GET /a', True)
+        assert not breaker.allow('GET /a')
+        assert breaker.allow('GET /b')
+        fake_clock.now = 10
+        assert breaker.allow('GET /a')
+        assert not breaker.allow('GET /a')
+        breaker.record('GET /a', False)
+        assert breaker.allow('GET /a')
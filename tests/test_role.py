@@ -1,6 +1,6 @@
 """Role Class Tests"""
 import pytest
-from orijenpy import role
+from f5xc_tops_py_client import role
 
 @pytest.mark.usefixtures("test_session")
 class TestRole:
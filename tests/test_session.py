@@ -0,0 +1,93 @@
+"""Session pooling, keep-alive and timeout tests, run offline against the mock server"""
+import asyncio
+import socket
+import time
+import pytest
+from f5xc_tops_py_client import ns
+from f5xc_tops_py_client.ratelimit import TokenBucket
+from f5xc_tops_py_client.session import Session, AsyncSession
+
+def _pool(api, url):
+    """Function returning the urllib3 pool the adapter mounted for url opened"""
+    pools = api._session.get_adapter(url).poolmanager.pools # pylint: disable=protected-access
+    with pools.lock:
+        return next(iter(pools._container.values())) # pylint: disable=protected-access
+
+def _sock(api, url):
+    """Function returning an idle pooled socket"""
+    return next(conn.sock for conn in _pool(api, url).pool.queue if conn is not None)
+
+
+class TestSession:
+    """Class used to test Session transport options"""
+
+    def test_timeout(self, mock_server):
+        """Method to test a slow response raises once the read timeout passes"""
+        api = Session(mock_server.url, mock_server.token, validate=False, timeout=(5, 0.2), limiter=TokenBucket(rate=1000, min_rate=1000)) # pylint: disable=line-too-long
+        mock_server.latency = 1
+        started = time.monotonic()
+        with pytest.raises(Exception, match='[Tt]imed? ?out'):
+            ns(api).list()
+        assert time.monotonic() - started < 0.9
+
+    def test_pool(self, mock_server):
+        """Method to test pool_maxsize and pool_block reach the mounted adapter"""
+        api = Session(mock_server.url, mock_server.token, validate=False, pool_maxsize=3, pool_block=True)
+        ns(api).list()
+        pool = _pool(api, mock_server.url)
+        assert pool.pool.maxsize == 3 and pool.block is True
+        api = Session(mock_server.url, mock_server.token, validate=False)
+        ns(api).list()
+        assert _pool(api, mock_server.url).pool.maxsize == 10 and _pool(api, mock_server.url).block is False
+
+    def test_keepalive(self, mock_server):
+        """Method to test keep-alive socket options are set on opened connections"""
+        api = Session(mock_server.url, mock_server.token, validate=False, keepalive=30)
+        assert len(ns(api).list()) == 10
+        sock = _sock(api, mock_server.url)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30
+        api = Session(mock_server.url, mock_server.token, validate=False, keepalive=None)
+        ns(api).list()
+        assert not _sock(api, mock_server.url).getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+
+    def test_prewarm(self, mock_server):
+        """Method to test prewarm returns the number of connections it opened"""
+        url = mock_server.url
+        api = Session(url, mock_server.token, validate=False, pool_maxsize=4)
+        mock_server.latency = 0.1
+        assert api.prewarm(4) == 4
+        assert _pool(api, url).num_connections == 4
+        mock_server.stop()
+        assert Session(url, mock_server.token, validate=False).prewarm(2) == 0
+
+
+class TestAsyncSessionTransport:
+    """Class used to test AsyncSession transport options"""
+
+    def test_timeout(self, mock_server):
+        """Method to test a slow response raises once the read timeout passes"""
+        pytest.importorskip('aiohttp')
+        async def calls():
+            async with AsyncSession(mock_server.url, mock_server.token, validate=False, timeout=(5, 0.2), limiter=TokenBucket(rate=1000, min_rate=1000)) as api: # pylint: disable=line-too-long
+                await ns(api).list()
+        mock_server.latency = 1
+        started = time.monotonic()
+        with pytest.raises(Exception):
+            asyncio.run(calls())
+        assert time.monotonic() - started < 0.9
+
+    def test_pool_prewarm(self, mock_server):
+        """Method to test pool_maxsize and keepalive reach the connector and prewarm counts connections"""
+        pytest.importorskip('aiohttp')
+        async def calls():
+            async with AsyncSession(mock_server.url, mock_server.token, validate=False, pool_maxsize=3, keepalive=30) as api: # pylint: disable=line-too-long
+                opened = await api.prewarm(3)
+                connector = (await api._session.session()).connector # pylint: disable=protected-access
+                return opened, connector
+        mock_server.latency = 0.1
+        opened, connector = asyncio.run(calls())
+        assert opened == 3 and connector.limit_per_host == 3
+        assert connector._keepalive_timeout == 30 # pylint: disable=protected-access
+        assert mock_server.statuses[200] == 3
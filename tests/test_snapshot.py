@@ -0,0 +1,63 @@
+"""TenantSnapshot tests"""
+from f5xc_tops_py_client.snapshot import TenantSnapshot
+
+ADMIN = {'namespace': 'app', 'role': 'ves-io-admin'}
+MONITOR = {'namespace': 'shared', 'role': 'ves-io-monitor-role'}
+
+class TestTenantSnapshot:
+    """Class used to test TenantSnapshot indexes"""
+
+    def snapshot(self):
+        """Method to build a snapshot of fixed items"""
+        users = [
+            {'email': 'a@x', 'group_names': ['devops'], 'namespace_roles': [MONITOR]},
+            {'email': 'b@x', 'group_names': [], 'namespace_roles': []},
+        ]
+        groups = [{'name': 'devops', 'namespace_roles': [ADMIN], 'usernames': ['a@x']}]
+        roles = [{'name': 'ves-io-admin'}]
+        return TenantSnapshot.from_items(users, groups, roles)
+
+    def test_lookups(self):
+        """Method to test lookups by key"""
+        snap = self.snapshot()
+        assert snap.user('b@x')['email'] == 'b@x'
+        assert snap.group('devops')['usernames'] == ['a@x']
+        assert snap.role('ves-io-admin') == {'name': 'ves-io-admin'}
+        assert snap.user('c@x') is None
+
+    def test_reverse(self):
+        """Method to test role to principal indexes include group grants"""
+        snap = self.snapshot()
+        assert snap.users_with_role('ves-io-admin', 'app') == {'a@x'}
+        assert snap.users_with_role('ves-io-admin') == {'a@x'}
+        assert snap.users_with_role('ves-io-admin', 'shared') == set()
+        assert snap.groups_with_role('ves-io-admin') == {'devops'}
+        assert snap.roles_of('a@x') == {('app', 'ves-io-admin'), ('shared', 'ves-io-monitor-role')}
+        assert snap.members('devops') == {'a@x'}
+        assert snap.namespace_roles('shared') == {'ves-io-monitor-role'}
+
+    def test_load(self):
+        """Method to test reloading one collection keeps the others"""
+        snap = self.snapshot()
+        snap._load({'groups': []})  # pylint: disable=protected-access
+        assert snap.users_with_role('ves-io-admin') == set()
+        assert snap.role('ves-io-admin') is not None
+
+    def test_frozen(self):
+        """Method to test lookups can't change the indexes"""
+        snap = self.snapshot()
+        for found in [snap.users_with_role('ves-io-admin'), snap.members('devops'), snap.members('nobody')]:
+            assert isinstance(found, frozenset)
+        assert snap.users_with_role('ves-io-admin') | {'c@x'} == {'a@x', 'c@x'}
+        assert snap.users_with_role('ves-io-admin') == {'a@x'}
+
+    def test_partial_index(self):
+        """Method to test only the indexes depending on reloaded collections are rebuilt"""
+        snap = self.snapshot()
+        group_bindings, members = snap._group_bindings, snap._members  # pylint: disable=protected-access
+        snap._load({'roles': []})  # pylint: disable=protected-access
+        assert snap._group_bindings is group_bindings and snap._members is members  # pylint: disable=protected-access
+        snap._load({'users': [{'email': 'c@x', 'group_names': ['devops']}]})  # pylint: disable=protected-access
+        assert snap._group_bindings is group_bindings  # pylint: disable=protected-access
+        assert snap.users_with_role('ves-io-admin', 'app') == {'a@x', 'c@x'}
+        assert snap.namespace_roles('app') == {'ves-io-admin'} and snap.roles_of('b@x') == frozenset()
@@ -1,6 +1,7 @@
 """Tenant class tests"""
+from datetime import datetime, timezone
 import pytest
-from orijenpy import tenant
+from f5xc_tops_py_client import tenant
 
 @pytest.mark.usefixtures("test_session")
 class TestTenant:
@@ -18,4 +19,27 @@ class TestTenant:
     def test_get_settings(self, test_session):
         """Method to test get_settings()"""
         r = tenant(test_session).get_settings()
-        assert isinstance(r, dict)
\ No newline at end of file
+        assert isinstance(r, dict)
+
+
+class TestLoginEvents:
+    """Class used to test iter_login_events() against the mock server"""
+
+    def test_pages(self, mock_server, mock_session):
+        """Method to test pages end on a short one and carry since/until"""
+        api = mock_session()
+        client = tenant(api)
+        payloads = []
+        send = client.login_events_in_tf
+        client.login_events_in_tf = lambda payload: payloads.append(payload) or send(payload)
+        since, until = datetime(2025, 12, 1, tzinfo=timezone.utc), datetime(2026, 2, 1, tzinfo=timezone.utc)
+        events = list(client.iter_login_events(since, until, page_size=6))
+        assert [email for email, _ in events] == [f"user{i:05d}@example.com" for i in range(20)]
+        assert [(p['first'], p['max']) for p in payloads] == [(0, 6), (6, 6), (12, 6), (18, 6)]
+        assert all(p['start'] == '2025-12-01T00:00:00Z' and p['end'] == '2026-02-01T00:00:00Z' for p in payloads)
+        payloads.clear()
+        assert len(list(client.iter_login_events(since, until, page_size=5))) == 20
+        assert [p['first'] for p in payloads] == [0, 5, 10, 15, 20]
+        payloads.clear()
+        assert not list(client.iter_login_events(until))
+        assert len(payloads) == 1
@@ -0,0 +1,72 @@
+"""FleetUpgrade tests"""
+from f5xc_tops_py_client import session
+from f5xc_tops_py_client.upgrade import FleetUpgrade, upgrade_failed
+
+def _site(name: str, version: str, failed: bool = False) -> dict:
+    """Site.list() item at a software version"""
+    return {'name': name, 'failed': failed, 'get_spec': {'volterra_software_version': version}}
+
+def fleet(**kwargs):
+    """Function to build a FleetUpgrade on an unvalidated session"""
+    api = session(tenant_url='https://tenant.example.com', api_token='token', validate=False)
+    return FleetUpgrade(api, **kwargs)
+
+class TestFleetUpgrade:
+    """Class used to test FleetUpgrade planning"""
+
+    def test_plan(self):
+        """Method to test canary and cumulative percentage waves"""
+        names = [f'ce-{i}' for i in range(11)]
+        waves = fleet(canary=1, waves=(10, 50, 100)).plan(names)
+        assert [len(wave) for wave in waves] == [1, 1, 4, 5]
+        assert sum(waves, []) == names
+        assert fleet(canary=0, waves=(50,)).plan(names[:4]) == [names[:2], names[2:4]]
+
+    def test_steps(self):
+        """Method to test software is upgraded before the OS"""
+        upgrade = fleet(sw_version='crt-2', os_version='9.2')
+        item = {'get_spec': {'volterra_software_version': 'crt-1', 'operating_system_version': '9.1'}}
+        assert upgrade.steps(item) == [('sw', 'crt-2'), ('os', '9.2')]
+        item['get_spec']['volterra_software_version'] = 'crt-2'
+        assert upgrade.steps(item) == [('os', '9.2')]
+
+    def test_upgrade_failed(self):
+        """Method to test the default failed predicate reads site state and upgrade statuses"""
+        assert not upgrade_failed(_site('ce-0', 'crt-1'))
+        assert upgrade_failed({'name': 'ce-0', 'get_spec': {'site_state': 'FAILED'}})
+        assert not upgrade_failed({'name': 'ce-0', 'get_spec': {'site_state': 'UPGRADING'}, 'status_set': None})
+        status = {'volterra_software_status': {'deploy_status': 'DEPLOY_FAILED'}}
+        assert upgrade_failed({'name': 'ce-0', 'status_set': [{}, status]})
+        assert not upgrade_failed({'name': 'ce-0', 'status_set': [{'operating_system_status': {'deploy_state': 'DEPLOYING'}}]}) # pylint: disable=line-too-long
+
+    def test_default_failed(self, mock_server, mock_session):
+        """Method to test a site reporting a failed upgrade halts the run without a custom predicate"""
+        mock_server.put('sites', [_site('ce-0', 'crt-1')])
+        failed = dict(_site('ce-0', 'crt-1'), status_set=[{'volterra_software_status': {'deploy_status': 'DEPLOY_FAILED'}}]) # pylint: disable=line-too-long
+        api = mock_session()
+        upgrade = FleetUpgrade(api, sw_version='crt-2', max_failures=0, sleep=lambda _: mock_server.put('sites', [failed]))
+        events = [(event.site, event.status) for event in upgrade.run()]
+        assert events[-2:] == [('ce-0', 'failed'), (None, 'halted')]
+
+    def test_halt_on_first_failure(self, mock_server, mock_session):
+        """Method to test max_failures=0 halts on the first failed site, not at once"""
+        mock_server.put('sites', [_site(f'ce-{i}', 'crt-1') for i in range(3)])
+        polls = iter([
+            [_site('ce-0', 'crt-2'), _site('ce-1', 'crt-1'), _site('ce-2', 'crt-1')],
+            [_site('ce-0', 'crt-2'), _site('ce-1', 'crt-2'), _site('ce-2', 'crt-1', failed=True)],
+        ])
+        def upgraded(_):
+            mock_server.put('sites', next(polls))
+        api = mock_session()
+        upgrade = FleetUpgrade(api, sw_version='crt-2', waves=(100,), max_failures=0, failed=lambda item: item['failed'], sleep=upgraded) # pylint: disable=line-too-long
+        events = [(event.site, event.status) for event in upgrade.run()]
+        assert ('ce-0', 'done') in events and ('ce-2', 'failed') in events
+        assert events[-1] == (None, 'halted') and events.count((None, 'halted')) == 1
+
+    def test_upgraded_meanwhile(self, mock_server, mock_session):
+        """Method to test a queued site reaching the target before its wave is skipped"""
+        mock_server.put('sites', [_site(f'ce-{i}', 'crt-1') for i in range(2)])
+        api = mock_session()
+        upgrade = FleetUpgrade(api, sw_version='crt-2', waves=(100,), sleep=lambda _: mock_server.put('sites', [_site(f'ce-{i}', 'crt-2') for i in range(2)])) # pylint: disable=line-too-long
+        events = [(event.site, event.status) for event in upgrade.run()]
+        assert ('ce-0', 'done') in events and ('ce-1', 'skipped') in events
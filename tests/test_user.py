@@ -1,6 +1,6 @@
 """User Class Tests"""
 import pytest
-from orijenpy import user
+from f5xc_tops_py_client import user
 
 @pytest.mark.usefixtures("test_session")
 class TestUser:
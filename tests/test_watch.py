@@ -0,0 +1,63 @@
+"""watch() tests"""
+from f5xc_tops_py_client.lazy import LazyObject, LazySite
+from f5xc_tops_py_client.models import SiteRecord, SiteSpec
+from f5xc_tops_py_client.watch import watch, digest, _Poller
+
+class TestWatch:
+    """Class used to test watch()"""
+
+    def test_digest(self):
+        """Method to test hashes ignore key order"""
+        assert digest({'a': 1, 'b': [1, 2]}) == digest({'b': [1, 2], 'a': 1})
+        assert digest({'a': 1}) != digest({'a': 2})
+
+    def test_digest_models(self):
+        """Method to test lazy and record items are hashed by content, not repr"""
+        site = {'name': 'ce1', 'get_spec': {'site_state': 'ONLINE'}}
+        changed = {'name': 'ce1', 'get_spec': {'site_state': 'UPGRADING'}}
+        assert digest(LazySite(b'{"name":"ce1","get_spec":{"site_state":"ONLINE"}}')) == digest(site)
+        assert digest(LazySite.from_dict(site)) != digest(LazySite.from_dict(changed))
+        assert digest(LazyObject(b'{"name":"ce1","v":1}')) != digest(LazyObject(b'{"name":"ce1","v":2}'))
+        assert digest(SiteRecord('ce1', SiteSpec(site_state='ONLINE'))) != digest(SiteRecord('ce1', SiteSpec(site_state='UPGRADING')))
+
+    def test_events(self):
+        """Method to test diffs between polls and a shared poller"""
+        polls = [
+            [{'name': 'a', 'v': 1}, {'name': 'b', 'v': 1}],
+            [{'name': 'a', 'v': 2}, {'name': 'c', 'v': 1}],
+            [{'name': 'a', 'v': 3}, {'name': 'c', 'v': 1}],
+        ]
+        calls = []
+        def call(page=0):  # pylint: disable=unused-argument
+            calls.append(1)
+            return polls[min(len(calls), len(polls)) - 1]
+        with watch(call, interval=0.05, page=1) as first:
+            assert sorted((e.type, e.key) for e in [first.get(1), first.get(1)]) == [('added', 'a'), ('added', 'b')]
+            with watch(call, interval=0.05, initial=False, page=1) as second:
+                events = sorted((e.type, e.key) for e in [first.get(1), first.get(1), first.get(1)])
+                assert events == [('added', 'c'), ('modified', 'a'), ('removed', 'b')]
+                assert second.get(1) is not None
+        assert first.get(0.2) is None and len(calls) < 10
+
+    def test_error(self):
+        """Method to test any exception of a poll is published and polling goes on"""
+        polls = [[{'name': 'a'}, {'v': 1}], [{'name': 'a'}]]
+        calls = []
+        def call(poll=0):  # pylint: disable=unused-argument
+            calls.append(1)
+            return polls[min(len(calls), len(polls)) - 1]
+        with watch(call, interval=0.05, poll=1) as events:
+            error = events.get(1)
+            assert error.type == 'error' and isinstance(error.item, KeyError)
+            assert (events.get(1).type, events.get(0.2)) == ('added', None)
+
+    def test_stopped_poller(self):
+        """Method to test a poller stopped by its last subscriber is not reused"""
+        def call(race=0):  # pylint: disable=unused-argument
+            return [{'name': 'a'}]
+        first = watch(call, interval=0.05, race=1)
+        poller = _Poller.get(call, 'name', {'race': 1})
+        first.close()
+        assert poller.subscribe(0.05, 0, True) is None
+        with watch(call, interval=0.05, race=1) as second:
+            assert second.get(1).key == 'a'